@@ -0,0 +1,109 @@
+"""Measure the import time of wexample_file and the per-call cost of hot methods.
+
+Import time is taken from ``python -X importtime`` in fresh interpreters: the
+cumulative time of the package modules each statement loads, median of
+``--runs`` runs, plus the slowest modules behind ``LocalFile``.
+
+Per-call overhead is measured with timeit on a temporary file, for the methods
+that used to repeat local imports on every call.
+
+Run with the package installed:
+
+    python benchmarks/import_time.py [--runs 7] [--calls 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+STATEMENTS = {
+    "import wexample_file": "import wexample_file",
+    "from wexample_file import LocalFile": "from wexample_file import LocalFile",
+    "import ...common.local_file": "import wexample_file.common.local_file",
+}
+
+
+def import_times(statement: str) -> list[tuple[int, int, str]]:
+    """Return (self us, cumulative us, module) for each import of ``statement``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        if not self_us.strip().isdigit():
+            continue
+        # Nested imports are indented after the single separating space.
+        times.append((int(self_us), int(cumulative_us), module[1:].rstrip()))
+    return times
+
+
+def statement_time(statement: str) -> int:
+    """Cumulative import time of the statement, in microseconds."""
+    return sum(
+        cumulative
+        for _, cumulative, module in import_times(statement)
+        # Top-level package imports, leaving out the interpreter startup ones.
+        if module.startswith("wexample_file")
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'statement':<40}{'median ms':>10}")
+    for label, statement in STATEMENTS.items():
+        times = [statement_time(statement) for _ in range(args.runs)]
+        print(f"{label:<40}{statistics.median(times) / 1000:>10.2f}")
+
+    print(f"\n{'slowest modules behind LocalFile':<40}{'self ms':>10}")
+    slowest = sorted(import_times(STATEMENTS["from wexample_file import LocalFile"]))
+    for self_us, _, module in slowest[-8:][::-1]:
+        print(f"{module.strip():<40}{self_us / 1000:>10.2f}")
+
+    from wexample_file import LocalDirectory, LocalFile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "file.txt"
+        path.write_text("content")
+        local_file = LocalFile(path)
+        cached_file = LocalFile(path, use_stat_cache=True)
+        directory = LocalDirectory(tmp)
+
+        calls = {
+            "LocalFile(path)": lambda: LocalFile(path),
+            "LocalFile.from_resolved(path)": lambda: LocalFile.from_resolved(path),
+            "LocalFile(path, check_exists=True)": lambda: LocalFile(
+                path, check_exists=True
+            ),
+            "LocalDirectory(path)": lambda: LocalDirectory(tmp),
+            "item_type()": local_file.item_type,
+            "is_file() (stat cache)": cached_file.is_file,
+            "directory.is_dir() (stat)": directory.is_dir,
+            "item == item": lambda: local_file == cached_file,
+            "write()": lambda: local_file.write("content"),
+        }
+
+        print(f"\n{'call':<40}{'us/call':>10}")
+        for label, call in calls.items():
+            number = args.calls if "write" not in label else args.calls // 20
+            seconds = min(timeit.repeat(call, number=number, repeat=3))
+            print(f"{label:<40}{seconds / number * 1e6:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
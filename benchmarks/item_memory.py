@@ -0,0 +1,93 @@
+"""Measure memory per LocalFile instance and set/dict dedup throughput.
+
+Memory is measured with tracemalloc for:
+
+- pathlib.Path: the bare path, as a reference.
+- LocalFile(path): resolved and type-checked construction.
+- LocalFile.from_resolved(path): trusted construction, no syscall.
+- LocalFile.interned(path): shared instances, measured on a collection where
+  each path appears ``--repeat`` times.
+
+Dedup compares the workaround needed before items were hashable (keying a dict
+on ``str(item.path)``) with a plain ``set`` and dict keyed on the items.
+
+Run with the package installed:
+
+    python benchmarks/item_memory.py [--count 100000] [--repeat 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+
+def measure_memory(factory: Callable[[], list]) -> tuple[list, int]:
+    tracemalloc.start()
+    try:
+        items = factory()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return items, size
+
+
+def measure_time(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000, help="Distinct paths")
+    parser.add_argument("--repeat", type=int, default=4, help="Copies of each path")
+    args = parser.parse_args()
+
+    root = Path("/nonexistent/benchmark")
+    names = [f"dir_{i % 100}/file_{i}.txt" for i in range(args.count)]
+    total = args.count * args.repeat
+
+    factories = {
+        "Path": lambda: [root / name for name in names],
+        "LocalFile()": lambda: [LocalFile(path=root / name) for name in names],
+        "from_resolved()": lambda: [
+            LocalFile.from_resolved(root / name) for name in names
+        ],
+        f"interned() x{args.repeat}": lambda: [
+            LocalFile.interned(root / name, trusted=True)
+            for _ in range(args.repeat)
+            for name in names
+        ],
+    }
+
+    print(f"{'memory':<20}{'bytes/path':>14}")
+    for label, factory in factories.items():
+        items, size = measure_memory(factory)
+        print(f"{label:<20}{size / args.count:>14.1f}")
+        del items
+
+    items = [
+        LocalFile.from_resolved(root / name)
+        for _ in range(args.repeat)
+        for name in names
+    ]
+    timings = {
+        "dict by str(path)": lambda: {str(item.path): item for item in items},
+        "set(items)": lambda: set(items),
+        "dict by item": lambda: dict.fromkeys(items),
+    }
+
+    print(f"\n{'dedup of ' + str(total):<20}{'items/s':>14}")
+    for label, func in timings.items():
+        elapsed = measure_time(func)
+        print(f"{label:<20}{total / elapsed:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Compare full and incremental line_count_recursive() runs on a large tree.
+
+A synthetic tree of ``--files`` text files is created once, then counted:
+without cache, cold (empty index), warm (index loaded from disk, nothing
+changed) and warm after ``--changed`` percent of the files were rewritten.
+
+Run with the package installed:
+
+    python benchmarks/line_count_incremental.py [--files 20000] [--lines 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+
+def create_tree(
+    root: Path, files: int, lines: int, per_directory: int = 100
+) -> list[Path]:
+    """Write ``files`` files of ``lines`` lines, ``per_directory`` per directory."""
+    content = b"".join(b"line %d of some source file\n" % i for i in range(lines))
+    paths = []
+    for i in range(files):
+        directory = root / f"dir_{i // per_directory}"
+        if i % per_directory == 0:
+            directory.mkdir()
+        path = directory / f"file_{i}.txt"
+        path.write_bytes(content)
+        paths.append(path)
+    return paths
+
+
+def main() -> None:
+    from wexample_file.common.line_count_cache import LineCountCache
+    from wexample_file.helper.line import line_count_recursive
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=20_000)
+    parser.add_argument("--lines", type=int, default=200)
+    parser.add_argument("--changed", type=float, default=1.0)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "tree"
+        root.mkdir()
+        index = Path(tmp) / "index.json"
+        paths = create_tree(root, args.files, args.lines)
+
+        def run(label: str, cache: LineCountCache | None) -> None:
+            start = time.perf_counter()
+            total = line_count_recursive(root, workers=args.workers, cache=cache)
+            elapsed = time.perf_counter() - start
+            print(f"{label:<24}{total:>12}{elapsed:>10.3f}")
+
+        print(f"{'run':<24}{'lines':>12}{'seconds':>10}")
+        run("no cache", None)
+
+        cache = LineCountCache()
+        run("cold index", cache)
+        cache.save(index)
+
+        start = time.perf_counter()
+        cache = LineCountCache.load(index)
+        print(
+            f"{'  (index load)':<24}{len(cache):>12}{time.perf_counter() - start:>10.3f}"
+        )
+        run("warm index", cache)
+
+        step = max(1, int(100 / args.changed)) if args.changed > 0 else len(paths) + 1
+        for path in paths[::step]:
+            with open(path, "ab") as fh:
+                fh.write(b"one more line\n")
+        run(f"warm, {args.changed:g}% changed", cache)
+
+
+if __name__ == "__main__":
+    main()
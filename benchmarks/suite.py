@@ -0,0 +1,245 @@
+"""Benchmark the hot paths of wexample_file on a synthetic tree.
+
+A tree of ``--files`` files is spread over directories ``--depth`` levels deep
+with ``--fanout`` subdirectories each. Every case then runs ``--repeat`` times on
+fresh state; the best run gives the throughput, and one extra run under
+tracemalloc gives the peak memory allocated while running the case.
+
+Cases:
+
+- path.*: AbstractLocalItemPath construction (checked and trusted), equality
+  and hashing.
+- file.*: LocalFile read, write (plain and atomic), touch and remove.
+- directory.*: LocalDirectory create (nested) and recursive remove.
+- line_count.*: line_count_recursive, inline and on the default thread pool.
+
+Results can be saved with ``--json`` and compared with a previous run with
+``--compare``, to prove a regression or an improvement.
+
+Run with the package installed:
+
+    python benchmarks/suite.py [--files 2000] [--depth 3] [--fanout 4]
+        [--lines 50] [--repeat 3] [--only file.,path.eq]
+        [--json results.json] [--compare baseline.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass
+class Case:
+    name: str
+    operations: int
+    run: Callable[[], object]
+    setup: Callable[[], object] | None = None
+
+
+def create_tree(
+    root: Path, files: int, depth: int, fanout: int, lines: int
+) -> tuple[list[Path], list[Path]]:
+    """Create ``files`` files round robin over a directory tree.
+
+    Returns the file paths and the directory paths, parents first.
+    """
+    directories = [root]
+    level = [root]
+    for _ in range(depth):
+        level = [parent / f"dir_{i}" for parent in level for i in range(fanout)]
+        directories.extend(level)
+    for directory in directories:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    content = "".join(f"line {i} of a synthetic file\n" for i in range(lines))
+    paths = []
+    for i in range(files):
+        path = directories[i % len(directories)] / f"file_{i}.txt"
+        path.write_text(content)
+        paths.append(path)
+    return paths, directories
+
+
+def build_cases(root: Path, args: argparse.Namespace) -> list[Case]:
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.helper.line import line_count_recursive
+
+    tree = root / "tree"
+    paths, directories = create_tree(
+        tree, args.files, args.depth, args.fanout, args.lines
+    )
+    content = paths[0].read_text()
+
+    # Mirror of the tree, for the cases that create and delete things.
+    scratch = root / "scratch"
+    scratch_paths = [scratch / path.relative_to(tree) for path in paths]
+    scratch_directories = [
+        scratch / directory.relative_to(tree) for directory in directories
+    ]
+
+    def clear_scratch() -> None:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    def empty_scratch_tree() -> None:
+        clear_scratch()
+        for directory in scratch_directories:
+            directory.mkdir(parents=True)
+
+    def full_scratch_tree() -> None:
+        clear_scratch()
+        shutil.copytree(tree, scratch)
+
+    items = [LocalFile(path) for path in paths]
+    others = [LocalFile(path) for path in paths]
+    count = len(paths)
+
+    return [
+        Case(
+            "path.construct",
+            count,
+            lambda: [LocalFile(path) for path in paths],
+        ),
+        Case(
+            "path.construct_trusted",
+            count,
+            lambda: [LocalFile(path, trusted=True) for path in paths],
+        ),
+        Case(
+            "path.eq",
+            count,
+            lambda: sum(a == b for a, b in zip(items, others)),
+        ),
+        Case("path.hash", count, lambda: len(set(items))),
+        Case("file.read", count, lambda: [item.read() for item in items]),
+        Case(
+            "file.write",
+            count,
+            lambda: [LocalFile(p).write(content) for p in scratch_paths],
+            empty_scratch_tree,
+        ),
+        Case(
+            "file.write_atomic",
+            count,
+            lambda: [LocalFile(p).write(content, atomic=True) for p in scratch_paths],
+            empty_scratch_tree,
+        ),
+        Case(
+            "file.touch",
+            count,
+            lambda: [LocalFile(p).touch(parents=False) for p in scratch_paths],
+            empty_scratch_tree,
+        ),
+        Case(
+            "file.remove",
+            count,
+            lambda: [LocalFile(p).remove() for p in scratch_paths],
+            full_scratch_tree,
+        ),
+        Case(
+            "directory.create",
+            len(scratch_directories),
+            lambda: [LocalDirectory(d).create() for d in scratch_directories],
+            clear_scratch,
+        ),
+        Case(
+            "directory.remove",
+            count + len(scratch_directories),
+            lambda: LocalDirectory(scratch).remove(),
+            full_scratch_tree,
+        ),
+        Case(
+            "line_count.inline",
+            count,
+            lambda: line_count_recursive(tree, workers=1),
+        ),
+        Case(
+            "line_count.threads",
+            count,
+            lambda: line_count_recursive(tree),
+        ),
+    ]
+
+
+def measure(case: Case, repeat: int) -> dict[str, float]:
+    """Return the best time over ``repeat`` runs and the peak traced memory."""
+    best = float("inf")
+    for _ in range(repeat):
+        if case.setup is not None:
+            case.setup()
+        start = time.perf_counter()
+        case.run()
+        best = min(best, time.perf_counter() - start)
+
+    if case.setup is not None:
+        case.setup()
+    tracemalloc.start()
+    try:
+        case.run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "operations": case.operations,
+        "seconds": best,
+        "ops_per_second": case.operations / best if best else float("inf"),
+        "peak_bytes": peak,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=2_000)
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--fanout", type=int, default=4)
+    parser.add_argument("--lines", type=int, default=50, help="Lines per file")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--only", default="", help="Comma separated case name prefixes to run"
+    )
+    parser.add_argument("--json", type=Path, help="Save the results to this file")
+    parser.add_argument("--compare", type=Path, help="Results of a previous run")
+    args = parser.parse_args()
+
+    prefixes = [prefix for prefix in args.only.split(",") if prefix]
+    baseline = json.loads(args.compare.read_text()) if args.compare else {}
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = build_cases(Path(tmp), args)
+
+        header = f"{'case':<24}{'ops':>8}{'ops/s':>12}{'best s':>10}{'peak KiB':>10}"
+        print(header + (f"{'vs base':>10}" if baseline else ""))
+        for case in cases:
+            if prefixes and not case.name.startswith(tuple(prefixes)):
+                continue
+
+            result = measure(case, args.repeat)
+            results[case.name] = result
+            line = (
+                f"{case.name:<24}{result['operations']:>8}"
+                f"{result['ops_per_second']:>12.0f}{result['seconds']:>10.4f}"
+                f"{result['peak_bytes'] / 1024:>10.0f}"
+            )
+            if case.name in baseline:
+                change = (
+                    result["ops_per_second"] / baseline[case.name]["ops_per_second"] - 1
+                )
+                line += f"{change:>+10.1%}"
+            print(line)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
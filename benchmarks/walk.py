@@ -0,0 +1,67 @@
+"""Compare LocalDirectory.walk() with Path.rglob() and os.walk().
+
+A synthetic tree of ``--entries`` files spread over nested directories is
+created once, then each method lists the whole tree.
+
+Run with the package installed:
+
+    python benchmarks/walk.py [--entries 100000] [--fanout 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+
+def create_tree(root: Path, entries: int, fanout: int) -> None:
+    """Fill directories breadth first with ``fanout`` files and subdirectories."""
+    from collections import deque
+
+    queue = deque([root])
+    created = 0
+    while created < entries:
+        parent = queue.popleft()
+        for i in range(fanout):
+            (parent / f"file_{i}.txt").touch()
+            child = parent / f"dir_{i}"
+            child.mkdir()
+            queue.append(child)
+            created += 2
+
+
+def main() -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.helper.directory import directory_walk
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=100_000)
+    parser.add_argument("--fanout", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        create_tree(root, args.entries, args.fanout)
+
+        methods = {
+            "Path.rglob('*')": lambda: sum(1 for _ in root.rglob("*")),
+            "os.walk": lambda: sum(len(d) + len(f) for _, d, f in os.walk(root)),
+            "directory_walk": lambda: sum(1 for _ in directory_walk(root)),
+            "LocalDirectory.walk": lambda: sum(
+                1 for _ in LocalDirectory(path=root).walk()
+            ),
+        }
+
+        print(f"{'method':<22}{'entries':>10}{'seconds':>10}")
+        for label, method in methods.items():
+            start = time.perf_counter()
+            count = method()
+            elapsed = time.perf_counter() - start
+            print(f"{label:<22}{count:>10}{elapsed:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
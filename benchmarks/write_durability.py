@@ -0,0 +1,58 @@
+"""Compare the cost of each LocalFile.write durability level.
+
+Levels, from cheapest to safest:
+
+- in place: the target is truncated and rewritten, a crash can leave it partial.
+- atomic: content goes to a temporary sibling which is renamed over the target.
+- fsync: content is flushed to disk before returning.
+- atomic + fsync: temporary file and parent directory are both flushed, the
+  new content survives a power loss once the call returns.
+
+Run with the package installed:
+
+    python benchmarks/write_durability.py [--count 200] [--size 4096]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+LEVELS = {
+    "in place": {},
+    "atomic": {"atomic": True},
+    "fsync": {"fsync": True},
+    "atomic + fsync": {"atomic": True, "fsync": True},
+}
+
+
+def bench_level(root: Path, count: int, content: str, options: dict) -> float:
+    from wexample_file.common.local_file import LocalFile
+
+    files = [LocalFile(path=root / f"file_{i}.txt") for i in range(count)]
+    start = time.perf_counter()
+    for local_file in files:
+        local_file.write(content, **options)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200, help="Files per level")
+    parser.add_argument("--size", type=int, default=4096, help="Bytes per file")
+    parser.add_argument("--dir", type=Path, default=None, help="Where to write")
+    args = parser.parse_args()
+
+    content = "x" * args.size
+    print(f"{'level':<16}{'total (s)':>12}{'per write (us)':>18}")
+    for name, options in LEVELS.items():
+        with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+            elapsed = bench_level(Path(tmp), args.count, content, options)
+        per_write = elapsed / args.count * 1_000_000
+        print(f"{name:<16}{elapsed:>12.4f}{per_write:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
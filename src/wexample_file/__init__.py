@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+# Not imported from typing, which alone would take longer to import than this
+# module; type checkers treat the constant the same way.
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    from typing import Any
+
+    from wexample_file.classes.batch_item_result import BatchItemResult
+    from wexample_file.classes.disk_usage import DiskUsage
+    from wexample_file.classes.file_change import FileChange
+    from wexample_file.classes.line_count_report import LineCountReport
+    from wexample_file.classes.line_stats import LineStats
+    from wexample_file.classes.line_stats_report import LineStatsReport
+    from wexample_file.classes.method_stats import MethodStats
+    from wexample_file.classes.rename_action import RenameAction
+    from wexample_file.classes.state_action import StateAction
+    from wexample_file.classes.state_item import StateItem
+    from wexample_file.common.abstract_local_item_path import AbstractLocalItemPath
+    from wexample_file.common.abstract_storage_backend import AbstractStorageBackend
+    from wexample_file.common.directory_watcher import DirectoryWatcher
+    from wexample_file.common.disk_usage_cache import DiskUsageCache
+    from wexample_file.common.fingerprint_cache import FingerprintCache
+    from wexample_file.common.instrumentation import Instrumentation
+    from wexample_file.common.line_count_cache import LineCountCache
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.common.local_file_batch import LocalFileBatch
+    from wexample_file.common.memory_storage_backend import MemoryStorageBackend
+    from wexample_file.common.os_storage_backend import OsStorageBackend
+    from wexample_file.common.overlay_storage_backend import OverlayStorageBackend
+    from wexample_file.common.rename_plan import RenamePlan
+    from wexample_file.common.state_manager import StateManager
+    from wexample_file.common.state_plan import StatePlan
+    from wexample_file.enum.file_change_type import FileChangeType
+    from wexample_file.enum.local_path_type import LocalPathType
+    from wexample_file.enum.state_action_type import StateActionType
+    from wexample_file.exception.directory_not_found_exception import (
+        DirectoryNotFoundException,
+    )
+    from wexample_file.exception.file_not_found_exception import (
+        FileNotFoundException,
+    )
+    from wexample_file.exception.invalid_state_spec_exception import (
+        InvalidStateSpecException,
+    )
+    from wexample_file.exception.not_a_directory_exception import (
+        NotADirectoryException,
+    )
+    from wexample_file.exception.not_a_file_exception import NotAFileException
+    from wexample_file.exception.unsupported_backend_exception import (
+        UnsupportedBackendException,
+    )
+
+# Public name -> module defining it. Modules are only imported on first access,
+# so importing the package itself loads neither wexample_helpers nor attrs.
+_EXPORTS: dict[str, str] = {
+    "AbstractLocalItemPath": "wexample_file.common.abstract_local_item_path",
+    "AbstractStorageBackend": "wexample_file.common.abstract_storage_backend",
+    "BatchItemResult": "wexample_file.classes.batch_item_result",
+    "DirectoryNotFoundException": "wexample_file.exception.directory_not_found_exception",
+    "DirectoryWatcher": "wexample_file.common.directory_watcher",
+    "DiskUsage": "wexample_file.classes.disk_usage",
+    "DiskUsageCache": "wexample_file.common.disk_usage_cache",
+    "FileChange": "wexample_file.classes.file_change",
+    "FileChangeType": "wexample_file.enum.file_change_type",
+    "FileNotFoundException": "wexample_file.exception.file_not_found_exception",
+    "FingerprintCache": "wexample_file.common.fingerprint_cache",
+    "Instrumentation": "wexample_file.common.instrumentation",
+    "InvalidStateSpecException": "wexample_file.exception.invalid_state_spec_exception",
+    "LineCountCache": "wexample_file.common.line_count_cache",
+    "LineCountReport": "wexample_file.classes.line_count_report",
+    "LineStats": "wexample_file.classes.line_stats",
+    "LineStatsReport": "wexample_file.classes.line_stats_report",
+    "LocalDirectory": "wexample_file.common.local_directory",
+    "LocalFile": "wexample_file.common.local_file",
+    "LocalFileBatch": "wexample_file.common.local_file_batch",
+    "LocalPathType": "wexample_file.enum.local_path_type",
+    "MemoryStorageBackend": "wexample_file.common.memory_storage_backend",
+    "MethodStats": "wexample_file.classes.method_stats",
+    "NotADirectoryException": "wexample_file.exception.not_a_directory_exception",
+    "NotAFileException": "wexample_file.exception.not_a_file_exception",
+    "OsStorageBackend": "wexample_file.common.os_storage_backend",
+    "OverlayStorageBackend": "wexample_file.common.overlay_storage_backend",
+    "RenameAction": "wexample_file.classes.rename_action",
+    "RenamePlan": "wexample_file.common.rename_plan",
+    "StateAction": "wexample_file.classes.state_action",
+    "StateActionType": "wexample_file.enum.state_action_type",
+    "StateItem": "wexample_file.classes.state_item",
+    "StateManager": "wexample_file.common.state_manager",
+    "StatePlan": "wexample_file.common.state_plan",
+    "UnsupportedBackendException": "wexample_file.exception.unsupported_backend_exception",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), name)
+    # Later accesses find it directly, without going through __getattr__.
+    globals()[name] = value
+    return value
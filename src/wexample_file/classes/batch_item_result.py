@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wexample_helpers.const.types import PathOrString
+
+    from wexample_file.common.local_file import LocalFile
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one item of a batch operation: its value or its error."""
+
+    error: Exception | None
+    item: LocalFile | PathOrString
+    value: Any = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
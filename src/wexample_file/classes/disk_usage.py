@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class DiskUsage:
+    """Size and entry counts of a directory tree, with a per-extension breakdown."""
+
+    directory_count: int = 0
+    extension_counts: dict[str, int] = field(default_factory=dict)
+    extension_sizes: dict[str, int] = field(default_factory=dict)
+    file_count: int = 0
+    size: int = 0
+
+    def add_file(self, extension: str, size: int) -> None:
+        self.file_count += 1
+        self.size += size
+        self.extension_counts[extension] = self.extension_counts.get(extension, 0) + 1
+        self.extension_sizes[extension] = self.extension_sizes.get(extension, 0) + size
+
+    def merge(self, other: DiskUsage) -> None:
+        """Add the totals of another usage, e.g. of a subdirectory, to this one."""
+        self.directory_count += other.directory_count
+        self.file_count += other.file_count
+        self.size += other.size
+        for extension, count in other.extension_counts.items():
+            self.extension_counts[extension] = (
+                self.extension_counts.get(extension, 0) + count
+            )
+        for extension, size in other.extension_sizes.items():
+            self.extension_sizes[extension] = (
+                self.extension_sizes.get(extension, 0) + size
+            )
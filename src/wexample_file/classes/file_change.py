@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.enum.file_change_type import FileChangeType
+
+
+@dataclass
+class FileChange:
+    """One coalesced change seen by a directory watcher, or pending in an overlay."""
+
+    type: FileChangeType
+    item: LocalFile | LocalDirectory
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@dataclass
+class LineCountReport:
+    """Line totals of a recursive count, broken down per file and per extension."""
+
+    total: int = 0
+    extensions: dict[str, int] = field(default_factory=dict)
+    files: dict[Path, int] = field(default_factory=dict)
+
+    def add(self, path: Path, count: int) -> None:
+        from wexample_file.helper.path import path_get_extension
+
+        extension = path_get_extension(path)
+        self.total += count
+        self.files[path] = count
+        self.extensions[extension] = self.extensions.get(extension, 0) + count
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+
+@dataclass
+class LineStats:
+    """Numbers of blank, comment and code lines of one or several files."""
+
+    blank: int = 0
+    code: int = 0
+    comment: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.blank + self.code + self.comment
+
+    def add(self, other: LineStats) -> None:
+        self.blank += other.blank
+        self.code += other.code
+        self.comment += other.comment
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from wexample_file.classes.line_stats import LineStats
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@dataclass
+class LineStatsReport:
+    """Blank/comment/code line counts of a tree, per file and per language."""
+
+    total: LineStats = field(default_factory=LineStats)
+    languages: dict[str, LineStats] = field(default_factory=dict)
+    files: dict[Path, LineStats] = field(default_factory=dict)
+
+    def add(self, path: Path, language: str, stats: LineStats) -> None:
+        self.total.add(stats)
+        self.files[path] = stats
+        self.languages.setdefault(language, LineStats()).add(stats)
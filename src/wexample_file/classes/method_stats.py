@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass
+class MethodStats:
+    """What the calls of one method of one item type cost, once instrumented.
+
+    ``seconds`` includes the time spent in nested instrumented methods, while
+    filesystem calls and bytes are only counted for the innermost one.
+    """
+
+    count: int = 0
+    seconds: float = 0.0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    calls: dict[str, int] = field(default_factory=dict)
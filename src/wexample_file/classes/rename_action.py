@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@dataclass
+class RenameAction:
+    """One rename of a rename plan, with its outcome once applied."""
+
+    source: Path
+    target: Path
+    applied: bool = False
+    conflict: bool = False
+    error: Exception | None = None
+    reason: str = ""
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wexample_file.classes.state_item import StateItem
+    from wexample_file.enum.state_action_type import StateActionType
+
+
+@dataclass
+class StateAction:
+    """One change of a state plan, with its outcome once applied."""
+
+    item: StateItem
+    type: StateActionType
+    applied: bool = False
+    error: Exception | None = None
+    reason: str = ""
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from wexample_file.enum.local_path_type import LocalPathType
+
+
+@dataclass
+class StateItem:
+    """Desired state of one path, as declared in a state spec.
+
+    ``content`` None means the file content is not managed, ``mode`` None that
+    permissions are not managed.
+    """
+
+    path: Path
+    type: LocalPathType
+    content: str | None = None
+    mode: int | None = None
+    present: bool = True
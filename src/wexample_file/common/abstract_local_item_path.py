@@ -1,13 +1,27 @@
 from __future__ import annotations
 
+import os
+import stat
+import time
+from pathlib import Path
 from typing import TYPE_CHECKING
+from weakref import WeakValueDictionary
 
 from wexample_helpers.classes.abstract_method import abstract_method
 from wexample_helpers.const.types import PathOrString
 from wexample_helpers.mixin.with_path_mixin import WithPathMixin
 
+from wexample_file.helper.storage import STORAGE_OS_BACKEND, storage_get_backend
+
 if TYPE_CHECKING:
-    from pathlib import Path
+    from typing_extensions import Self
+
+    from wexample_file.common.abstract_storage_backend import AbstractStorageBackend
+
+# Shared instances handed out by AbstractLocalItemPath.interned()
+_INTERNED: WeakValueDictionary[
+    tuple[type, Path, AbstractStorageBackend], AbstractLocalItemPath
+] = WeakValueDictionary()
 
 
 class AbstractLocalItemPath(WithPathMixin):
@@ -16,28 +30,77 @@ class AbstractLocalItemPath(WithPathMixin):
     Accepts either a string or a pathlib.Path for ``path`` and always stores a
     resolved absolute Path (with user home expanded). This keeps comparisons and
     downstream usage consistent regardless of how the input was provided.
+
+    Paths already known to be absolute and canonical (e.g. built from the entries
+    of a resolved directory) can skip resolution with ``from_resolved``.
+
+    Items hash by path, so they can be deduplicated in sets and used as dict
+    keys. Collections holding the same paths many times can share instances
+    through ``interned``.
+
+    Filesystem operations go through a storage backend: the real OS by default,
+    or e.g. a MemoryStorageBackend, given explicitly or active when the item is
+    created.
     """
 
+    # Storage the path lives in, only set on instances not using the OS
+    backend: AbstractStorageBackend = STORAGE_OS_BACKEND
     check_exists: bool = False
     path: Path
+    stat_cache_ttl: float | None = None
+    use_stat_cache: bool = False
+    # Last stat snapshot, None when the path was missing, and when it was taken
+    _stat_result: os.stat_result | None = None
+    _stat_time: float | None = None
 
-    def __init__(self, path: PathOrString, check_exists: bool = False) -> None:
+    def __init__(
+        self,
+        path: PathOrString,
+        check_exists: bool = False,
+        use_stat_cache: bool = False,
+        stat_cache_ttl: float | None = None,
+        trusted: bool = False,
+        backend: AbstractStorageBackend | None = None,
+    ) -> None:
         """Coerce input into a resolved Path.
 
         - Accepts str or Path
         - Expands '~' and resolves to an absolute path with strict=False
+        - Rejects an existing path of the wrong type (e.g. a directory for a file),
+          at the cost of a stat, kept as the first snapshot with use_stat_cache
+        - With trusted, the path is stored as given and neither resolved nor
+          type-checked, which costs no syscall at all
+        - With use_stat_cache, existence, type, size and mtime are answered from a
+          single stat snapshot, kept until refresh(), a mutating call, or until
+          stat_cache_ttl seconds have elapsed (never when None)
+        - Without backend, the one active at creation is used, the OS by default;
+          symlinks are only resolved on the OS
         """
-        from pathlib import Path
-
         if isinstance(path, str):
-            self.path = Path(path)
-        if isinstance(path, Path):
+            path = Path(path)
+        elif not isinstance(path, Path):
+            raise TypeError("path must be a str or pathlib.Path")
+
+        if backend is None:
+            backend = storage_get_backend()
+        if backend is not STORAGE_OS_BACKEND:
+            self.backend = backend
+
+        if trusted:
+            self.path = path
+        elif backend.native:
             self.path = path.expanduser().resolve(strict=False)
         else:
-            raise TypeError("path must be a str or pathlib.Path")
+            self.path = Path(os.path.abspath(path.expanduser()))
+
+        if use_stat_cache:
+            self.use_stat_cache = True
+            self.stat_cache_ttl = stat_cache_ttl
 
         if check_exists:
             self._check_exists()
+        elif not trusted:
+            self._check_type(self.get_stat())
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(path={repr(str(self.path))})"
@@ -46,15 +109,117 @@ class AbstractLocalItemPath(WithPathMixin):
         return str(self.path)
 
     def __eq__(self, other) -> bool:
-        from pathlib import Path
-
         if isinstance(other, AbstractLocalItemPath):
             return self.path == other.path
         if isinstance(other, (str, Path)):
-            other_path = Path(other).expanduser().resolve(strict=False)
-            return self.path == other_path
+            other_path = Path(other)
+            # Our own path is already normalized, only resolve the other one when
+            # the cheap comparison is not enough.
+            if self.path == other_path:
+                return True
+            return self.path == other_path.expanduser().resolve(strict=False)
         return NotImplemented
 
+    def __hash__(self) -> int:
+        # Consistent with __eq__ between items; like pathlib, an item and an equal
+        # str do not share a hash.
+        return hash(self.path)
+
+    def exists(self) -> bool:
+        return self.get_stat() is not None
+
+    @classmethod
+    def from_resolved(
+        cls,
+        path: PathOrString,
+        backend: AbstractStorageBackend | None = None,
+        **kwargs,
+    ) -> Self:
+        """Build an instance from a path known to be absolute and canonical.
+
+        Skips ``expanduser``/``resolve`` and the type check, so no filesystem call
+        is made unless ``check_exists`` is requested.
+        """
+        if kwargs or not isinstance(path, Path):
+            return cls(path, trusted=True, backend=backend, **kwargs)
+
+        # Hot path when listing trees: nothing to coerce nor check
+        instance = cls.__new__(cls)
+        instance.path = path
+        if backend is None:
+            backend = storage_get_backend()
+        if backend is not STORAGE_OS_BACKEND:
+            instance.backend = backend
+        return instance
+
+    def get_mtime(self) -> float | None:
+        """Return the modification time, or None if the path doesn't exist."""
+        stat_result = self.get_stat()
+        return None if stat_result is None else stat_result.st_mtime
+
+    def get_size(self) -> int | None:
+        """Return the size in bytes, or None if the path doesn't exist."""
+        stat_result = self.get_stat()
+        return None if stat_result is None else stat_result.st_size
+
+    def get_stat(self) -> os.stat_result | None:
+        """Return the stat of the path (following symlinks), or None if it's missing.
+
+        When the stat cache is enabled, the last snapshot is returned as long as it
+        is still valid; otherwise each call costs one stat syscall.
+        """
+        if self.use_stat_cache and self._stat_time is not None:
+            if (
+                self.stat_cache_ttl is None
+                or time.monotonic() - self._stat_time < self.stat_cache_ttl
+            ):
+                return self._stat_result
+
+        return self.refresh()
+
+    @classmethod
+    def interned(
+        cls,
+        path: PathOrString,
+        trusted: bool = False,
+        backend: AbstractStorageBackend | None = None,
+    ) -> Self:
+        """Return the shared instance of this class for ``path``.
+
+        Instances live in a weak registry keyed by class, resolved path and
+        backend, so millions of references to the same path cost a single
+        object, released once nothing uses it anymore. Shared instances are
+        created with default options: enable the stat cache on them only if
+        every holder agrees.
+        """
+        if not isinstance(path, (str, Path)):
+            raise TypeError("path must be a str or pathlib.Path")
+        if backend is None:
+            backend = storage_get_backend()
+        path = Path(path)
+        if not trusted:
+            if backend.native:
+                path = path.expanduser().resolve(strict=False)
+            else:
+                path = Path(os.path.abspath(path.expanduser()))
+
+        key = (cls, path, backend)
+        instance = _INTERNED.get(key)
+        if instance is None:
+            instance = cls.from_resolved(path, backend=backend)
+            if not trusted:
+                instance._check_type(instance.get_stat())
+            instance = _INTERNED.setdefault(key, instance)
+        return instance
+
+    def is_dir(self) -> bool:
+        stat_result = self.get_stat()
+        return stat_result is not None and stat.S_ISDIR(stat_result.st_mode)
+
+    def is_file(self) -> bool:
+        stat_result = self.get_stat()
+        return stat_result is not None and stat.S_ISREG(stat_result.st_mode)
+
     @abstract_method
     def item_type(self) -> str:
         """Return the kind of local item (e.g., 'file' or 'directory').
@@ -63,6 +228,15 @@ class AbstractLocalItemPath(WithPathMixin):
         provide a simple discriminator for debugging and representation.
         """
 
+    def refresh(self) -> os.stat_result | None:
+        """Take a new stat snapshot of the path and return it."""
+        stat_result = self.backend.stat(self.path)
+
+        if self.use_stat_cache:
+            self._stat_result = stat_result
+            self._stat_time = time.monotonic()
+        return stat_result
+
     @abstract_method
     def remove(self) -> None:
         """Remove the underlying path from the filesystem.
@@ -73,3 +247,24 @@ class AbstractLocalItemPath(WithPathMixin):
         - This operation should be idempotent: if the path does not exist,
           the method should complete without raising.
         """
+
+    def _check_exists(self) -> None:
+        """Ensure the path exists, using a single stat."""
+        stat_result = self.get_stat()
+        if stat_result is None:
+            from wexample_helpers.exception.local_path_not_found_exception import (
+                LocalPathNotFoundException,
+            )
+
+            # Defer to subclass to choose the most specific exception
+            raise self._not_found_exc() or LocalPathNotFoundException(self.path)
+        self._check_type(stat_result)
+
+    def _check_type(self, stat_result: os.stat_result | None) -> None:
+        """Raise if the path exists but is not of the expected kind."""
+
+    def _invalidate_stat(self) -> None:
+        """Forget the stat snapshot, after an operation that changed the path."""
+        if self.use_stat_cache:
+            self._stat_time = None
+            self._stat_result = None
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from wexample_helpers.classes.abstract_method import abstract_method
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Iterator
+    from typing import IO
+
+    from wexample_helpers.const.types import PathOrString
+
+
+class AbstractStorageBackend:
+    """Filesystem operations local items are built on.
+
+    Methods take absolute, normalized paths and behave like their os / pathlib
+    counterparts, raising the same OSError subclasses (FileNotFoundError,
+    NotADirectoryError, IsADirectoryError, FileExistsError...), so items keep
+    the same semantics and exceptions whatever the backend.
+
+    Items use the backend they were created with, by default the one active
+    when they were created: the OS unless another backend is used as a context
+    manager, e.g. ``with MemoryStorageBackend(): ...``.
+    """
+
+    # Whether paths are real OS paths, usable with os functions, mmap or inotify
+    native: bool = False
+
+    def __init__(self) -> None:
+        self._previous_backends: list[AbstractStorageBackend] = []
+
+    def __enter__(self) -> AbstractStorageBackend:
+        """Make this backend the default of the items created until exit."""
+        from wexample_file.helper.storage import storage_set_backend
+
+        self._previous_backends.append(storage_set_backend(self))
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        from wexample_file.helper.storage import storage_set_backend
+
+        storage_set_backend(self._previous_backends.pop())
+
+    @abstract_method
+    def chmod(self, path: PathOrString, mode: int) -> None:
+        """Change the permission bits of the path."""
+
+    @abstract_method
+    def fsync(self, fh: IO) -> None:
+        """Flush a file opened with ``open`` down to the storage."""
+
+    @abstract_method
+    def fsync_directory(self, path: PathOrString) -> None:
+        """Make the entries recently added to the directory durable."""
+
+    @abstract_method
+    def mkdir(
+        self, path: PathOrString, parents: bool = False, exist_ok: bool = False
+    ) -> None:
+        """Create a directory, like ``Path.mkdir``."""
+
+    @abstract_method
+    def open(
+        self,
+        path: PathOrString,
+        mode: str = "r",
+        encoding: str | None = None,
+        buffering: int = -1,
+    ) -> IO:
+        """Open a file, like the ``open`` builtin, in one of the r, w, a, x modes."""
+
+    @abstract_method
+    def replace(self, source: PathOrString, target: PathOrString) -> None:
+        """Move ``source`` to ``target``, replacing it, like ``os.replace``."""
+
+    @abstract_method
+    def rmtree(self, path: PathOrString) -> None:
+        """Delete a directory and its whole content, like ``shutil.rmtree``."""
+
+    @abstract_method
+    def scandir(self, path: PathOrString) -> Iterator[os.DirEntry]:
+        """List a directory like ``os.scandir``, also usable as a context manager."""
+
+    @abstract_method
+    def stat(
+        self, path: PathOrString, follow_symlinks: bool = True
+    ) -> os.stat_result | None:
+        """Return the stat of the path, or None if it doesn't exist."""
+
+    @abstract_method
+    def touch(self, path: PathOrString, exist_ok: bool = True) -> None:
+        """Create an empty file or update its modification time, like ``Path.touch``."""
+
+    @abstract_method
+    def unlink(self, path: PathOrString, missing_ok: bool = False) -> None:
+        """Delete a file, like ``Path.unlink``."""
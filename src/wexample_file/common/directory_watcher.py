@@ -0,0 +1,385 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from wexample_file.classes.file_change import FileChange
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.enum.file_change_type import FileChangeType
+
+
+class DirectoryWatcher:
+    """Report files and directories created, modified or deleted under a root.
+
+    Uses inotify on Linux, with one watch per directory, and otherwise polls the
+    tree, diffing snapshots of (type, mtime, size, inode). Raw events are
+    debounced: a batch is delivered once no event arrived for ``debounce``
+    seconds (or ``max_delay`` after its first event), and events on the same
+    path are coalesced, so a burst of writes comes out as a single MODIFIED and
+    a file created then deleted within a batch is not reported at all.
+
+    If the inotify queue overflows, the root is reported as MODIFIED: its
+    content should be rescanned. The same happens when a new directory can't
+    be watched (e.g. ENOSPC once the watch limit is reached), the watcher then
+    switching to polling for good rather than missing the changes made in it.
+    """
+
+    def __init__(
+        self,
+        root: LocalDirectory,
+        recursive: bool = True,
+        prune: Iterable[str] | None = None,
+        debounce: float = 0.05,
+        max_delay: float = 1.0,
+        poll_interval: float = 0.5,
+        use_inotify: bool | None = None,
+    ) -> None:
+        """
+        Parameters:
+            root: Directory to watch; it must exist.
+            recursive: Watch the whole tree rather than the direct children.
+            prune: Glob patterns of directories not to watch (e.g. ".git").
+            debounce: Quiet time closing a batch of events, in seconds.
+            max_delay: Longest time a batch is held, in seconds.
+            poll_interval: Time between two scans when polling, in seconds.
+            use_inotify: Force (True) or disable (False) inotify; by default it is
+                used when available.
+        """
+        import os
+
+        from wexample_file.helper.directory import directory_compile_patterns
+        from wexample_file.helper.inotify import inotify_available
+
+        self.root = root
+        self.recursive = recursive
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.closed = False
+
+        self._root_path = os.fspath(root.path)
+        self._prune = list(prune or ())
+        self._prune_matches = directory_compile_patterns(prune)
+        self._pending: dict[str, tuple[FileChangeType, bool]] = {}
+        self._fd: int | None = None
+        self._watches: dict[int, str] = {}
+        self._snapshot: dict[str, tuple[bool, int, int, int]] = {}
+
+        if use_inotify is None:
+            use_inotify = inotify_available()
+        if use_inotify:
+            self._start_inotify()
+        else:
+            self._snapshot = self._scan()
+
+    def __enter__(self) -> DirectoryWatcher:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[FileChange]:
+        """Yield changes as they come, until the watcher is closed."""
+        while not self.closed:
+            yield from self.read()
+
+    @property
+    def backend(self) -> str:
+        return "inotify" if self._fd is not None else "polling"
+
+    def close(self) -> None:
+        import os
+
+        self.closed = True
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._watches.clear()
+
+    def read(self, timeout: float | None = None) -> list[FileChange]:
+        """Wait for the next batch of changes and return it.
+
+        Returns an empty list if nothing changed within ``timeout`` seconds;
+        without timeout, blocks until something changes.
+        """
+        import time
+        from pathlib import Path
+
+        from wexample_file.classes.file_change import FileChange
+        from wexample_file.common.local_directory import LocalDirectory
+        from wexample_file.common.local_file import LocalFile
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        batch_deadline = quiet_deadline = 0.0
+
+        while not self.closed:
+            now = time.monotonic()
+            if self._pending:
+                wait = min(quiet_deadline, batch_deadline) - now
+                if wait <= 0:
+                    break
+            elif deadline is None:
+                wait = None
+            else:
+                wait = deadline - now
+                if wait <= 0:
+                    break
+
+            had_pending = bool(self._pending)
+            if self._collect(wait):
+                now = time.monotonic()
+                quiet_deadline = now + self.debounce
+                if not had_pending:
+                    batch_deadline = now + self.max_delay
+
+        changes = []
+        for path, (change_type, is_dir) in self._pending.items():
+            item_class = LocalDirectory if is_dir else LocalFile
+            changes.append(
+                FileChange(change_type, item_class.from_resolved(Path(path)))
+            )
+        self._pending = {}
+        return changes
+
+    def _add_watches(self, directory: str, emit: bool) -> None:
+        """Watch a directory and, when recursive, its subdirectories.
+
+        The watch is set before listing, so nothing created meanwhile is missed;
+        with ``emit``, the listed entries are reported as created.
+
+        Raises:
+            OSError: If a directory can't be watched, unless it just disappeared.
+        """
+        import errno
+        import os
+
+        from wexample_file.enum.file_change_type import FileChangeType
+        from wexample_file.helper.inotify import inotify_add_watch
+
+        stack = [directory]
+        while stack:
+            current = stack.pop()
+            try:
+                self._watches[inotify_add_watch(self._fd, current)] = current
+            except OSError as e:
+                # Removed (or replaced by a file) since it was listed
+                if e.errno in (errno.ENOENT, errno.ENOTDIR):
+                    continue
+                raise
+
+            try:
+                scanner = os.scandir(current)
+            except OSError:
+                continue
+            with scanner:
+                for entry in scanner:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        is_dir = False
+                    if is_dir and self._is_pruned(entry.path):
+                        continue
+                    if emit:
+                        self._record(entry.path, FileChangeType.CREATED, is_dir)
+                    if is_dir:
+                        stack.append(entry.path)
+
+    def _collect(self, wait: float | None) -> bool:
+        if self._fd is not None:
+            return self._collect_inotify(wait)
+        return self._collect_polling(wait)
+
+    def _collect_inotify(self, wait: float | None) -> bool:
+        import os
+        import select
+
+        from wexample_file.enum.file_change_type import FileChangeType
+        from wexample_file.helper.inotify import (
+            INOTIFY_CREATE,
+            INOTIFY_DELETE,
+            INOTIFY_DELETE_SELF,
+            INOTIFY_IGNORED,
+            INOTIFY_ISDIR,
+            INOTIFY_MOVE_SELF,
+            INOTIFY_MOVED_FROM,
+            INOTIFY_MOVED_TO,
+            INOTIFY_Q_OVERFLOW,
+            inotify_parse_events,
+        )
+
+        ready, _, _ = select.select([self._fd], [], [], wait)
+        if not ready:
+            return False
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+
+        for wd, mask, _cookie, name in inotify_parse_events(data):
+            if mask & INOTIFY_Q_OVERFLOW:
+                self._record(self._root_path, FileChangeType.MODIFIED, True)
+                continue
+            if mask & INOTIFY_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            if mask & (INOTIFY_DELETE_SELF | INOTIFY_MOVE_SELF):
+                # Subdirectories are reported by their parent's watch.
+                if directory == self._root_path:
+                    self._record(directory, FileChangeType.DELETED, True)
+                continue
+
+            path = os.path.join(directory, name) if name else directory
+            is_dir = bool(mask & INOTIFY_ISDIR)
+            if is_dir and name and self._is_pruned(path):
+                continue
+
+            if mask & (INOTIFY_CREATE | INOTIFY_MOVED_TO):
+                self._record(path, FileChangeType.CREATED, is_dir)
+                if is_dir and self.recursive:
+                    try:
+                        self._add_watches(path, emit=True)
+                    except OSError:
+                        self._start_polling()
+                        self._record(self._root_path, FileChangeType.MODIFIED, True)
+                        return True
+            elif mask & (INOTIFY_DELETE | INOTIFY_MOVED_FROM):
+                self._record(path, FileChangeType.DELETED, is_dir)
+                if is_dir and mask & INOTIFY_MOVED_FROM:
+                    self._drop_watches(path)
+            else:
+                self._record(path, FileChangeType.MODIFIED, is_dir)
+
+        return True
+
+    def _collect_polling(self, wait: float | None) -> bool:
+        import time
+
+        from wexample_file.enum.file_change_type import FileChangeType
+
+        time.sleep(
+            self.poll_interval if wait is None else min(wait, self.poll_interval)
+        )
+
+        previous = self._snapshot
+        snapshot = self._scan()
+        changed = False
+
+        for path, info in snapshot.items():
+            old = previous.get(path)
+            if old is None:
+                self._record(path, FileChangeType.CREATED, info[0])
+                changed = True
+            elif (
+                old[0] != info[0]
+                or old[3] != info[3]
+                # Directory times move with their entries, which are reported
+                # on their own.
+                or (not info[0] and old[1:3] != info[1:3])
+            ):
+                self._record(path, FileChangeType.MODIFIED, info[0])
+                changed = True
+
+        for path in previous.keys() - snapshot.keys():
+            self._record(path, FileChangeType.DELETED, previous[path][0])
+            changed = True
+
+        self._snapshot = snapshot
+        return changed
+
+    def _drop_watches(self, directory: str) -> None:
+        """Stop watching a directory moved away, and everything below it."""
+        import os
+
+        from wexample_file.helper.inotify import inotify_rm_watch
+
+        prefix = directory + os.sep
+        for wd, path in list(self._watches.items()):
+            if path == directory or path.startswith(prefix):
+                inotify_rm_watch(self._fd, wd)
+                del self._watches[wd]
+
+    def _is_pruned(self, path: str) -> bool:
+        import os
+
+        if self._prune_matches is None:
+            return False
+        relative_path = os.path.relpath(path, self._root_path).replace(os.sep, "/")
+        return self._prune_matches(os.path.basename(path), relative_path)
+
+    def _record(self, path: str, change_type: FileChangeType, is_dir: bool) -> None:
+        """Merge a raw event into the pending batch."""
+        from wexample_file.enum.file_change_type import FileChangeType
+
+        previous = self._pending.get(path)
+        if previous is not None:
+            previous_type = previous[0]
+            if previous_type is FileChangeType.CREATED:
+                if change_type is FileChangeType.DELETED:
+                    del self._pending[path]
+                    return
+                change_type = FileChangeType.CREATED
+            elif previous_type is FileChangeType.DELETED:
+                if change_type is FileChangeType.CREATED:
+                    change_type = FileChangeType.MODIFIED
+            elif change_type is not FileChangeType.DELETED:
+                change_type = FileChangeType.MODIFIED
+        self._pending[path] = (change_type, is_dir)
+
+    def _scan(self) -> dict[str, tuple[bool, int, int, int]]:
+        """Snapshot the tree as path -> (is_dir, mtime_ns, size, inode)."""
+        import os
+        import stat
+
+        from wexample_file.helper.directory import directory_walk
+
+        snapshot = {}
+        if not os.path.isdir(self._root_path):
+            return snapshot
+
+        for entry in directory_walk(
+            self._root_path,
+            prune=self._prune,
+            max_depth=None if self.recursive else 1,
+        ):
+            try:
+                entry_stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            snapshot[entry.path] = (
+                stat.S_ISDIR(entry_stat.st_mode),
+                entry_stat.st_mtime_ns,
+                entry_stat.st_size,
+                entry_stat.st_ino,
+            )
+        return snapshot
+
+    def _start_inotify(self) -> None:
+        from wexample_file.helper.inotify import inotify_add_watch, inotify_init
+
+        try:
+            self._fd = inotify_init()
+            self._watches[inotify_add_watch(self._fd, self._root_path)] = (
+                self._root_path
+            )
+            if self.recursive:
+                # Adding the root again returns its existing watch descriptor.
+                self._add_watches(self._root_path, emit=False)
+        except OSError:
+            # Watch limit reached or inotify disabled: poll instead.
+            self._start_polling()
+
+    def _start_polling(self) -> None:
+        """Stop using inotify, if started, and poll the tree from now on."""
+        import os
+
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        self._watches.clear()
+        self._snapshot = self._scan()
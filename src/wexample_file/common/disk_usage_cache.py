@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wexample_helpers.const.types import PathOrString
+
+    from wexample_file.classes.disk_usage import DiskUsage
+
+
+class DiskUsageCache:
+    """Per-directory cache of disk usage results, validated by directory mtime.
+
+    For each scanned directory, the usage of its own files and the list of its
+    subdirectories are stored along with the directory's mtime. A later scan
+    reuses them while the mtime is unchanged, so only directories whose entries
+    changed are listed again.
+
+    A directory's mtime only moves when entries are added, removed or renamed.
+    A file rewritten in place keeps its parent's mtime, so its new size is not
+    seen until that directory changes or the cache is cleared. Atomic writes
+    (LocalFile.write(atomic=True)) rename into place and are always detected.
+    """
+
+    def __init__(self) -> None:
+        import threading
+
+        self._entries: dict[str, tuple[int, DiskUsage, list[str]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, directory: str, mtime_ns: int) -> tuple[DiskUsage, list[str]] | None:
+        """Return the cached own usage and subdirectories, if still valid."""
+        entry = self._entries.get(directory)
+        if entry is None or entry[0] != mtime_ns:
+            return None
+        return entry[1], entry[2]
+
+    @classmethod
+    def load(cls, path: PathOrString) -> DiskUsageCache:
+        """Load a cache saved with ``save``; an unreadable file gives an empty cache."""
+        import json
+
+        from wexample_file.classes.disk_usage import DiskUsage
+
+        cache = cls()
+        try:
+            with open(path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return cache
+
+        for directory, (mtime_ns, usage, subdirectories) in data.items():
+            cache._entries[directory] = (mtime_ns, DiskUsage(**usage), subdirectories)
+        return cache
+
+    def save(self, path: PathOrString) -> None:
+        import dataclasses
+        import json
+
+        from wexample_file.common.local_file import LocalFile
+        from wexample_file.helper.storage import STORAGE_OS_BACKEND
+
+        with self._lock:
+            data = {
+                directory: [mtime_ns, dataclasses.asdict(usage), subdirectories]
+                for directory, (
+                    mtime_ns,
+                    usage,
+                    subdirectories,
+                ) in self._entries.items()
+            }
+        # Entries describe files of the disk: saved there as plain JSON, the way
+        # load reads them, whatever the active backend or the extension.
+        LocalFile(path=path, backend=STORAGE_OS_BACKEND).write(
+            json.dumps(data), atomic=True, compression=False
+        )
+
+    def set(
+        self,
+        directory: str,
+        mtime_ns: int,
+        usage: DiskUsage,
+        subdirectories: list[str],
+    ) -> None:
+        import os
+
+        with self._lock:
+            previous = self._entries.get(directory)
+            self._entries[directory] = (mtime_ns, usage, subdirectories)
+            if previous is None:
+                return
+
+            # Forget subtrees that disappeared since the last scan
+            removed = set(previous[2]).difference(subdirectories)
+            if removed:
+                prefixes = tuple(path + os.sep for path in removed)
+                for key in list(self._entries):
+                    if key in removed or key.startswith(prefixes):
+                        del self._entries[key]
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import os
+
+    from wexample_helpers.const.types import PathOrString
+
+
+class FingerprintCache:
+    """Persistent cache of file digests, keyed by path, size, mtime and inode.
+
+    A digest is reused as long as the file's stat still matches the one taken
+    before it was computed, so unchanged files are never read again. Several
+    algorithms can be stored for the same file.
+    """
+
+    def __init__(self) -> None:
+        import threading
+
+        self._entries: dict[str, tuple[int, int, int, dict[str, str]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get(
+        self, path: PathOrString, stat_result: os.stat_result, algorithm: str
+    ) -> str | None:
+        """Return the cached digest if the file is unchanged since it was computed."""
+        entry = self._entries.get(str(path))
+        if entry is None or entry[:3] != self._stat_key(stat_result):
+            return None
+        return entry[3].get(algorithm)
+
+    @classmethod
+    def load(cls, path: PathOrString) -> FingerprintCache:
+        """Load a cache saved with ``save``; an unreadable file gives an empty cache."""
+        import json
+
+        cache = cls()
+        try:
+            with open(path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return cache
+
+        for file_path, (size, mtime_ns, inode, digests) in data.items():
+            cache._entries[file_path] = (size, mtime_ns, inode, digests)
+        return cache
+
+    def save(self, path: PathOrString) -> None:
+        import json
+
+        from wexample_file.common.local_file import LocalFile
+        from wexample_file.helper.storage import STORAGE_OS_BACKEND
+
+        with self._lock:
+            data = {key: list(entry) for key, entry in self._entries.items()}
+        # Entries describe files of the disk: saved there as plain JSON, the way
+        # load reads them, whatever the active backend or the extension.
+        LocalFile(path=path, backend=STORAGE_OS_BACKEND).write(
+            json.dumps(data), atomic=True, compression=False
+        )
+
+    def set(
+        self,
+        path: PathOrString,
+        stat_result: os.stat_result,
+        algorithm: str,
+        digest: str,
+    ) -> None:
+        """Store a digest computed from the content matching ``stat_result``."""
+        key = str(path)
+        stat_key = self._stat_key(stat_result)
+        with self._lock:
+            entry = self._entries.get(key)
+            digests = entry[3] if entry is not None and entry[:3] == stat_key else {}
+            digests[algorithm] = digest
+            self._entries[key] = (*stat_key, digests)
+
+    @staticmethod
+    def _stat_key(stat_result: os.stat_result) -> tuple[int, int, int]:
+        return stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino
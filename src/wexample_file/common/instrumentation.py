@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wexample_file.classes.method_stats import MethodStats
+
+
+class Instrumentation:
+    """Opt-in counters of filesystem calls, bytes and time per method.
+
+    While started, usually as a context manager, every public method of
+    LocalFile and LocalDirectory is timed, and the filesystem calls (stat,
+    open, mkdir, unlink, rmtree...) and bytes read and written are counted,
+    broken down by item type and method. Nothing is patched while no
+    instrumentation is active, so it costs nothing when off.
+
+    Only this package is patched: the storage backend methods and the helpers
+    going to the OS directly, each counted as one call (e.g. hash_file);
+    builtins and os are left alone, so other code is never counted. Patching
+    is process wide though: calls of every thread are counted, and those made
+    outside the timed methods, e.g. by helpers on a pool, only show in the
+    totals. Text reads and writes are counted in characters. To forward
+    measures elsewhere, subclass it and override ``record_call`` and
+    ``record_method``.
+    """
+
+    def __init__(self) -> None:
+        import threading
+
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.calls: dict[str, int] = {}
+        self.methods: dict[tuple[str, str], MethodStats] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> Instrumentation:
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+    def record_call(
+        self,
+        method: tuple[str, str] | None,
+        name: str | None,
+        bytes_read: int = 0,
+        bytes_written: int = 0,
+    ) -> None:
+        """Count a filesystem call made by ``method``, an (item type, name) pair.
+
+        ``name`` is None when only bytes moved, e.g. reading an open file.
+        """
+        with self._lock:
+            if name is not None:
+                self.calls[name] = self.calls.get(name, 0) + 1
+            self.bytes_read += bytes_read
+            self.bytes_written += bytes_written
+            if method is None:
+                return
+
+            stats = self._get_method_stats(method)
+            if name is not None:
+                stats.calls[name] = stats.calls.get(name, 0) + 1
+            stats.bytes_read += bytes_read
+            stats.bytes_written += bytes_written
+
+    def record_method(self, method: tuple[str, str], seconds: float) -> None:
+        """Count one call of ``method``, an (item type, name) pair."""
+        with self._lock:
+            stats = self._get_method_stats(method)
+            stats.count += 1
+            stats.seconds += seconds
+
+    def report(self) -> str:
+        """Format the measures as a table, slowest methods first."""
+        lines = [
+            f"{'method':<32}{'count':>8}{'seconds':>10}{'read':>12}{'written':>12}"
+            "  calls"
+        ]
+        for (item_type, name), stats in sorted(
+            self.methods.items(), key=lambda entry: -entry[1].seconds
+        ):
+            calls = ", ".join(f"{k}={v}" for k, v in sorted(stats.calls.items()))
+            lines.append(
+                f"{item_type + '.' + name:<32}{stats.count:>8}{stats.seconds:>10.4f}"
+                f"{stats.bytes_read:>12}{stats.bytes_written:>12}  {calls}"
+            )
+        calls = ", ".join(f"{k}={v}" for k, v in sorted(self.calls.items()))
+        lines.append(
+            f"{'total':<32}{'':>8}{'':>10}"
+            f"{self.bytes_read:>12}{self.bytes_written:>12}  {calls}"
+        )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.bytes_read = 0
+            self.bytes_written = 0
+            self.calls.clear()
+            self.methods.clear()
+
+    def start(self) -> None:
+        from wexample_file.helper.instrument import instrument_start
+
+        instrument_start(self)
+
+    def stop(self) -> None:
+        from wexample_file.helper.instrument import instrument_stop
+
+        instrument_stop(self)
+
+    def _get_method_stats(self, method: tuple[str, str]) -> MethodStats:
+        from wexample_file.classes.method_stats import MethodStats
+
+        stats = self.methods.get(method)
+        if stats is None:
+            stats = self.methods[method] = MethodStats()
+        return stats
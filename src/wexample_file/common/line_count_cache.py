@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Collection
+
+    from wexample_helpers.const.types import PathOrString
+
+
+class LineCountCache:
+    """Persistent index of per-file line counts, keyed by path, size and mtime.
+
+    A count is reused as long as the file's size and mtime_ns still match the
+    stat taken before it was read, so a rerun of a recursive count only reads
+    new and changed files. A file rewritten with the same size within the
+    filesystem's timestamp granularity is not detected.
+
+    Counts of compressed files also record whether they were taken from the
+    decompressed content, so counting with and without ``compression`` never
+    reuses the other mode's count.
+    """
+
+    def __init__(self) -> None:
+        import threading
+
+        # Path -> (size, mtime_ns, count, decompressed)
+        self._entries: dict[str, tuple[int, int, int, bool]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get(
+        self,
+        path: PathOrString,
+        stat_result: os.stat_result,
+        decompressed: bool = False,
+    ) -> int | None:
+        """Return the cached count if the file is unchanged since it was read.
+
+        ``decompressed`` tells whether the count wanted is the one of the
+        decompressed content; a count taken the other way is not returned.
+        """
+        entry = self._entries.get(str(path))
+        if entry is None or (entry[0], entry[1], entry[3]) != (
+            stat_result.st_size,
+            stat_result.st_mtime_ns,
+            decompressed,
+        ):
+            return None
+        return entry[2]
+
+    @classmethod
+    def load(cls, path: PathOrString) -> LineCountCache:
+        """Load a cache saved with ``save``; an unreadable file gives an empty cache."""
+        import json
+
+        cache = cls()
+        try:
+            with open(path, encoding="utf-8") as fh:
+                data = json.load(fh)
+        except (OSError, ValueError):
+            return cache
+
+        for file_path, (size, mtime_ns, count, decompressed) in data.items():
+            cache._entries[file_path] = (size, mtime_ns, count, decompressed)
+        return cache
+
+    def prune(self, root: PathOrString, seen: Collection[str], pattern: str) -> int:
+        """Drop the entries under ``root`` matching ``pattern`` that were not seen.
+
+        Returns the number of entries dropped, i.e. files deleted since the
+        previous count.
+        """
+        import os
+        from pathlib import PurePath
+
+        prefix = os.path.join(os.fspath(root), "")
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if key.startswith(prefix)
+                and key not in seen
+                and PurePath(key).match(pattern)
+            ]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def save(self, path: PathOrString) -> None:
+        import json
+
+        from wexample_file.common.local_file import LocalFile
+        from wexample_file.helper.storage import STORAGE_OS_BACKEND
+
+        with self._lock:
+            data = {key: list(entry) for key, entry in self._entries.items()}
+        # Entries describe files of the disk: saved there as plain JSON, the way
+        # load reads them, whatever the active backend or the extension.
+        LocalFile(path=path, backend=STORAGE_OS_BACKEND).write(
+            json.dumps(data), atomic=True, compression=False
+        )
+
+    def set(
+        self,
+        path: PathOrString,
+        stat_result: os.stat_result,
+        count: int,
+        decompressed: bool = False,
+    ) -> None:
+        """Store a count read from the content matching ``stat_result``."""
+        with self._lock:
+            self._entries[str(path)] = (
+                stat_result.st_size,
+                stat_result.st_mtime_ns,
+                count,
+                decompressed,
+            )
@@ -1,12 +1,24 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import os
+import stat
+from typing import TYPE_CHECKING, Any
+
+from wexample_file.enum.local_path_type import LocalPathType
 
 from .abstract_local_item_path import AbstractLocalItemPath
 
 if TYPE_CHECKING:
-    from enum.local_path_type import LocalPathType
+    from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping
+
+    from wexample_helpers.const.types import PathOrString
 
+    from wexample_file.classes.disk_usage import DiskUsage
+    from wexample_file.common.directory_watcher import DirectoryWatcher
+    from wexample_file.common.disk_usage_cache import DiskUsageCache
+    from wexample_file.common.fingerprint_cache import FingerprintCache
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.common.rename_plan import RenamePlan
     from wexample_file.exception.directory_not_found_exception import (
         DirectoryNotFoundException,
     )
@@ -19,46 +31,393 @@ class LocalDirectory(AbstractLocalItemPath):
     be a directory.
     """
 
+    async def acreate(self, parents: bool = True, exist_ok: bool = True) -> None:
+        """Async counterpart of ``create``."""
+        from wexample_file.helper.aio import aio_run
+
+        await aio_run(self.create, parents=parents, exist_ok=exist_ok)
+
+    async def aremove(self, parallel: bool = False, workers: int | None = None) -> None:
+        """Async counterpart of ``remove``; large trees no longer stall the loop."""
+        from wexample_file.helper.aio import aio_run
+
+        await aio_run(self.remove, parallel=parallel, workers=workers)
+
+    async def awalk(self, **kwargs: Any) -> AsyncIterator[LocalFile | LocalDirectory]:
+        """Async counterpart of ``walk``, accepting the same options.
+
+        Directory listings happen on the aio executor, items are handed over in
+        batches.
+        """
+        from wexample_file.helper.aio import aio_iterate
+
+        async for item in aio_iterate(self.walk(**kwargs), batch_size=256):
+            yield item
+
+    def change_extensions(
+        self,
+        extensions: Mapping[str, str],
+        workers: int | None = None,
+        journal: PathOrString | None = None,
+        **kwargs: Any,
+    ) -> RenamePlan:
+        """Change the extension of every file of the tree at once, see ``plan_renames``.
+
+        Returns the applied plan, holding the conflicts and errors. Extra options
+        (include, exclude, prune) filter the files like in ``walk``.
+        """
+        return self.plan_renames(extensions=extensions, **kwargs).apply(
+            workers=workers, journal=journal
+        )
+
+    def copy_to(
+        self, target: PathOrString | LocalDirectory, workers: int | None = None
+    ) -> LocalDirectory:
+        """Copy the content of this directory into ``target`` and return it.
+
+        Files are copied over a thread pool of ``workers`` threads, in the kernel
+        (copy_file_range/sendfile) when supported, with their permission bits
+        and times. Symlinks are recreated as is, existing files are overwritten.
+        When either side uses a storage backend other than the OS, files are
+        streamed from one backend to the other, with their permission bits only.
+
+        Raises:
+            DirectoryNotFoundException: If this directory doesn't exist.
+        """
+        from wexample_file.helper.directory import directory_copy
+
+        if not isinstance(target, LocalDirectory):
+            target = LocalDirectory(path=target, backend=self.backend)
+        if not self.is_dir():
+            raise self._not_found_exc()
+
+        if self.backend.native and target.backend.native:
+            directory_copy(self.path, target.path, workers=workers)
+        else:
+            self._copy_between_backends(target)
+        target._invalidate_stat()
+        return target
+
     def create(self, parents: bool = True, exist_ok: bool = True) -> None:
-        if self.path.exists() and self.path.is_file():
+        if self.is_file():
             return None
 
-        self.path.mkdir(parents=parents, exist_ok=exist_ok)
+        self.backend.mkdir(self.path, parents=parents, exist_ok=exist_ok)
+        self._invalidate_stat()
 
-    def item_type(self) -> LocalPathType:
-        from enum.local_path_type import LocalPathType
+    def disk_usage(
+        self, workers: int | None = 1, cache: DiskUsageCache | None = None
+    ) -> DiskUsage:
+        """Return the total size and file count of the tree, per extension too.
+
+        Sizes are read from the scandir entries in a single pass. With ``workers``
+        other than 1, subdirectories are scanned in parallel. A DiskUsageCache
+        kept between calls makes a repeat run only list directories that changed.
+        With a storage backend other than the OS, the tree is walked through the
+        backend and both are ignored.
+
+        Raises:
+            DirectoryNotFoundException: If this directory doesn't exist.
+        """
+        from wexample_file.helper.directory import directory_disk_usage
+
+        if not self.is_dir():
+            raise self._not_found_exc()
+        if not self.backend.native:
+            return self._disk_usage_walk()
+
+        return directory_disk_usage(self.path, workers=workers, cache=cache)
+
+    def hash_tree(
+        self,
+        algorithm: str = "sha256",
+        workers: int | None = None,
+        cache: FingerprintCache | None = None,
+    ) -> str:
+        """Return a Merkle-style digest of the whole tree.
+
+        Two directories have the same digest when they hold the same names,
+        kinds and contents, whatever their location. Files are hashed over a
+        thread pool; with a FingerprintCache unchanged files are not read again.
+        With a storage backend other than the OS, files are read through the
+        backend, in turn, and the cache is ignored.
+
+        Raises:
+            DirectoryNotFoundException: If this directory doesn't exist.
+        """
+        from wexample_file.helper.hash import hash_tree
+
+        if not self.is_dir():
+            raise self._not_found_exc()
+        if not self.backend.native:
+            return self._hash_tree_walk(algorithm)
+
+        return hash_tree(self.path, algorithm, workers=workers, cache=cache)
 
+    def item_type(self) -> LocalPathType:
         return LocalPathType.DIRECTORY
 
-    def remove(self) -> None:
+    def iter_files(
+        self,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        prune: Iterable[str] | None = None,
+        max_depth: int | None = None,
+        follow_symlinks: bool = False,
+    ) -> Iterator[LocalFile]:
+        """Lazily yield every file of the tree, see ``walk`` for the options."""
+        return self.walk(
+            include=include,
+            exclude=exclude,
+            prune=prune,
+            max_depth=max_depth,
+            follow_symlinks=follow_symlinks,
+            directories=False,
+        )
+
+    def plan_renames(
+        self,
+        extensions: Mapping[str, str] | None = None,
+        rename: Callable[[LocalFile], PathOrString | None] | None = None,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        prune: Iterable[str] | None = None,
+    ) -> RenamePlan:
+        """Compute the renames of the files of the tree in one scan, without running them.
+
+        Conflicts are detected up front, see RenamePlan.from_renames; run the plan
+        with ``apply``. Files are filtered like in ``walk``.
+
+        Parameters:
+            extensions: Old extension -> new one, without dots. Old ones are
+                compared lowercased, an empty new one removes the extension.
+            rename: Function returning the new name or path of a file (relative
+                to its directory), or None to leave it.
+
+        Raises:
+            ValueError: If not exactly one of ``extensions`` and ``rename`` is given.
+        """
+        from wexample_file.common.rename_plan import RenamePlan
+
+        if (extensions is None) == (rename is None):
+            raise ValueError("Give either extensions or rename")
+        if extensions is not None:
+            extensions = {
+                old.lstrip(".").lower(): new.lstrip(".")
+                for old, new in extensions.items()
+            }
+
+        renames = []
+        for local_file in self.walk(
+            include=include, exclude=exclude, prune=prune, directories=False
+        ):
+            path = local_file.path
+            if rename is not None:
+                target = rename(local_file)
+                if target is None:
+                    continue
+                target = path.parent / target
+            else:
+                suffix = path.suffix
+                new = extensions.get(suffix[1:].lower()) if suffix else None
+                if new is None:
+                    continue
+                target = path.with_name(path.stem + (f".{new}" if new else ""))
+            renames.append((path, target))
+
+        return RenamePlan.from_renames(renames, backend=self.backend)
+
+    def remove(self, parallel: bool = False, workers: int | None = None) -> None:
         """Delete the directory recursively if it exists; no-op if it doesn't.
 
         This method is idempotent and will not raise if the directory is missing.
+
+        Parameters:
+            parallel: Unlink files over a thread pool, then remove directories
+                bottom-up, instead of a single threaded rmtree. Mostly useful on
+                large trees or high latency storage.
+            workers: Size of the thread pool used in parallel mode.
         """
-        if not self.path.exists():
+        # Always take a fresh snapshot, a stale one must not turn this into a no-op
+        stat_result = self.refresh()
+        if stat_result is None:
             return
-        if self.path.is_dir():
+        if stat.S_ISDIR(stat_result.st_mode):
             # Remove contents recursively
-            import shutil
+            if parallel and self.backend.native:
+                from wexample_file.helper.directory import directory_remove
 
-            shutil.rmtree(self.path)
+                directory_remove(self.path, workers=workers)
+            else:
+                self.backend.rmtree(self.path)
         else:
             # If for some reason it's not a dir anymore, best-effort unlink
+            self.backend.unlink(self.path, missing_ok=True)
+        self._invalidate_stat()
+
+    def walk(
+        self,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+        prune: Iterable[str] | None = None,
+        max_depth: int | None = None,
+        follow_symlinks: bool = False,
+        files: bool = True,
+        directories: bool = True,
+    ) -> Iterator[LocalFile | LocalDirectory]:
+        """Lazily yield the content of the tree as LocalFile/LocalDirectory objects.
+
+        Built on os.scandir: entry types come from the directory listing and items
+        are created with ``from_resolved``, so walking costs no stat per entry.
+        Symlinked entries keep their path inside the tree.
+
+        Parameters:
+            include: Glob patterns an entry must match to be yielded. Patterns
+                with a "/" match the path relative to this directory, the others
+                the entry name.
+            exclude: Glob patterns of entries not to yield.
+            prune: Glob patterns of directories neither descended into nor
+                yielded, e.g. (".git", "node_modules").
+            max_depth: Deepest level yielded, 1 being the direct children.
+            follow_symlinks: Descend into symlinked directories.
+            files: Yield files.
+            directories: Yield directories.
+        """
+        from pathlib import Path
+
+        from wexample_file.common.local_file import LocalFile
+        from wexample_file.helper.directory import directory_walk
+
+        backend = self.backend
+        # Joining names onto the parent Path is cheaper than parsing each path
+        parents: dict[str, Path] = {str(self.path): self.path}
+        for entry in directory_walk(
+            self.path,
+            include=include,
+            exclude=exclude,
+            prune=prune,
+            max_depth=max_depth,
+            follow_symlinks=follow_symlinks,
+            scandir=None if backend.native else backend.scandir,
+        ):
             try:
-                self.path.unlink()
-            except FileNotFoundError:
-                pass
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            parent = parents.get(entry.path[: -len(entry.name) - 1])
+            path = Path(entry.path) if parent is None else parent / entry.name
+            if is_dir:
+                parents[entry.path] = path
+                if directories:
+                    yield LocalDirectory.from_resolved(path, backend=backend)
+            elif files:
+                yield LocalFile.from_resolved(path, backend=backend)
+
+    def watch(
+        self,
+        recursive: bool = True,
+        prune: Iterable[str] | None = None,
+        debounce: float = 0.05,
+        **kwargs: Any,
+    ) -> DirectoryWatcher:
+        """Watch the tree for created, modified and deleted files and directories.
+
+        Returns a DirectoryWatcher yielding FileChange events with LocalFile /
+        LocalDirectory items; use it as a context manager to release its
+        resources. Bursts of events on the same path are debounced and
+        coalesced. Relies on inotify on Linux, on snapshot polling elsewhere.
+
+        Parameters:
+            recursive: Watch subdirectories too.
+            prune: Glob patterns of directories not to watch (e.g. ".git").
+            debounce: Quiet time closing a batch of events, in seconds.
+            kwargs: Other DirectoryWatcher options (max_delay, poll_interval,
+                use_inotify).
+
+        Raises:
+            DirectoryNotFoundException: If the directory doesn't exist.
+            UnsupportedBackendException: With a storage backend other than the OS.
+        """
+        from wexample_file.common.directory_watcher import DirectoryWatcher
+
+        if not self.backend.native:
+            from wexample_file.exception.unsupported_backend_exception import (
+                UnsupportedBackendException,
+            )
 
-    def _check_exists(self):
-        from wexample_file.exception.not_a_directory_exception import (
-            NotADirectoryException,
+            raise UnsupportedBackendException(
+                self.path, "watch", self.backend.__class__.__name__
+            )
+        if not self.is_dir():
+            raise self._not_found_exc()
+
+        return DirectoryWatcher(
+            self, recursive=recursive, prune=prune, debounce=debounce, **kwargs
         )
 
-        super()._check_exists()
+    def _check_type(self, stat_result: os.stat_result | None) -> None:
+        if stat_result is not None and not stat.S_ISDIR(stat_result.st_mode):
+            from wexample_file.exception.not_a_directory_exception import (
+                NotADirectoryException,
+            )
 
-        if self.path.exists() and not self.path.is_dir():
             raise NotADirectoryException(self.path)
-        return self.path
+
+    def _copy_between_backends(self, target: LocalDirectory) -> None:
+        """Copy the tree item by item, parents first, through the backends."""
+        from wexample_file.common.local_file import LocalFile
+
+        target.create()
+        for item in self.walk():
+            destination = target.path / item.path.relative_to(self.path)
+            if isinstance(item, LocalDirectory):
+                LocalDirectory.from_resolved(
+                    destination, backend=target.backend
+                ).create()
+            else:
+                LocalFile.from_resolved(
+                    destination, backend=target.backend
+                ).write_stream(
+                    item.iter_chunks(), make_parents=False, compression=False
+                )
+            target.backend.chmod(destination, stat.S_IMODE(item.get_stat().st_mode))
+
+    def _disk_usage_walk(self) -> DiskUsage:
+        """Same as ``directory_disk_usage``, through the storage backend."""
+        from wexample_file.classes.disk_usage import DiskUsage
+        from wexample_file.helper.path import path_name_get_extension
+
+        usage = DiskUsage()
+        for item in self.walk():
+            if isinstance(item, LocalDirectory):
+                usage.directory_count += 1
+                continue
+            stat_result = self.backend.stat(item.path, follow_symlinks=False)
+            if stat_result is not None:
+                usage.add_file(
+                    path_name_get_extension(item.path.name), stat_result.st_size
+                )
+        return usage
+
+    def _hash_tree_walk(self, algorithm: str) -> str:
+        """Same as the ``hash_tree`` helper, through the storage backend."""
+        from wexample_file.helper.hash import hash_tree_digest
+
+        root = str(self.path)
+        children: dict[str, list[tuple[bytes, str, str]]] = {root: []}
+        digests: dict[str, str] = {}
+        for item in self.walk():
+            path = str(item.path)
+            parent = children[str(item.path.parent)]
+            if isinstance(item, LocalDirectory):
+                children[path] = []
+                parent.append((b"d", item.path.name, path))
+            else:
+                digests[path] = item.hash(algorithm)
+                parent.append((b"f", item.path.name, path))
+
+        return hash_tree_digest(root, children, digests, algorithm)
 
     def _not_found_exc(self) -> DirectoryNotFoundException:
         from wexample_file.exception.directory_not_found_exception import (
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import io
+import os
+import stat
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from wexample_file.enum.local_path_type import LocalPathType
+from wexample_file.helper.codec import CODEC_BUFFER_SIZE
 
 from .abstract_local_item_path import AbstractLocalItemPath
 
 if TYPE_CHECKING:
-    from enum.local_path_type import LocalPathType
+    import mmap
+    from collections.abc import AsyncIterator, Iterable, Iterator
+    from typing import IO
 
+    from wexample_file.common.fingerprint_cache import FingerprintCache
     from wexample_file.exception.file_not_found_exception import FileNotFoundException
 
 
@@ -15,15 +25,175 @@ class LocalFile(AbstractLocalItemPath):
 
     The path is stored as a resolved absolute Path. If the path exists, it must
     be a file.
+
+    Files with a compressed extension (".gz", ".bz2", ".xz", ".zst") are handled
+    by their ``compression`` option. Text methods (``read``, ``write``,
+    ``iter_lines``, ``tail``...) default to True and see the decompressed
+    content, while byte methods (``iter_chunks``, ``write_bytes``,
+    ``write_stream``) default to False and see the stored bytes. ``open`` and
+    ``has_content`` follow the mode and the content type they are given.
     """
 
+    async def afollow(
+        self,
+        encoding: str = "utf-8",
+        keep_ends: bool = False,
+        from_start: bool = False,
+        poll_interval: float = 0.25,
+        timeout: float | None = None,
+    ) -> AsyncIterator[str]:
+        """Async counterpart of ``follow``; the loop is free between two polls.
+
+        Following starts on the first iteration.
+        """
+        import asyncio
+        import time
+
+        from wexample_file.helper.aio import aio_close, aio_submit
+
+        reader = self._follow_reader(encoding, keep_ends, from_start)
+        pending = None
+        try:
+            last_line_time = time.monotonic()
+            while True:
+                pending = aio_submit(next, reader)
+                lines = await asyncio.wrap_future(pending)
+                if lines:
+                    for line in lines:
+                        yield line
+                    last_line_time = time.monotonic()
+                elif timeout is not None and (
+                    time.monotonic() - last_line_time >= timeout
+                ):
+                    return
+                else:
+                    await asyncio.sleep(poll_interval)
+        finally:
+            # A poll may still be running if the task was cancelled meanwhile
+            aio_close(reader, pending)
+
+    async def aiter_chunks(self, size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        """Async counterpart of ``iter_chunks``, reads happen on the aio executor."""
+        from wexample_file.helper.aio import aio_iterate
+
+        async for chunk in aio_iterate(self.iter_chunks(size)):
+            yield chunk
+
+    async def aiter_lines(
+        self, encoding: str = "utf-8", keep_ends: bool = False
+    ) -> AsyncIterator[str]:
+        """Async counterpart of ``iter_lines``, lines are read in batches."""
+        from wexample_file.helper.aio import aio_iterate
+
+        async for line in aio_iterate(
+            self.iter_lines(encoding=encoding, keep_ends=keep_ends), batch_size=256
+        ):
+            yield line
+
+    async def aread(self, encoding: str = "utf-8") -> str | None:
+        """Async counterpart of ``read``."""
+        from wexample_file.helper.aio import aio_run
+
+        return await aio_run(self.read, encoding=encoding)
+
+    async def aremove(self) -> None:
+        """Async counterpart of ``remove``."""
+        from wexample_file.helper.aio import aio_run
+
+        await aio_run(self.remove)
+
+    async def awrite(self, content: str, **kwargs: Any) -> bool:
+        """Async counterpart of ``write``, accepting the same options."""
+        from wexample_file.helper.aio import aio_run
+
+        return await aio_run(self.write, content, **kwargs)
+
+    async def awrite_bytes(self, content: bytes, **kwargs: Any) -> bool:
+        """Async counterpart of ``write_bytes``, accepting the same options."""
+        from wexample_file.helper.aio import aio_run
+
+        return await aio_run(self.write_bytes, content, **kwargs)
+
     def change_extension(self, new_extension: str) -> None:
         # Normalize extension: allow callers to pass with or without dot
         ext = new_extension.lstrip(".")
         suffix = f".{ext}" if ext else ""
         target = self.path.with_suffix(suffix)
 
-        self.path.replace(target)
+        self.backend.replace(self.path, target)
+        self._invalidate_stat()
+
+    def count_lines(self, compression: bool = True) -> int | None:
+        """Count lines through a memory map, or return None if the file doesn't exist.
+
+        Lines are counted like when iterating the file in text mode. With
+        ``compression``, compressed files are counted while decompressing them.
+        """
+        from wexample_file.helper.line import LINE_COUNT_CHUNK_SIZE, line_count_chunks
+
+        if not self.is_file():
+            return None
+
+        if compression and self.get_codec() is not None:
+            return line_count_chunks(
+                self.iter_chunks(LINE_COUNT_CHUNK_SIZE, compression=True)
+            )
+
+        with self.mmap() as view:
+            return line_count_chunks(
+                view[offset : offset + LINE_COUNT_CHUNK_SIZE]
+                for offset in range(0, len(view), LINE_COUNT_CHUNK_SIZE)
+            )
+
+    def find(self, needle: bytes, start: int = 0) -> int | None:
+        """Return the offset of the first occurrence of ``needle`` at or after ``start``.
+
+        Returns -1 when not found, or None if the file doesn't exist. Only the pages
+        scanned up to the match are read.
+        """
+        if not self.is_file():
+            return None
+
+        with self.mmap() as view:
+            return view.find(needle, start)
+
+    def follow(
+        self,
+        encoding: str = "utf-8",
+        keep_ends: bool = False,
+        from_start: bool = False,
+        poll_interval: float = 0.25,
+        timeout: float | None = None,
+    ) -> Iterator[str]:
+        """Yield the lines appended to the file from now on, as they are written.
+
+        The file is polled with a stat every ``poll_interval`` seconds and only the
+        bytes past the last offset read are read, so the cost stays proportional
+        to the new data. A file truncated in place is read again from its start;
+        after a rotation (another inode at the path), the previous file is read
+        to its end then the new one from its start. A missing file is waited
+        for. A line is only yielded once its "\\n" is written.
+
+        Parameters:
+            from_start: Yield the current content first, instead of starting at
+                the end of the file.
+            poll_interval: Seconds to wait between two polls without new data.
+            timeout: Stop once no new line arrived for that many seconds; follow
+                forever when None.
+        """
+        reader = self._follow_reader(encoding, keep_ends, from_start)
+        # First poll right away, so that lines appended after this call are never
+        # missed, even before the first iteration.
+        return self._follow_wait(reader, next(reader), poll_interval, timeout)
+
+    def get_codec(self) -> str | None:
+        """Return the compression codec matching the extension, e.g. "gzip" for ".gz".
+
+        Returns None for files not compressed, see helper/codec.py.
+        """
+        from wexample_file.helper.codec import codec_from_path
+
+        return codec_from_path(self.path)
 
     def get_extension(self) -> str:
         """Return the last suffix without the leading dot.
@@ -34,85 +204,722 @@ class LocalFile(AbstractLocalItemPath):
             "README" -> ""
             Dotfiles without other dots (e.g. ".env") -> "env"
         """
-        # Primary: use pathlib suffix when present
-        suf = self.path.suffix
-        if suf.startswith("."):
-            return suf[1:]
+        from wexample_file.helper.path import path_get_extension
+
+        return path_get_extension(self.path)
+
+    def has_content(
+        self,
+        content: str | bytes,
+        encoding: str = "utf-8",
+        cache: FingerprintCache | None = None,
+        compression: bool | None = None,
+        level: int | None = None,
+    ) -> bool:
+        """Whether the file currently holds exactly ``content``.
+
+        Sizes are compared first from the stat; the file is then read and
+        compared in chunks, unless ``cache`` has the digest of the current file.
+        Content is compared as it would be written by ``write`` or
+        ``write_bytes``: with ``compression``, by default for text only, files
+        with a compressed extension are compared to ``content`` compressed at
+        ``level``.
+        """
+        if compression is None:
+            compression = isinstance(content, str)
+        if isinstance(content, str):
+            content = self._encode_text(content, encoding)
+        if self._compresses(compression):
+            from wexample_file.helper.codec import codec_compress
+
+            content = codec_compress(content, self.get_codec(), level)
+
+        stat_result = self.get_stat()
+        if (
+            stat_result is None
+            or not stat.S_ISREG(stat_result.st_mode)
+            or stat_result.st_size != len(content)
+        ):
+            return False
+
+        if cache is not None:
+            digest = cache.get(self.path, stat_result, "sha256")
+            if digest is not None:
+                import hashlib
+
+                return hashlib.sha256(content).hexdigest() == digest
+
+        view = memoryview(content)
+        offset = 0
+        with self.backend.open(self.path, "rb") as fh:
+            while chunk := fh.read(1024 * 1024):
+                if view[offset : offset + len(chunk)] != chunk:
+                    return False
+                offset += len(chunk)
+        if offset != len(content):
+            return False
+
+        if cache is not None:
+            import hashlib
+
+            # Next time, the comparison won't need to read the file
+            cache.set(
+                self.path, stat_result, "sha256", hashlib.sha256(content).hexdigest()
+            )
+        return True
+
+    def hash(
+        self,
+        algorithm: str = "sha256",
+        chunk_size: int = 1024 * 1024,
+        cache: FingerprintCache | None = None,
+    ) -> str | None:
+        """Return the hex digest of the content, or None if the file doesn't exist.
+
+        The file is streamed in ``chunk_size`` reads. With a FingerprintCache, an
+        unchanged file (same size, mtime and inode) costs a single stat.
+        """
+        if not self.backend.native:
+            import hashlib
 
-        # Special-case: dotfiles like ".env" (no formal suffix)
-        name = self.path.name
-        if name.startswith(".") and len(name) > 1 and "." not in name[1:]:
-            return name[1:]
+            if not self.is_file():
+                return None
+            digest = hashlib.new(algorithm)
+            for chunk in self.iter_chunks(chunk_size):
+                digest.update(chunk)
+            return digest.hexdigest()
 
-        return ""
+        from wexample_file.helper.hash import hash_file
+
+        try:
+            return hash_file(self.path, algorithm, chunk_size, cache=cache)
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return None
 
     def is_empty(self) -> bool:
-        from pathlib import Path
+        size = self.get_size()
+        if size is None:
+            import errno
 
-        return Path(self.path).stat().st_size == 0
+            raise FileNotFoundError(
+                errno.ENOENT, os.strerror(errno.ENOENT), str(self.path)
+            )
 
-    def item_type(self) -> LocalPathType:
-        from enum.local_path_type import LocalPathType
+        return size == 0
 
+    def item_type(self) -> LocalPathType:
         return LocalPathType.FILE
 
-    def read(self, encoding: str = "utf-8") -> str | None:
+    def iter_chunks(
+        self, size: int = 64 * 1024, compression: bool = False
+    ) -> Iterator[bytes]:
+        """Yield the raw file content in chunks of at most ``size`` bytes.
+
+        Yields nothing if the file doesn't exist. With ``compression``, the content
+        of compressed files is yielded decompressed.
+        """
+        if not self.is_file():
+            return
+
+        if compression and self.get_codec() is not None:
+            with self.open("rb", compression=True) as fh:
+                while chunk := fh.read(size):
+                    yield chunk
+            return
+
+        with self.backend.open(self.path, "rb", buffering=0) as fh:
+            while chunk := fh.read(size):
+                yield chunk
+
+    def iter_lines(
+        self, encoding: str = "utf-8", keep_ends: bool = False, compression: bool = True
+    ) -> Iterator[str]:
+        """Yield the file content line by line, or nothing if it doesn't exist.
+
+        Line endings are normalized to "\\n" like in ``read``, and stripped unless
+        ``keep_ends`` is set. Compressed files are decompressed, see ``open``.
+        """
+        if not self.is_file():
+            return
+
+        with (
+            self.open(encoding=encoding)
+            if compression and self.get_codec() is not None
+            else self.backend.open(self.path, encoding=encoding)
+        ) as fh:
+            for line in fh:
+                if not keep_ends and line.endswith("\n"):
+                    line = line[:-1]
+                yield line
+
+    def iter_lines_reverse(
+        self,
+        encoding: str = "utf-8",
+        keep_ends: bool = False,
+        block_size: int = 64 * 1024,
+        compression: bool = True,
+    ) -> Iterator[str]:
+        """Yield the lines last to first, or nothing if the file doesn't exist.
+
+        The file is read backwards ``block_size`` bytes at a time, so only the
+        blocks holding the lines consumed are read. Lines end at "\\n" ("\\r\\n"
+        is normalized to "\\n"), so the encoding must be ASCII compatible, e.g.
+        UTF-8 or latin-1.
+
+        Compressed files can't be read backwards: they are decompressed from the
+        start and all their lines are kept in memory.
+        """
+        if not self.is_file():
+            return
+
+        if compression and self.get_codec() is not None:
+            lines = list(self.iter_lines(encoding=encoding, keep_ends=keep_ends))
+            yield from reversed(lines)
+            return
+
+        with self.backend.open(self.path, "rb") as fh:
+            position = fh.seek(0, io.SEEK_END)
+            # Pieces of the line being assembled, last one first
+            parts: list[bytes] = []
+            # Whether the line being assembled is followed by a "\n"
+            terminated = False
+            while position > 0:
+                size = min(block_size, position)
+                position -= size
+                fh.seek(position)
+                block = fh.read(size)
+
+                end = len(block)
+                while (index := block.rfind(b"\n", 0, end)) != -1:
+                    parts.append(block[index + 1 : end])
+                    line = b"".join(reversed(parts))
+                    parts.clear()
+                    # Nothing follows the last "\n" of a file ending with one
+                    if line or terminated:
+                        yield self._decode_line(line, terminated, encoding, keep_ends)
+                    terminated = True
+                    end = index
+                parts.append(block[:end])
+
+            line = b"".join(reversed(parts))
+            if line or terminated:
+                yield self._decode_line(line, terminated, encoding, keep_ends)
+
+    def iter_text_chunks(
+        self,
+        size: int = 64 * 1024,
+        encoding: str = "utf-8",
+        errors: str = "strict",
+        compression: bool = True,
+    ) -> Iterator[str]:
+        """Yield the decoded file content in chunks, or nothing if it doesn't exist.
+
+        Bytes are read ``size`` at a time and fed to an incremental decoder, so a
+        multibyte character or a "\\r\\n" split across two reads is never broken.
+        Compressed files are decompressed first.
+        """
+        import codecs
+        import io
+
+        decoder = io.IncrementalNewlineDecoder(
+            codecs.getincrementaldecoder(encoding)(errors=errors), translate=True
+        )
+        for chunk in self.iter_chunks(size, compression=compression):
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+
+        text = decoder.decode(b"", final=True)
+        if text:
+            yield text
+
+    @contextmanager
+    def mmap(self) -> Iterator[mmap.mmap | bytes]:
+        """Map the file read-only into memory for the duration of the context.
+
+        Slicing the map only touches the pages covering the requested range. Empty
+        files cannot be mapped, so an empty ``bytes`` object is provided instead,
+        like the whole content for storage backends other than the OS.
+
+        Raises:
+            FileNotFoundException: If the file doesn't exist.
+            NotAFileException: If the path is not a regular file.
+        """
+        import mmap
+
+        from wexample_file.exception.not_a_file_exception import NotAFileException
+
+        if not self.exists():
+            raise self._not_found_exc()
+        if not self.is_file():
+            raise NotAFileException(self.path)
+
+        if not self.backend.native:
+            with self.backend.open(self.path, "rb") as fh:
+                yield fh.read()
+            return
+
+        with self.backend.open(self.path, "rb") as fh:
+            if os.fstat(fh.fileno()).st_size == 0:
+                yield b""
+                return
+
+            view = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield view
+            finally:
+                view.close()
+
+    @contextmanager
+    def open(
+        self,
+        mode: str = "r",
+        encoding: str = "utf-8",
+        compression: bool | None = None,
+        level: int | None = None,
+        buffer_size: int = CODEC_BUFFER_SIZE,
+    ) -> Iterator[IO]:
+        """Open the file as a stream, in text or binary mode ("r", "wb", "a"...).
+
+        With ``compression``, by default in text modes only, files with a compressed extension (".gz", ".bz2",
+        ".xz", ".zst") are decompressed while read and compressed at ``level``
+        while written, without ever holding the whole content in memory.
+        ``buffer_size`` is the size of the buffer batching the calls to the
+        codec. Writing creates the parent directories.
+
+        Raises:
+            ValueError: If the mode is not a read, write or append one.
+        """
+        from wexample_file.helper.codec import codec_reader, codec_writer
+
+        binary = "b" in mode
+        kind = mode.replace("b", "").replace("t", "")
+        if kind not in ("r", "w", "a"):
+            raise ValueError(f"unsupported mode: {mode!r}")
+
+        if compression is None:
+            compression = not binary
+        codec = self.get_codec() if compression else None
+        raw_mode = mode if codec is None else f"{kind}b"
+        raw_encoding = None if binary or codec is not None else encoding
+        if kind == "r":
+            opened = self.backend.open(self.path, raw_mode, encoding=raw_encoding)
+        else:
+            opened = self._open_for_write(raw_mode, raw_encoding, True, False, False)
+
+        with opened as fh:
+            if codec is None:
+                yield fh
+                return
+
+            stream = (
+                codec_reader(fh, codec, buffer_size)
+                if kind == "r"
+                else codec_writer(fh, codec, level, buffer_size)
+            )
+            if not binary:
+                stream = io.TextIOWrapper(stream, encoding=encoding)
+            with stream:
+                yield stream
+
+    def read(self, encoding: str = "utf-8", compression: bool = True) -> str | None:
         """Read and return the file content as text, or None if it doesn't exist.
 
         Parameters:
             encoding: Text encoding used to decode file content. Defaults to 'utf-8'.
+            compression: Decompress files with a compressed extension, see ``open``.
         """
-        if not self.path.exists() or not self.path.is_file():
+        if not self.is_file():
             return None
 
-        return self.path.read_text(encoding=encoding)
+        if compression and self.get_codec() is not None:
+            with self.open(encoding=encoding) as fh:
+                return fh.read()
+
+        with self.backend.open(self.path, encoding=encoding) as fh:
+            return fh.read()
+
+    def read_range(self, offset: int, length: int) -> bytes | None:
+        """Return up to ``length`` bytes starting at ``offset``.
+
+        Returns None if the file doesn't exist, and fewer bytes when the range goes
+        past the end of the file.
+        """
+        if not self.is_file():
+            return None
+
+        with self.mmap() as view:
+            return view[offset : offset + length]
 
     def remove(self) -> None:
         """Delete the file if it exists; no-op if it doesn't.
 
         This method is idempotent and will not raise if the file is missing.
         """
-        try:
-            # unlink(missing_ok=True) is available in Python 3.8+
-            self.path.unlink(missing_ok=True)
-        except TypeError:
-            # Fallback for older Python: check existence first
-            if self.path.exists():
-                self.path.unlink()
+        self.backend.unlink(self.path, missing_ok=True)
+        self._invalidate_stat()
+
+    def tail(
+        self,
+        n: int = 10,
+        encoding: str = "utf-8",
+        keep_ends: bool = False,
+        compression: bool = True,
+    ) -> list[str] | None:
+        """Return the last ``n`` lines, or None if the file doesn't exist.
+
+        Only the end of the file is read, backwards, see ``iter_lines_reverse``.
+        Compressed files are decompressed from the start instead, keeping only
+        the last ``n`` lines in memory.
+        """
+        from itertools import islice
+
+        if not self.is_file():
+            return None
+
+        if compression and self.get_codec() is not None:
+            from collections import deque
+
+            return list(
+                deque(self.iter_lines(encoding=encoding, keep_ends=keep_ends), n)
+            )
+
+        lines = list(
+            islice(self.iter_lines_reverse(encoding=encoding, keep_ends=keep_ends), n)
+        )
+        lines.reverse()
+        return lines
 
     def touch(self, parents: bool = True, exist_ok: bool = True) -> bool:
         if parents:
-            self.path.parent.mkdir(parents=True, exist_ok=True)
-        if self.path.exists() or self.path.is_dir():
+            self.backend.mkdir(self.path.parent, parents=True, exist_ok=True)
+        if self.exists():
             return False
 
-        self.path.touch(exist_ok=exist_ok)
+        self.backend.touch(self.path, exist_ok=exist_ok)
+        self._invalidate_stat()
         return True
 
     def write(
-        self, content: str, encoding: str = "utf-8", make_parents: bool = True
+        self,
+        content: str,
+        encoding: str = "utf-8",
+        make_parents: bool = True,
+        atomic: bool = False,
+        fsync: bool = False,
+        only_if_changed: bool = False,
+        cache: FingerprintCache | None = None,
+        compression: bool = True,
+        level: int | None = None,
+        buffer_size: int = CODEC_BUFFER_SIZE,
+    ) -> bool:
+        """Write text content to the file, creating it if necessary.
+
+        Returns whether the file was written.
+
+        Parameters:
+            atomic: Write into a temporary file next to the target and move it over
+                the target once complete, so readers and crashes never leave a
+                partially written file behind.
+            fsync: Flush the content to disk before returning. In atomic mode the
+                parent directory is synced too, so the rename itself is durable.
+            only_if_changed: Leave the file untouched (mtime included) when it
+                already holds this content. Sizes are compared first, then the
+                content, or its sha256 when ``cache`` knows the current file.
+            cache: FingerprintCache updated with the digest of what was written,
+                so that an unchanged file later costs a single stat to detect.
+            compression: Compress files with a compressed extension, at ``level``
+                (the codec default when None). Compressed output is deterministic,
+                so ``only_if_changed`` compares the compressed bytes.
+            buffer_size: Size of the buffer in front of the compressor.
+
+        Atomic mode only adds a rename and stays close to an in-place write, while
+        fsync waits for the disk and dominates the cost, especially combined with
+        atomic mode which syncs the directory too. See
+        benchmarks/write_durability.py to measure it on a given filesystem.
+        """
+        if only_if_changed or cache is not None or self._compresses(compression):
+            return self.write_bytes(
+                self._encode_text(content, encoding),
+                make_parents=make_parents,
+                atomic=atomic,
+                fsync=fsync,
+                only_if_changed=only_if_changed,
+                cache=cache,
+                compression=compression,
+                level=level,
+                buffer_size=buffer_size,
+            )
+
+        with self._open_for_write("w", encoding, make_parents, atomic, fsync) as fh:
+            fh.write(content)
+        return True
+
+    def write_bytes(
+        self,
+        content: bytes,
+        make_parents: bool = True,
+        atomic: bool = False,
+        fsync: bool = False,
+        only_if_changed: bool = False,
+        cache: FingerprintCache | None = None,
+        compression: bool = False,
+        level: int | None = None,
+        buffer_size: int = CODEC_BUFFER_SIZE,
+    ) -> bool:
+        """Write binary content to the file, with the same options as ``write``.
+
+        Content is written as is unless ``compression`` is set, bytes being often
+        already compressed.
+        """
+        if self._compresses(compression):
+            from wexample_file.helper.codec import codec_compress
+
+            content = codec_compress(content, self.get_codec(), level, buffer_size)
+
+        if only_if_changed and self.has_content(
+            content, cache=cache, compression=False
+        ):
+            return False
+
+        with self._open_for_write("wb", None, make_parents, atomic, fsync) as fh:
+            fh.write(content)
+
+        if cache is not None:
+            import hashlib
+
+            cache.set(
+                self.path,
+                self.backend.stat(self.path),
+                "sha256",
+                hashlib.sha256(content).hexdigest(),
+            )
+        return True
+
+    def write_stream(
+        self,
+        chunks: Iterable[str] | Iterable[bytes],
+        encoding: str = "utf-8",
+        make_parents: bool = True,
+        atomic: bool = False,
+        fsync: bool = False,
+        compression: bool = False,
+        level: int | None = None,
+        buffer_size: int = CODEC_BUFFER_SIZE,
     ) -> None:
-        """Write text content to the file, creating it if necessary."""
-        from wexample_file.exception.not_a_file_exception import NotAFileException
+        """Write content produced chunk by chunk, without joining it in memory first.
 
-        if make_parents:
-            self.path.parent.mkdir(parents=True, exist_ok=True)
-        if self.path.exists() and self.path.is_dir():
-            raise NotAFileException(self.path)
-        self.path.write_text(content, encoding=encoding)
+        Chunks are written as text or bytes depending on the type of the first one.
+        Options are the same as for ``write``; in atomic mode the target is only
+        replaced once the iterable is exhausted. With ``compression``, files with
+        a compressed extension are compressed on the fly, bytes chunks included.
+        """
+        from itertools import chain
 
-    def _check_exists(self) -> None:
-        from wexample_file.exception.not_a_file_exception import NotAFileException
+        from wexample_file.helper.codec import codec_writer
+
+        iterator = iter(chunks)
+        first = next(iterator, "")
+        binary = isinstance(first, bytes)
+        codec = self.get_codec() if compression else None
+        mode = "wb" if binary or codec is not None else "w"
 
-        super()._check_exists()
+        with self._open_for_write(
+            mode, None if mode == "wb" else encoding, make_parents, atomic, fsync
+        ) as fh:
+            if codec is None:
+                for chunk in chain((first,), iterator):
+                    fh.write(chunk)
+                return
+
+            stream = codec_writer(fh, codec, level, buffer_size)
+            if not binary:
+                stream = io.TextIOWrapper(stream, encoding=encoding)
+            # Closed before the raw file, so the end of the data is synced too
+            with stream:
+                for chunk in chain((first,), iterator):
+                    stream.write(chunk)
+
+    def _check_type(self, stat_result: os.stat_result | None) -> None:
+        # Devices and pipes are accepted, only directories can't be used as files
+        if stat_result is not None and stat.S_ISDIR(stat_result.st_mode):
+            from wexample_file.exception.not_a_file_exception import NotAFileException
 
-        # Only validate type when it exists; creation workflows may pass a non-existent path
-        if self.path.exists() and not self.path.is_file():
             raise NotAFileException(self.path)
 
+    def _compresses(self, compression: bool) -> bool:
+        """Whether writes compress the content, given the ``compression`` option."""
+        return compression and self.get_codec() is not None
+
+    @staticmethod
+    def _decode_line(
+        line: bytes, terminated: bool, encoding: str, keep_ends: bool
+    ) -> str:
+        """Decode a line read without its "\\n", which ``terminated`` tells about."""
+        if terminated and line.endswith(b"\r"):
+            line = line[:-1]
+        text = line.decode(encoding)
+        return text + "\n" if keep_ends and terminated else text
+
+    def _encode_text(self, content: str, encoding: str) -> bytes:
+        """Return the bytes a text mode write of ``content`` would produce."""
+        if os.linesep != "\n":
+            content = content.replace("\n", os.linesep)
+        return content.encode(encoding)
+
+    def _follow_reader(
+        self, encoding: str, keep_ends: bool, from_start: bool
+    ) -> Iterator[list[str]]:
+        """Poll the file once per iteration, giving the complete lines appended."""
+        backend = self.backend
+        fh = None
+        inode = None
+        # None until the starting offset is known
+        offset = 0 if from_start else None
+        # Start of a line not terminated yet
+        pending = b""
+
+        def split(data: bytes) -> list[str]:
+            nonlocal pending
+
+            *complete, pending = (pending + data).split(b"\n")
+            return [
+                self._decode_line(line, True, encoding, keep_ends) for line in complete
+            ]
+
+        try:
+            while True:
+                lines: list[str] = []
+                stat_result = backend.stat(self.path)
+                if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
+                    if offset is None:
+                        # Once created, the file is read from its start
+                        offset = 0
+                    yield lines
+                    continue
+
+                if inode is not None and stat_result.st_ino != inode:
+                    # Rotated: the end of the previous file, then the new one
+                    if fh is not None:
+                        fh.seek(offset)
+                        lines += split(fh.read())
+                        fh.close()
+                        fh = None
+                    if pending:
+                        lines.append(
+                            self._decode_line(pending, False, encoding, keep_ends)
+                        )
+                        pending = b""
+                    offset = 0
+                elif offset is None:
+                    offset = stat_result.st_size
+                elif stat_result.st_size < offset:
+                    # Truncated in place
+                    offset = 0
+                    pending = b""
+                inode = stat_result.st_ino
+
+                if fh is None and (backend.native or stat_result.st_size > offset):
+                    # Kept open, so the file can be read to its end once rotated
+                    fh = backend.open(self.path, "rb")
+                if stat_result.st_size > offset:
+                    fh.seek(offset)
+                    data = fh.read()
+                    offset += len(data)
+                    lines += split(data)
+                    if not backend.native:
+                        # Other backends may open snapshots, reopened on each read
+                        fh.close()
+                        fh = None
+                yield lines
+        finally:
+            if fh is not None:
+                fh.close()
+
+    @staticmethod
+    def _follow_wait(
+        reader: Iterator[list[str]],
+        lines: list[str],
+        poll_interval: float,
+        timeout: float | None,
+    ) -> Iterator[str]:
+        """Yield the lines of each poll of ``reader``, waiting between empty ones."""
+        import time
+
+        last_line_time = time.monotonic()
+        try:
+            while True:
+                if lines:
+                    yield from lines
+                    last_line_time = time.monotonic()
+                elif timeout is not None and (
+                    time.monotonic() - last_line_time >= timeout
+                ):
+                    return
+                else:
+                    time.sleep(poll_interval)
+                lines = next(reader)
+        finally:
+            reader.close()
+
     def _not_found_exc(self) -> FileNotFoundException:
         from wexample_file.exception.file_not_found_exception import (
             FileNotFoundException,
         )
 
         return FileNotFoundException(self.path)
+
+    @contextmanager
+    def _open_for_write(
+        self,
+        mode: str,
+        encoding: str | None,
+        make_parents: bool,
+        atomic: bool,
+        fsync: bool,
+    ) -> Iterator[IO]:
+        backend = self.backend
+        if make_parents:
+            backend.mkdir(self.path.parent, parents=True, exist_ok=True)
+        if self.is_dir():
+            from wexample_file.exception.not_a_file_exception import NotAFileException
+
+            raise NotAFileException(self.path)
+
+        if not atomic:
+            try:
+                with backend.open(self.path, mode, encoding=encoding) as fh:
+                    yield fh
+                    if fsync:
+                        backend.fsync(fh)
+            finally:
+                self._invalidate_stat()
+            return
+
+        import uuid
+
+        temp_path = self.path.with_name(
+            f".{self.path.name}.{uuid.uuid4().hex[:12]}.tmp"
+        )
+        try:
+            # Exclusive creation, so the usual umask applies unlike mkstemp's 0600.
+            with backend.open(
+                temp_path, mode.replace("w", "x"), encoding=encoding
+            ) as fh:
+                yield fh
+                if fsync:
+                    backend.fsync(fh)
+
+            # Keep the permissions of the file being replaced.
+            stat_result = backend.stat(self.path)
+            if stat_result is not None:
+                backend.chmod(temp_path, stat.S_IMODE(stat_result.st_mode))
+            backend.replace(temp_path, self.path)
+        except BaseException:
+            backend.unlink(temp_path, missing_ok=True)
+            raise
+        finally:
+            self._invalidate_stat()
+
+        if fsync:
+            backend.fsync_directory(self.path.parent)
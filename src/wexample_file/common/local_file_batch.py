@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+    from wexample_helpers.const.types import PathOrString
+
+    from wexample_file.classes.batch_item_result import BatchItemResult
+    from wexample_file.common.abstract_storage_backend import AbstractStorageBackend
+    from wexample_file.common.local_file import LocalFile
+
+# Parent directory of an item, with the backend it is created on.
+_Parent = tuple["AbstractStorageBackend", str]
+
+
+class LocalFileBatch:
+    """Run the same operation over many files on a bounded thread pool.
+
+    Items can be LocalFile objects or paths. Each call returns one
+    BatchItemResult per item, in input order, holding either the operation's
+    return value or the exception it raised: a failing item never stops the
+    others. Parent directories are created once per distinct directory before
+    writing or touching.
+    """
+
+    def __init__(self, workers: int | None = None) -> None:
+        self.workers = workers
+
+    def read_many(
+        self, items: Iterable[LocalFile | PathOrString], encoding: str = "utf-8"
+    ) -> list[BatchItemResult]:
+        """Read each file; the value is its content, or None if missing."""
+        return self._run(items, lambda local_file: local_file.read(encoding=encoding))
+
+    def remove_many(
+        self, items: Iterable[LocalFile | PathOrString]
+    ) -> list[BatchItemResult]:
+        return self._run(items, lambda local_file: local_file.remove())
+
+    def touch_many(
+        self, items: Iterable[LocalFile | PathOrString], make_parents: bool = True
+    ) -> list[BatchItemResult]:
+        """Create each missing file; the value tells whether it was created."""
+        items = list(items)
+        failed_parents = self._create_parents(items) if make_parents else {}
+        return self._run(
+            items,
+            lambda local_file: local_file.touch(parents=False),
+            failed_parents,
+        )
+
+    def write_many(
+        self,
+        contents: Mapping[LocalFile | PathOrString, str | bytes],
+        encoding: str = "utf-8",
+        make_parents: bool = True,
+        **kwargs: Any,
+    ) -> list[BatchItemResult]:
+        """Write text or bytes to each file; the value tells whether it was written.
+
+        Extra options (atomic, fsync, only_if_changed, cache) are passed to
+        LocalFile.write / write_bytes.
+        """
+        items = list(contents)
+        failed_parents = self._create_parents(items) if make_parents else {}
+
+        def write(local_file: LocalFile, item: LocalFile | PathOrString) -> bool:
+            content = contents[item]
+            if isinstance(content, bytes):
+                return local_file.write_bytes(content, make_parents=False, **kwargs)
+            return local_file.write(
+                content, encoding=encoding, make_parents=False, **kwargs
+            )
+
+        return self._run(items, write, failed_parents, pass_item=True)
+
+    def _create_parents(
+        self, items: list[LocalFile | PathOrString]
+    ) -> dict[_Parent, Exception]:
+        """Create each distinct parent directory once, deepest first.
+
+        Directories are created on the backend of their items. Once a directory
+        is created, its ancestors are known to exist and are skipped. Returns
+        the errors of the directories that could not be created.
+        """
+        import os
+
+        parents = {self._item_parent(item) for item in items}
+        existing: set[_Parent] = set()
+        errors: dict[_Parent, Exception] = {}
+        for backend, parent in sorted(parents, key=lambda p: len(p[1]), reverse=True):
+            if (backend, parent) in existing:
+                continue
+            try:
+                backend.mkdir(parent, parents=True, exist_ok=True)
+            except OSError as e:
+                errors[(backend, parent)] = e
+                continue
+
+            while (backend, parent) not in existing:
+                existing.add((backend, parent))
+                parent = os.path.dirname(parent)
+        return errors
+
+    @classmethod
+    def _item_parent(cls, item: LocalFile | PathOrString) -> _Parent:
+        """The backend of an item, the active one for paths, and its parent."""
+        import os
+
+        from wexample_file.common.abstract_local_item_path import (
+            AbstractLocalItemPath,
+        )
+        from wexample_file.helper.storage import storage_get_backend
+
+        backend = (
+            item.backend
+            if isinstance(item, AbstractLocalItemPath)
+            else storage_get_backend()
+        )
+        return backend, os.path.dirname(os.path.abspath(cls._item_path(item)))
+
+    @staticmethod
+    def _item_path(item: LocalFile | PathOrString) -> str:
+        import os
+
+        from wexample_file.common.abstract_local_item_path import (
+            AbstractLocalItemPath,
+        )
+
+        path = item.path if isinstance(item, AbstractLocalItemPath) else item
+        return os.path.expanduser(os.fspath(path))
+
+    def _run(
+        self,
+        items: Iterable[LocalFile | PathOrString],
+        operation: Callable[..., Any],
+        failed_parents: dict[_Parent, Exception] | None = None,
+        pass_item: bool = False,
+    ) -> list[BatchItemResult]:
+        from concurrent.futures import ThreadPoolExecutor
+
+        from wexample_file.classes.batch_item_result import BatchItemResult
+        from wexample_file.common.local_file import LocalFile
+
+        def run_one(item: LocalFile | PathOrString) -> BatchItemResult:
+            try:
+                if failed_parents:
+                    parent = self._item_parent(item)
+                    if parent in failed_parents:
+                        raise failed_parents[parent]
+
+                # The stat checking the type of a path is reused by the operation
+                local_file = (
+                    item
+                    if isinstance(item, LocalFile)
+                    else LocalFile(item, use_stat_cache=True)
+                )
+                value = (
+                    operation(local_file, item) if pass_item else operation(local_file)
+                )
+            except Exception as e:
+                return BatchItemResult(error=e, item=item)
+            return BatchItemResult(error=None, item=item, value=value)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            return list(executor.map(run_one, items))
@@ -0,0 +1,360 @@
+from __future__ import annotations
+
+import errno
+import io
+import os
+import stat
+import time
+from typing import TYPE_CHECKING, Any
+
+from wexample_file.common.abstract_storage_backend import AbstractStorageBackend
+
+if TYPE_CHECKING:
+    from typing import IO
+
+    from wexample_helpers.const.types import PathOrString
+
+# Umask applied to the modes of new files and directories, the usual default.
+MEMORY_DEFAULT_UMASK: int = 0o022
+
+
+class MemoryStorageBackend(AbstractStorageBackend):
+    """Storage backend keeping a whole filesystem tree in memory.
+
+    Files, directories, permission bits, inodes and modification times behave
+    like on disk and the same OSError subclasses are raised, so items work the
+    same on it without making any syscall. The tree starts with an empty root;
+    symlinks are not supported. Operations are thread safe. New files and
+    directories get their mode through ``umask``, not the process one, which
+    can't be read without changing it.
+
+    Use it as a context manager to make the items created meanwhile use it:
+
+        with MemoryStorageBackend():
+            LocalFile("/tmp/demo/file.txt").write("content")
+    """
+
+    def __init__(self, umask: int = MEMORY_DEFAULT_UMASK) -> None:
+        import threading
+
+        super().__init__()
+        self._umask = umask
+        self._inodes = 1
+        self._lock = threading.RLock()
+        self._root = self._new_node(stat.S_IFDIR | 0o777)
+
+    def chmod(self, path: PathOrString, mode: int) -> None:
+        with self._lock:
+            node = self._get(os.fspath(path))
+            node.mode = stat.S_IFMT(node.mode) | stat.S_IMODE(mode)
+
+    def fsync(self, fh: IO) -> None:
+        # Flushing is enough to hand the content over to the tree
+        fh.flush()
+
+    def fsync_directory(self, path: PathOrString) -> None:
+        pass
+
+    def mkdir(
+        self, path: PathOrString, parents: bool = False, exist_ok: bool = False
+    ) -> None:
+        path = os.fspath(path)
+        with self._lock:
+            node = self._find(path)
+            if node is not None:
+                if exist_ok and node.children is not None:
+                    return
+                raise _error(errno.EEXIST, path)
+
+            try:
+                parent, name = self._get_parent(path)
+            except FileNotFoundError:
+                if not parents:
+                    raise
+                self.mkdir(os.path.dirname(path), parents=True, exist_ok=True)
+                parent, name = self._get_parent(path)
+
+            self._attach(parent, name, self._new_node(stat.S_IFDIR | 0o777))
+
+    def open(
+        self,
+        path: PathOrString,
+        mode: str = "r",
+        encoding: str | None = None,
+        buffering: int = -1,
+    ) -> IO:
+        path = os.fspath(path)
+        kind = mode.replace("b", "").replace("t", "")
+        if kind not in ("r", "w", "a", "x"):
+            raise ValueError(f"unsupported mode: {mode!r}")
+
+        with self._lock:
+            if kind == "r":
+                node = self._get(path)
+                if node.children is not None:
+                    raise _error(errno.EISDIR, path)
+                buffer: io.BytesIO = io.BytesIO(node.data)
+            else:
+                parent, name = self._get_parent(path)
+                node = parent.children.get(name)
+                if node is None:
+                    node = self._new_node(stat.S_IFREG | 0o666)
+                    self._attach(parent, name, node)
+                elif node.children is not None:
+                    raise _error(errno.EISDIR, path)
+                elif kind == "x":
+                    raise _error(errno.EEXIST, path)
+                elif kind == "w":
+                    node.data = b""
+                    node.mtime_ns = time.time_ns()
+                buffer = _MemoryFileWriter(self, node, append=kind == "a")
+
+        if "b" in mode:
+            return buffer
+        return io.TextIOWrapper(buffer, encoding=encoding)
+
+    def replace(self, source: PathOrString, target: PathOrString) -> None:
+        source = os.fspath(source)
+        target = os.fspath(target)
+        with self._lock:
+            source_parent, source_name = self._get_parent(source)
+            node = source_parent.children.get(source_name)
+            if node is None:
+                raise _error(errno.ENOENT, source)
+            target_parent, target_name = self._get_parent(target)
+            if source == target:
+                return
+
+            existing = target_parent.children.get(target_name)
+            if node.children is not None:
+                if target.startswith(source + os.sep):
+                    raise _error(errno.EINVAL, target)
+                if existing is not None:
+                    if existing.children is None:
+                        raise _error(errno.ENOTDIR, target)
+                    if existing.children:
+                        raise _error(errno.ENOTEMPTY, target)
+            elif existing is not None and existing.children is not None:
+                raise _error(errno.EISDIR, target)
+
+            self._detach(source_parent, source_name)
+            self._attach(target_parent, target_name, node)
+
+    def rmtree(self, path: PathOrString) -> None:
+        path = os.fspath(path)
+        with self._lock:
+            parent, name = self._get_parent(path)
+            node = parent.children.get(name)
+            if node is None:
+                raise _error(errno.ENOENT, path)
+            if node.children is None:
+                raise _error(errno.ENOTDIR, path)
+            self._detach(parent, name)
+
+    def scandir(self, path: PathOrString) -> _MemoryScandir:
+        path = os.fspath(path)
+        with self._lock:
+            node = self._get(path)
+            if node.children is None:
+                raise _error(errno.ENOTDIR, path)
+            return _MemoryScandir(
+                _MemoryDirEntry(os.path.join(path, name), name, child)
+                for name, child in node.children.items()
+            )
+
+    def stat(
+        self, path: PathOrString, follow_symlinks: bool = True
+    ) -> os.stat_result | None:
+        node = self._find(os.fspath(path))
+        return None if node is None else node.stat()
+
+    def touch(self, path: PathOrString, exist_ok: bool = True) -> None:
+        path = os.fspath(path)
+        with self._lock:
+            parent, name = self._get_parent(path)
+            node = parent.children.get(name)
+            if node is None:
+                self._attach(parent, name, self._new_node(stat.S_IFREG | 0o666))
+            elif not exist_ok:
+                raise _error(errno.EEXIST, path)
+            else:
+                node.mtime_ns = time.time_ns()
+
+    def unlink(self, path: PathOrString, missing_ok: bool = False) -> None:
+        path = os.fspath(path)
+        with self._lock:
+            try:
+                parent, name = self._get_parent(path)
+                node = parent.children.get(name)
+                if node is None:
+                    raise _error(errno.ENOENT, path)
+            except FileNotFoundError:
+                if missing_ok:
+                    return
+                raise
+            if node.children is not None:
+                raise _error(errno.EISDIR, path)
+            self._detach(parent, name)
+
+    def _attach(self, parent: _MemoryNode, name: str, node: _MemoryNode) -> None:
+        parent.children[name] = node
+        parent.mtime_ns = time.time_ns()
+
+    def _detach(self, parent: _MemoryNode, name: str) -> None:
+        del parent.children[name]
+        parent.mtime_ns = time.time_ns()
+
+    def _find(self, path: str) -> _MemoryNode | None:
+        """Return the node of the path, None if it or one of its parents is missing."""
+        node = self._root
+        for name in path.split(os.sep):
+            if not name:
+                continue
+            if node.children is None:
+                return None
+            node = node.children.get(name)
+            if node is None:
+                return None
+        return node
+
+    def _get(self, path: str) -> _MemoryNode:
+        """Return the node of the path, raising like the OS if it's missing."""
+        node = self._find(path)
+        if node is None:
+            try:
+                # Tells a missing parent from a file used as a directory
+                self._get_parent(path)
+            except OSError as e:
+                raise _error(e.errno, path) from None
+            raise _error(errno.ENOENT, path)
+        return node
+
+    def _get_parent(self, path: str) -> tuple[_MemoryNode, str]:
+        """Return the directory node holding the path, and the name in it."""
+        parent_path, name = os.path.split(path)
+        parent = self._get(parent_path)
+        if parent.children is None:
+            raise _error(errno.ENOTDIR, path)
+        return parent, name
+
+    def _new_node(self, mode: int) -> _MemoryNode:
+        with self._lock:
+            self._inodes += 1
+            inode = self._inodes
+        return _MemoryNode(mode & ~self._umask, inode)
+
+
+class _MemoryNode:
+    """File or directory of a MemoryStorageBackend tree."""
+
+    __slots__ = ("children", "data", "inode", "mode", "mtime_ns")
+
+    def __init__(self, mode: int, inode: int) -> None:
+        self.children: dict[str, _MemoryNode] | None = (
+            {} if stat.S_ISDIR(mode) else None
+        )
+        self.data = b""
+        self.inode = inode
+        self.mode = mode
+        self.mtime_ns = time.time_ns()
+
+    def stat(self) -> os.stat_result:
+        size = len(self.data) if self.children is None else 0
+        seconds = self.mtime_ns / 1e9
+        return os.stat_result(
+            (
+                self.mode,
+                self.inode,
+                0,
+                1 if self.children is None else 2,
+                0,
+                0,
+                size,
+                int(seconds),
+                int(seconds),
+                int(seconds),
+            ),
+            {
+                "st_atime": seconds,
+                "st_atime_ns": self.mtime_ns,
+                "st_ctime": seconds,
+                "st_ctime_ns": self.mtime_ns,
+                "st_mtime": seconds,
+                "st_mtime_ns": self.mtime_ns,
+            },
+        )
+
+
+class _MemoryDirEntry:
+    """os.DirEntry lookalike listed by MemoryStorageBackend.scandir."""
+
+    __slots__ = ("_node", "name", "path")
+
+    def __init__(self, path: str, name: str, node: _MemoryNode) -> None:
+        self._node = node
+        self.name = name
+        self.path = path
+
+    def __fspath__(self) -> str:
+        return self.path
+
+    def __repr__(self) -> str:
+        return f"<_MemoryDirEntry {self.name!r}>"
+
+    def inode(self) -> int:
+        return self._node.inode
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        return self._node.children is not None
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        return self._node.children is None
+
+    def is_symlink(self) -> bool:
+        return False
+
+    def stat(self, follow_symlinks: bool = True) -> os.stat_result:
+        return self._node.stat()
+
+
+class _MemoryFileWriter(io.BytesIO):
+    """Buffer of a file open for writing, stored in the tree on flush and close."""
+
+    def __init__(
+        self, backend: MemoryStorageBackend, node: _MemoryNode, append: bool
+    ) -> None:
+        super().__init__(node.data if append else b"")
+        if append:
+            self.seek(0, io.SEEK_END)
+        self._backend = backend
+        self._node = node
+
+    def close(self) -> None:
+        if not self.closed:
+            self.flush()
+        super().close()
+
+    def flush(self) -> None:
+        super().flush()
+        if not self.closed:
+            with self._backend._lock:
+                self._node.data = self.getvalue()
+                self._node.mtime_ns = time.time_ns()
+
+
+class _MemoryScandir(list):
+    """Listing returned by ``scandir``, usable as a context manager like on disk."""
+
+    def __enter__(self) -> _MemoryScandir:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def _error(code: int, path: str) -> OSError:
+    """Build the OSError subclass the OS raises for ``code``, e.g. FileNotFoundError."""
+    return OSError(code, os.strerror(code), path)
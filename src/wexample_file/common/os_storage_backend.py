@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from wexample_file.common.abstract_storage_backend import AbstractStorageBackend
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import IO
+
+    from wexample_helpers.const.types import PathOrString
+
+
+class OsStorageBackend(AbstractStorageBackend):
+    """Storage backend of the real filesystem, the default one of every item.
+
+    Each method is a thin wrapper around the matching os, pathlib or shutil
+    call, so items keep their direct syscall behavior and cost.
+    """
+
+    native = True
+
+    def chmod(self, path: PathOrString, mode: int) -> None:
+        os.chmod(path, mode)
+
+    def fsync(self, fh: IO) -> None:
+        fh.flush()
+        os.fsync(fh.fileno())
+
+    def fsync_directory(self, path: PathOrString) -> None:
+        if os.name == "nt":
+            # Directories can't be opened, nor synced, on Windows
+            return
+
+        dir_fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def mkdir(
+        self, path: PathOrString, parents: bool = False, exist_ok: bool = False
+    ) -> None:
+        Path(path).mkdir(parents=parents, exist_ok=exist_ok)
+
+    def open(
+        self,
+        path: PathOrString,
+        mode: str = "r",
+        encoding: str | None = None,
+        buffering: int = -1,
+    ) -> IO:
+        return open(path, mode, buffering=buffering, encoding=encoding)
+
+    def replace(self, source: PathOrString, target: PathOrString) -> None:
+        os.replace(source, target)
+
+    def rmtree(self, path: PathOrString) -> None:
+        import shutil
+
+        shutil.rmtree(path)
+
+    def scandir(self, path: PathOrString) -> Iterator[os.DirEntry]:
+        return os.scandir(path)
+
+    def stat(
+        self, path: PathOrString, follow_symlinks: bool = True
+    ) -> os.stat_result | None:
+        try:
+            return os.stat(path, follow_symlinks=follow_symlinks)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    def touch(self, path: PathOrString, exist_ok: bool = True) -> None:
+        Path(path).touch(exist_ok=exist_ok)
+
+    def unlink(self, path: PathOrString, missing_ok: bool = False) -> None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            if not missing_ok:
+                raise
@@ -0,0 +1,357 @@
+from __future__ import annotations
+
+import errno
+import os
+import stat
+from typing import TYPE_CHECKING
+
+from wexample_file.common.abstract_storage_backend import AbstractStorageBackend
+from wexample_file.common.memory_storage_backend import (
+    MemoryStorageBackend,
+    _error,
+    _MemoryScandir,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from typing import IO
+
+    from wexample_helpers.const.types import PathOrString
+
+    from wexample_file.classes.file_change import FileChange
+
+
+class OverlayStorageBackend(AbstractStorageBackend):
+    """Copy-on-write storage backend over a real directory.
+
+    Everything is read from the disk until it changes: changes under ``root``
+    are kept in memory, files being copied there on their first modification,
+    and deleted paths are hidden. The disk is never written to, so the effect
+    of a whole run can be previewed with ``changes`` and then thrown away.
+    Paths outside ``root`` are read only (EROFS).
+    """
+
+    def __init__(self, root: PathOrString) -> None:
+        import threading
+
+        super().__init__()
+        self._lock = threading.RLock()
+        self.root = os.path.abspath(os.path.expanduser(os.fspath(root)))
+        # Changed paths, on top of the disk
+        self._upper = MemoryStorageBackend()
+        # Paths of the disk deleted in the overlay, with everything below them
+        self._hidden: set[str] = set()
+
+    def changes(self) -> list[FileChange]:
+        """Return the created, modified and deleted paths, compared to the disk.
+
+        Items of the changes use this backend, deleted ones the disk type.
+        """
+        from pathlib import Path
+
+        from wexample_file.classes.file_change import FileChange
+        from wexample_file.common.local_directory import LocalDirectory
+        from wexample_file.common.local_file import LocalFile
+        from wexample_file.enum.file_change_type import FileChangeType
+
+        found: dict[str, tuple[FileChangeType, bool]] = {}
+        for path, is_dir in self._upper_paths():
+            if is_dir:
+                if not os.path.isdir(path):
+                    found[path] = (FileChangeType.CREATED, True)
+            elif os.path.lexists(path):
+                found[path] = (FileChangeType.MODIFIED, False)
+            else:
+                found[path] = (FileChangeType.CREATED, False)
+        for path in self._hidden:
+            if os.path.lexists(path):
+                found[path] = (FileChangeType.DELETED, os.path.isdir(path))
+
+        return [
+            FileChange(
+                type=change_type,
+                item=(LocalDirectory if is_dir else LocalFile).from_resolved(
+                    Path(path), backend=self
+                ),
+            )
+            for path, (change_type, is_dir) in sorted(found.items())
+        ]
+
+    def chmod(self, path: PathOrString, mode: int) -> None:
+        with self._lock:
+            path = os.fspath(path)
+            self._check_writable(path)
+            self._copy_up(path, content=True)
+            self._upper.chmod(path, mode)
+
+    def fsync(self, fh: IO) -> None:
+        fh.flush()
+
+    def fsync_directory(self, path: PathOrString) -> None:
+        pass
+
+    def mkdir(
+        self, path: PathOrString, parents: bool = False, exist_ok: bool = False
+    ) -> None:
+        with self._lock:
+            path = os.fspath(path)
+            stat_result = self.stat(path)
+            if stat_result is not None:
+                if exist_ok and stat.S_ISDIR(stat_result.st_mode):
+                    return
+                raise _error(errno.EEXIST, path)
+
+            try:
+                self._check_parent(path)
+            except FileNotFoundError:
+                if not parents:
+                    raise
+                self.mkdir(os.path.dirname(path), parents=True, exist_ok=True)
+
+            self._check_writable(path)
+            self._copy_up(os.path.dirname(path))
+            self._upper.mkdir(path)
+            self._unhide(path)
+
+    def open(
+        self,
+        path: PathOrString,
+        mode: str = "r",
+        encoding: str | None = None,
+        buffering: int = -1,
+    ) -> IO:
+        path = os.fspath(path)
+        kind = mode.replace("b", "").replace("t", "")
+        if kind == "r":
+            if self._upper.stat(path) is None:
+                if not self._on_disk(path):
+                    raise _error(errno.ENOENT, path)
+                return open(path, mode, buffering=buffering, encoding=encoding)
+        elif kind in ("w", "a", "x"):
+            with self._lock:
+                stat_result = self.stat(path)
+                if stat_result is None:
+                    self._check_parent(path)
+                    self._check_writable(path)
+                    self._copy_up(os.path.dirname(path))
+                    self._unhide(path)
+                elif stat.S_ISDIR(stat_result.st_mode):
+                    raise _error(errno.EISDIR, path)
+                elif kind == "x":
+                    raise _error(errno.EEXIST, path)
+                else:
+                    self._check_writable(path)
+                    # Truncated anyway unless appending
+                    self._copy_up(path, content=kind == "a")
+                return self._upper.open(
+                    path, mode, encoding=encoding, buffering=buffering
+                )
+
+        return self._upper.open(path, mode, encoding=encoding, buffering=buffering)
+
+    def replace(self, source: PathOrString, target: PathOrString) -> None:
+        with self._lock:
+            source = os.fspath(source)
+            target = os.fspath(target)
+            source_stat = self.stat(source)
+            if source_stat is None:
+                raise _error(errno.ENOENT, source)
+            self._check_parent(target)
+            self._check_writable(source)
+            self._check_writable(target)
+            if source == target:
+                return
+
+            target_stat = self.stat(target)
+            if stat.S_ISDIR(source_stat.st_mode):
+                if target.startswith(source + os.sep):
+                    raise _error(errno.EINVAL, target)
+                if target_stat is not None:
+                    if not stat.S_ISDIR(target_stat.st_mode):
+                        raise _error(errno.ENOTDIR, target)
+                    with self.scandir(target) as entries:
+                        if entries:
+                            raise _error(errno.ENOTEMPTY, target)
+                self._copy_up_tree(source)
+            else:
+                if target_stat is not None and stat.S_ISDIR(target_stat.st_mode):
+                    raise _error(errno.EISDIR, target)
+                self._copy_up(source, content=True)
+
+            if target_stat is not None and self._upper.stat(target) is None:
+                # Only on disk, the moved node takes its place
+                self._hide(target)
+            self._copy_up(os.path.dirname(target))
+            self._unhide(target)
+            self._upper.replace(source, target)
+            self._hide(source)
+
+    def reset(self) -> None:
+        """Forget every change, the overlay shows the disk as it is again."""
+        with self._lock:
+            self._upper = MemoryStorageBackend()
+            self._hidden.clear()
+
+    def rmtree(self, path: PathOrString) -> None:
+        with self._lock:
+            path = os.fspath(path)
+            stat_result = self.stat(path)
+            if stat_result is None:
+                raise _error(errno.ENOENT, path)
+            if not stat.S_ISDIR(stat_result.st_mode):
+                raise _error(errno.ENOTDIR, path)
+            self._check_writable(path)
+            self._hide(path)
+
+    def scandir(self, path: PathOrString) -> _MemoryScandir:
+        path = os.fspath(path)
+        stat_result = self.stat(path)
+        if stat_result is None:
+            raise _error(errno.ENOENT, path)
+        if not stat.S_ISDIR(stat_result.st_mode):
+            raise _error(errno.ENOTDIR, path)
+
+        entries: dict[str, os.DirEntry] = {}
+        if self._on_disk(path) and os.path.isdir(path):
+            with os.scandir(path) as scanner:
+                for entry in scanner:
+                    if entry.path not in self._hidden:
+                        entries[entry.name] = entry
+        if self._upper.stat(path) is not None:
+            with self._upper.scandir(path) as scanner:
+                for entry in scanner:
+                    entries[entry.name] = entry
+        return _MemoryScandir(entries.values())
+
+    def stat(
+        self, path: PathOrString, follow_symlinks: bool = True
+    ) -> os.stat_result | None:
+        path = os.fspath(path)
+        stat_result = self._upper.stat(path)
+        if stat_result is not None or not self._on_disk(path):
+            return stat_result
+        try:
+            return os.stat(path, follow_symlinks=follow_symlinks)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    def touch(self, path: PathOrString, exist_ok: bool = True) -> None:
+        with self._lock:
+            path = os.fspath(path)
+            if self.stat(path) is None:
+                self._check_parent(path)
+                self._check_writable(path)
+                self._copy_up(os.path.dirname(path))
+                self._unhide(path)
+            else:
+                if not exist_ok:
+                    raise _error(errno.EEXIST, path)
+                self._check_writable(path)
+                self._copy_up(path, content=True)
+            self._upper.touch(path)
+
+    def unlink(self, path: PathOrString, missing_ok: bool = False) -> None:
+        with self._lock:
+            path = os.fspath(path)
+            stat_result = self.stat(path)
+            if stat_result is None:
+                if missing_ok:
+                    return
+                raise _error(errno.ENOENT, path)
+            if stat.S_ISDIR(stat_result.st_mode):
+                raise _error(errno.EISDIR, path)
+            self._check_writable(path)
+            self._hide(path)
+
+    def _check_parent(self, path: str) -> None:
+        """Raise like the OS if the parent of the path is not an existing directory."""
+        stat_result = self.stat(os.path.dirname(path))
+        if stat_result is None:
+            raise _error(errno.ENOENT, path)
+        if not stat.S_ISDIR(stat_result.st_mode):
+            raise _error(errno.ENOTDIR, path)
+
+    def _check_writable(self, path: str) -> None:
+        if path != self.root and not path.startswith(self.root.rstrip(os.sep) + os.sep):
+            raise _error(errno.EROFS, path)
+
+    def _copy_up(self, path: str, content: bool = False) -> None:
+        """Bring an existing path of the disk into memory, with its parents.
+
+        File contents are only copied when ``content`` is set, otherwise the
+        file starts empty.
+        """
+        if self._upper.stat(path) is not None:
+            return
+
+        parent = os.path.dirname(path)
+        if parent != path:
+            self._copy_up(parent)
+
+        stat_result = os.stat(path)
+        if stat.S_ISDIR(stat_result.st_mode):
+            self._upper.mkdir(path, exist_ok=True)
+        else:
+            with self._upper.open(path, "wb") as fh:
+                if content:
+                    with open(path, "rb") as source:
+                        while chunk := source.read(1024 * 1024):
+                            fh.write(chunk)
+        self._upper.chmod(path, stat_result.st_mode)
+
+    def _copy_up_tree(self, path: str) -> None:
+        """Bring a whole directory of the disk into memory, e.g. before moving it."""
+        self._copy_up(path)
+        with self.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    self._copy_up_tree(entry.path)
+                else:
+                    self._copy_up(entry.path, content=True)
+
+    def _hide(self, path: str) -> None:
+        """Delete the path from memory, and hide it on the disk."""
+        stat_result = self._upper.stat(path)
+        if stat_result is not None:
+            if stat.S_ISDIR(stat_result.st_mode):
+                self._upper.rmtree(path)
+            else:
+                self._upper.unlink(path)
+        if self._on_disk(path) and os.path.lexists(path):
+            self._hidden.add(path)
+
+    def _on_disk(self, path: str) -> bool:
+        """Whether the disk is looked at for this path, i.e. it isn't hidden."""
+        if not self._hidden:
+            return True
+        while True:
+            if path in self._hidden:
+                return False
+            parent = os.path.dirname(path)
+            if parent == path:
+                return True
+            path = parent
+
+    def _unhide(self, path: str) -> None:
+        """Make a path deleted before usable again, without its former content."""
+        if path not in self._hidden:
+            return
+
+        self._hidden.discard(path)
+        if os.path.isdir(path) and not os.path.islink(path):
+            # The former children stay deleted
+            self._hidden.update(os.path.join(path, name) for name in os.listdir(path))
+
+    def _upper_paths(self) -> Iterator[tuple[str, bool]]:
+        """Yield the (path, is directory) of everything held in memory under root."""
+        if self._upper.stat(self.root) is None:
+            return
+
+        stack = [self.root]
+        while stack:
+            with self._upper.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    is_dir = entry.is_dir()
+                    yield entry.path, is_dir
+                    if is_dir:
+                        stack.append(entry.path)
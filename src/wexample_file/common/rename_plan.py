@@ -0,0 +1,384 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+    from wexample_helpers.const.types import PathOrString
+
+    from wexample_file.classes.rename_action import RenameAction
+    from wexample_file.common.abstract_storage_backend import AbstractStorageBackend
+
+# One step of a chain: (source, target, index of the action it belongs to).
+_Step = tuple[str, str, int]
+
+
+class RenamePlan:
+    """Renames computed over a whole set of files, run chain by chain.
+
+    A rename whose target is the source of another one waits for that file to
+    be moved away first: such renames form chains, applied in order, and
+    cycles (e.g. swapping two extensions) go through a temporary name. Chains
+    are independent and run on a thread pool. Conflicting renames are never
+    applied, see ``from_renames``, and a failing rename stops its chain only.
+
+    With a journal, the progress of each chain is recorded after every rename,
+    so an interrupted run can be resumed or rolled back with ``load``:
+
+        RenamePlan.load("renames.journal").apply(journal="renames.journal")
+    """
+
+    def __init__(
+        self,
+        actions: list[RenameAction],
+        backend: AbstractStorageBackend | None = None,
+        chains: list[list[_Step]] | None = None,
+    ) -> None:
+        from wexample_file.helper.storage import storage_get_backend
+
+        self.actions = actions
+        self.backend = storage_get_backend() if backend is None else backend
+        # Chains come from the journal when loading, temporary names included
+        self._chains = self._build_chains(actions) if chains is None else chains
+        # Number of steps done per chain
+        self._progress = [0] * len(self._chains)
+        # Journal already holding the chains of this plan
+        self._journal: str | None = None
+
+    def __iter__(self) -> Iterator[RenameAction]:
+        return iter(self.actions)
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def apply(
+        self, workers: int | None = None, journal: PathOrString | None = None
+    ) -> RenamePlan:
+        """Run every rename not applied yet except conflicts, return the plan itself.
+
+        A target created meanwhile is never overwritten: its rename fails with
+        FileExistsError. Missing parent directories of targets are created.
+
+        Parameters:
+            workers: Thread pool size; 1 runs inline.
+            journal: File recording the progress, (re)created unless the plan
+                was loaded from it.
+        """
+        self._run(self._apply_chain, workers, journal)
+        return self
+
+    @property
+    def conflicts(self) -> list[RenameAction]:
+        return [action for action in self.actions if action.conflict]
+
+    @property
+    def errors(self) -> list[RenameAction]:
+        return [action for action in self.actions if action.error is not None]
+
+    @classmethod
+    def from_renames(
+        cls,
+        renames: Iterable[tuple[PathOrString, PathOrString]],
+        backend: AbstractStorageBackend | None = None,
+    ) -> RenamePlan:
+        """Plan (source, target) renames, detecting conflicts up front.
+
+        A rename conflicts when its source is renamed more than once, when
+        several files get the same target, when the target exists and is not
+        moved away by the plan itself, or when its target is the source of a
+        conflicting rename, which stays in place.
+        """
+        from pathlib import Path
+
+        from wexample_file.classes.rename_action import RenameAction
+        from wexample_file.helper.storage import storage_get_backend
+
+        backend = storage_get_backend() if backend is None else backend
+        actions = []
+        for source, target in renames:
+            source = os.path.abspath(os.fspath(source))
+            target = os.path.abspath(os.fspath(target))
+            if source != target:
+                actions.append(RenameAction(source=Path(source), target=Path(target)))
+
+        by_source: dict[str, list[RenameAction]] = {}
+        by_target: dict[str, list[RenameAction]] = {}
+        for action in actions:
+            by_source.setdefault(str(action.source), []).append(action)
+            by_target.setdefault(str(action.target), []).append(action)
+
+        # Conflicting actions whose source stays in place
+        kept: list[RenameAction] = []
+
+        def conflict(action: RenameAction, reason: str) -> None:
+            if not action.conflict:
+                action.conflict = True
+                action.reason = reason
+                kept.append(action)
+
+        for group in by_source.values():
+            if len(group) > 1:
+                for action in group:
+                    conflict(action, "source renamed more than once")
+        for target, group in by_target.items():
+            if len(group) > 1:
+                for action in group:
+                    conflict(action, f"{len(group)} files renamed to {target}")
+        for target, group in by_target.items():
+            if (
+                target not in by_source
+                and backend.stat(target, follow_symlinks=False) is not None
+            ):
+                for action in group:
+                    conflict(action, "target already exists")
+
+        while kept:
+            source = str(kept.pop().source)
+            for action in by_target.get(source, ()):
+                conflict(action, f"target is not renamed: {source}")
+
+        return cls(actions, backend)
+
+    def is_empty(self) -> bool:
+        return not self.actions
+
+    @classmethod
+    def load(
+        cls, journal: PathOrString, backend: AbstractStorageBackend | None = None
+    ) -> RenamePlan:
+        """Rebuild a plan from its journal, with the progress of each chain.
+
+        Renames done after the last journal entry, e.g. by an interrupted run,
+        are found by looking at the files.
+        """
+        import json
+        from pathlib import Path
+
+        from wexample_file.classes.rename_action import RenameAction
+        from wexample_file.helper.storage import storage_get_backend
+
+        backend = storage_get_backend() if backend is None else backend
+        journal = os.fspath(journal)
+        progress: dict[int, int] = {}
+        with backend.open(journal, encoding="utf-8") as fh:
+            header = json.loads(fh.readline())
+            for line in fh:
+                try:
+                    index, done = json.loads(line)
+                except ValueError:
+                    # Entry cut by the interruption
+                    break
+                progress[index] = done
+
+        plan = cls(
+            [
+                RenameAction(
+                    source=Path(source),
+                    target=Path(target),
+                    conflict=bool(reason),
+                    reason=reason,
+                )
+                for source, target, reason in header["actions"]
+            ],
+            backend,
+            chains=[[tuple(step) for step in chain] for chain in header["chains"]],
+        )
+        plan._journal = journal
+        for index, chain in enumerate(plan._chains):
+            plan._progress[index] = plan._check_progress(chain, progress.get(index, 0))
+            for source, target, action_index in chain[: plan._progress[index]]:
+                action = plan.actions[action_index]
+                if target == str(action.target):
+                    action.applied = True
+        return plan
+
+    def rollback(
+        self, workers: int | None = None, journal: PathOrString | None = None
+    ) -> RenamePlan:
+        """Undo the applied renames, last first, and return the plan itself.
+
+        A source taken again meanwhile is never overwritten: undoing its rename
+        fails with FileExistsError. Parameters are the same as for ``apply``.
+        """
+        self._run(self._rollback_chain, workers, journal)
+        return self
+
+    def _apply_chain(self, index: int, record: Callable[[int], None]) -> None:
+        backend = self.backend
+        chain = self._chains[index]
+        for position in range(self._progress[index], len(chain)):
+            source, target, action_index = chain[position]
+            action = self.actions[action_index]
+            try:
+                if backend.stat(target, follow_symlinks=False) is not None:
+                    raise self._exists_error(target)
+                parent = os.path.dirname(target)
+                if parent != os.path.dirname(source):
+                    backend.mkdir(parent, parents=True, exist_ok=True)
+                backend.replace(source, target)
+            except Exception as e:
+                action.error = e
+                return
+
+            self._progress[index] = position + 1
+            if target == str(action.target):
+                action.applied = True
+            record(index)
+
+    @staticmethod
+    def _build_chains(actions: list[RenameAction]) -> list[list[_Step]]:
+        """Order the renames not conflicting into chains of steps.
+
+        Targets are unique, so following "whose target is my source" from a
+        rename whose target is not renamed gives a chain to run in that order;
+        renames left after that form cycles.
+        """
+        import uuid
+
+        valid = [index for index, action in enumerate(actions) if not action.conflict]
+        sources = {str(actions[index].source) for index in valid}
+        by_target = {str(actions[index].target): index for index in valid}
+
+        chains: list[list[_Step]] = []
+        done: set[int] = set()
+        for index in valid:
+            if str(actions[index].target) in sources:
+                continue
+            chain = []
+            current: int | None = index
+            while current is not None:
+                source = str(actions[current].source)
+                chain.append((source, str(actions[current].target), current))
+                done.add(current)
+                current = by_target.get(source)
+            chains.append(chain)
+
+        for index in valid:
+            if index in done:
+                continue
+            # Move the first file aside, shift the others, then put it in place
+            first = actions[index]
+            temp = str(
+                first.source.with_name(
+                    f".{first.source.name}.{uuid.uuid4().hex[:12]}.rename"
+                )
+            )
+            chain = [(str(first.source), temp, index)]
+            done.add(index)
+            current = by_target[str(first.source)]
+            while current != index:
+                source = str(actions[current].source)
+                chain.append((source, str(actions[current].target), current))
+                done.add(current)
+                current = by_target[source]
+            chain.append((temp, str(first.target), index))
+            chains.append(chain)
+
+        return chains
+
+    def _check_progress(self, chain: list[_Step], progress: int) -> int:
+        """Correct a journaled progress with the steps done or undone since."""
+        backend = self.backend
+
+        def moved(source: str, target: str) -> bool:
+            return (
+                backend.stat(source, follow_symlinks=False) is None
+                and backend.stat(target, follow_symlinks=False) is not None
+            )
+
+        checked = progress
+        while checked < len(chain) and moved(chain[checked][0], chain[checked][1]):
+            checked += 1
+        if checked == progress:
+            # Undone by an interrupted rollback
+            while checked > 0 and moved(chain[checked - 1][1], chain[checked - 1][0]):
+                checked -= 1
+        return checked
+
+    @staticmethod
+    def _exists_error(path: str) -> FileExistsError:
+        import errno
+
+        return FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), path)
+
+    def _rollback_chain(self, index: int, record: Callable[[int], None]) -> None:
+        backend = self.backend
+        chain = self._chains[index]
+        for position in range(self._progress[index] - 1, -1, -1):
+            source, target, action_index = chain[position]
+            action = self.actions[action_index]
+            try:
+                if backend.stat(source, follow_symlinks=False) is not None:
+                    raise self._exists_error(source)
+                backend.replace(target, source)
+            except Exception as e:
+                action.error = e
+                return
+
+            self._progress[index] = position
+            action.applied = False
+            record(index)
+
+    def _run(
+        self,
+        operation: Callable[[int, Callable[[int], None]], None],
+        workers: int | None,
+        journal: PathOrString | None,
+    ) -> None:
+        """Run ``operation(chain index, record)`` over every chain.
+
+        ``record`` appends the progress of a chain to the journal, if any.
+        """
+        import json
+        import threading
+
+        for action in self.actions:
+            action.error = None
+
+        writer = None
+        if journal is not None:
+            journal = os.fspath(journal)
+            if journal != self._journal:
+                with self.backend.open(journal, "w", encoding="utf-8") as fh:
+                    header = {
+                        "actions": [
+                            [str(action.source), str(action.target), action.reason]
+                            for action in self.actions
+                        ],
+                        "chains": self._chains,
+                    }
+                    fh.write(json.dumps(header) + "\n")
+                    for index, progress in enumerate(self._progress):
+                        if progress:
+                            fh.write(json.dumps([index, progress]) + "\n")
+                self._journal = journal
+            writer = self.backend.open(journal, "a", encoding="utf-8")
+
+        lock = threading.Lock()
+
+        def record(index: int) -> None:
+            if writer is not None:
+                with lock:
+                    writer.write(json.dumps([index, self._progress[index]]) + "\n")
+                    writer.flush()
+
+        try:
+            if workers == 1 or len(self._chains) < 2:
+                for index in range(len(self._chains)):
+                    operation(index, record)
+                return
+
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(
+                    executor.map(
+                        lambda index: operation(index, record),
+                        range(len(self._chains)),
+                    )
+                )
+        finally:
+            if writer is not None:
+                writer.close()
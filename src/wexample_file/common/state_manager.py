@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from wexample_helpers.const.types import PathOrString
+
+    from wexample_file.classes.state_action import StateAction
+    from wexample_file.classes.state_item import StateItem
+    from wexample_file.common.fingerprint_cache import FingerprintCache
+    from wexample_file.common.state_plan import StatePlan
+
+
+class StateManager:
+    """Bring files and directories to a state declared in a YAML or dict spec.
+
+    A spec holds an optional ``root`` and a list of ``items``, each with a
+    ``path`` (relative to the root), a ``type`` (``file`` or ``directory``), a
+    ``state`` (``present`` or ``absent``, default present), an optional
+    ``mode`` (octal string like "0644" or int) and, for files, an optional
+    text ``content``. Paths must stay inside the root, and no item can be
+    present inside an absent one.
+
+    Planning stats every path once, over a thread pool, and compares file
+    contents by size before reading them. Applying can be a dry run, which
+    only returns the plan.
+    """
+
+    def __init__(self, items: list[StateItem], workers: int | None = None) -> None:
+        self.items = items
+        self.workers = workers
+
+    def apply(
+        self,
+        dry_run: bool = False,
+        atomic: bool = False,
+        cache: FingerprintCache | None = None,
+    ) -> StatePlan:
+        """Plan the changes then execute them, unless ``dry_run`` is set.
+
+        Conflicts (a file declared where a directory exists, or the opposite)
+        are reported in the plan and never applied.
+        """
+        plan = self.plan(cache=cache)
+        if not dry_run:
+            plan.apply(workers=self.workers, atomic=atomic, cache=cache)
+        return plan
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Mapping[str, Any],
+        root: PathOrString | None = None,
+        workers: int | None = None,
+    ) -> StateManager:
+        """Build a manager from a parsed spec.
+
+        Parameters:
+            data: The spec mapping.
+            root: Base directory of relative paths, overriding the spec's root.
+                A relative spec root is taken from the current directory.
+            workers: Thread pool size used to plan and apply.
+
+        Raises:
+            InvalidStateSpecException: If the spec is malformed, or a path is
+                outside the root.
+        """
+        import os
+        from pathlib import Path
+
+        from wexample_file.exception.invalid_state_spec_exception import (
+            InvalidStateSpecException,
+        )
+
+        if not isinstance(data, dict):
+            raise InvalidStateSpecException("the spec must be a mapping", data)
+
+        if root is None:
+            root = data.get("root", ".")
+        if not isinstance(root, (str, Path)):
+            raise InvalidStateSpecException("root must be a path", root)
+        root = Path(root).resolve()
+
+        entries = data.get("items") or []
+        if not isinstance(entries, list):
+            raise InvalidStateSpecException("items must be a list", entries)
+
+        items = []
+        seen = set()
+        for entry in entries:
+            item = cls._parse_item(entry)
+            # Absolute paths replace the root and ".." climbs out of it
+            item.path = Path(os.path.normpath(root / item.path))
+            if root not in item.path.parents:
+                raise InvalidStateSpecException("item path must be inside root", entry)
+            if item.path in seen:
+                raise InvalidStateSpecException("duplicate path", entry)
+            seen.add(item.path)
+            items.append(item)
+
+        absent = {item.path for item in items if not item.present}
+        for item in items:
+            if item.present and not absent.isdisjoint(item.path.parents):
+                raise InvalidStateSpecException(
+                    "a present item can't be inside an absent one", item
+                )
+
+        return cls(items, workers=workers)
+
+    @classmethod
+    def from_yaml(
+        cls,
+        path: PathOrString,
+        root: PathOrString | None = None,
+        workers: int | None = None,
+    ) -> StateManager:
+        """Build a manager from a YAML spec file.
+
+        A relative spec root is taken from the spec file's directory. Requires
+        PyYAML (``pip install wexample-file[yaml]``).
+        """
+        from pathlib import Path
+
+        from wexample_file.common.local_file import LocalFile
+
+        try:
+            import yaml
+        except ImportError as e:
+            raise ImportError(
+                "Reading a YAML state spec requires PyYAML: "
+                "pip install wexample-file[yaml]"
+            ) from e
+
+        spec_file = LocalFile(path, check_exists=True)
+        data = yaml.load(
+            spec_file.read(), Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        )
+        if root is None and isinstance(data, dict):
+            root = spec_file.path.parent / Path(data.get("root", "."))
+
+        return cls.from_dict(data if data is not None else {}, root, workers)
+
+    def plan(self, cache: FingerprintCache | None = None) -> StatePlan:
+        """Compare the declared state with the disk and list what to change.
+
+        Parameters:
+            cache: Fingerprint cache used to skip reading unchanged files.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        from wexample_file.common.state_plan import StatePlan
+
+        if self.workers == 1 or len(self.items) < 2:
+            results = [self._plan_item(item, cache) for item in self.items]
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                results = list(
+                    executor.map(lambda item: self._plan_item(item, cache), self.items)
+                )
+
+        return StatePlan([action for action in results if action is not None])
+
+    @staticmethod
+    def _parse_item(entry: Any) -> StateItem:
+        from pathlib import Path
+
+        from wexample_file.classes.state_item import StateItem
+        from wexample_file.enum.local_path_type import LocalPathType
+        from wexample_file.exception.invalid_state_spec_exception import (
+            InvalidStateSpecException,
+        )
+
+        if not isinstance(entry, dict):
+            raise InvalidStateSpecException("each item must be a mapping", entry)
+
+        path = entry.get("path")
+        if not isinstance(path, str) or not path:
+            raise InvalidStateSpecException("item path must be a string", entry)
+
+        try:
+            item_type = LocalPathType(entry.get("type", LocalPathType.FILE.value))
+        except ValueError:
+            raise InvalidStateSpecException(
+                "item type must be 'file' or 'directory'", entry
+            )
+
+        state = entry.get("state", "present")
+        if state not in ("present", "absent"):
+            raise InvalidStateSpecException(
+                "item state must be 'present' or 'absent'", entry
+            )
+
+        content = entry.get("content")
+        if content is not None and (
+            item_type is not LocalPathType.FILE or not isinstance(content, str)
+        ):
+            raise InvalidStateSpecException(
+                "content must be a string and is only allowed on files", entry
+            )
+
+        mode = entry.get("mode")
+        if mode is not None:
+            try:
+                mode = int(mode, 8) if isinstance(mode, str) else int(mode)
+            except (TypeError, ValueError):
+                raise InvalidStateSpecException("mode must be an octal number", entry)
+            if not 0 <= mode <= 0o7777:
+                raise InvalidStateSpecException("mode is out of range", entry)
+
+        return StateItem(
+            path=Path(path),
+            type=item_type,
+            content=content,
+            mode=mode,
+            present=state == "present",
+        )
+
+    @staticmethod
+    def _plan_item(
+        item: StateItem, cache: FingerprintCache | None
+    ) -> StateAction | None:
+        import stat
+
+        from wexample_file.classes.state_action import StateAction
+        from wexample_file.common.local_file import LocalFile
+        from wexample_file.enum.local_path_type import LocalPathType
+        from wexample_file.enum.state_action_type import StateActionType
+
+        # Single stat per item: has_content() reuses the snapshot.
+        local_file = LocalFile.from_resolved(item.path, use_stat_cache=True)
+        stat_result = local_file.get_stat()
+
+        if not item.present:
+            if stat_result is None:
+                return None
+            return StateAction(item, StateActionType.REMOVE, reason="exists")
+
+        if stat_result is None:
+            if item.type is LocalPathType.DIRECTORY:
+                return StateAction(
+                    item, StateActionType.CREATE_DIRECTORY, reason="missing"
+                )
+            return StateAction(item, StateActionType.CREATE_FILE, reason="missing")
+
+        is_dir = stat.S_ISDIR(stat_result.st_mode)
+        if item.type is LocalPathType.DIRECTORY and not is_dir:
+            return StateAction(
+                item, StateActionType.CONFLICT, reason="exists and is not a directory"
+            )
+        if item.type is LocalPathType.FILE and is_dir:
+            return StateAction(
+                item, StateActionType.CONFLICT, reason="exists and is a directory"
+            )
+
+        if item.content is not None and not local_file.has_content(
+            item.content, cache=cache
+        ):
+            return StateAction(
+                item, StateActionType.UPDATE_FILE, reason="content differs"
+            )
+
+        if item.mode is not None and stat.S_IMODE(stat_result.st_mode) != item.mode:
+            return StateAction(item, StateActionType.CHANGE_MODE, reason="mode differs")
+
+        return None
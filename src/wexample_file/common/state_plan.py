@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from wexample_file.classes.state_action import StateAction
+    from wexample_file.common.fingerprint_cache import FingerprintCache
+
+
+class StatePlan:
+    """Ordered list of changes needed to bring paths to their declared state.
+
+    Applying runs creations and updates level by level from the shallowest
+    path down, so parents always exist before their children, then removals
+    from the deepest path up. Paths of the same level are independent and run
+    on a thread pool. A failing action records its error and never stops the
+    others.
+    """
+
+    def __init__(self, actions: list[StateAction]) -> None:
+        self.actions = actions
+
+    def __iter__(self) -> Iterator[StateAction]:
+        return iter(self.actions)
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+    def apply(
+        self,
+        workers: int | None = None,
+        atomic: bool = False,
+        cache: FingerprintCache | None = None,
+    ) -> StatePlan:
+        """Execute every action except conflicts, and return the plan itself.
+
+        Parameters:
+            workers: Thread pool size per level; 1 runs inline.
+            atomic: Write file contents through a temporary file and rename.
+            cache: Fingerprint cache updated with the digest of written files.
+        """
+        from wexample_file.enum.state_action_type import StateActionType
+
+        changes = []
+        removals = []
+        for action in self.actions:
+            if action.type is StateActionType.REMOVE:
+                removals.append(action)
+            elif action.type is not StateActionType.CONFLICT:
+                changes.append(action)
+
+        for level in self._levels(changes, reverse=False):
+            self._run(
+                level, lambda action: self._apply_change(action, atomic, cache), workers
+            )
+        for level in self._levels(removals, reverse=True):
+            self._run(level, self._apply_removal, workers)
+
+        return self
+
+    @property
+    def conflicts(self) -> list[StateAction]:
+        from wexample_file.enum.state_action_type import StateActionType
+
+        return [a for a in self.actions if a.type is StateActionType.CONFLICT]
+
+    @property
+    def errors(self) -> list[StateAction]:
+        return [a for a in self.actions if a.error is not None]
+
+    def is_empty(self) -> bool:
+        return not self.actions
+
+    def summary(self) -> dict[str, int]:
+        """Number of actions per action type value."""
+        counts: dict[str, int] = {}
+        for action in self.actions:
+            counts[action.type.value] = counts.get(action.type.value, 0) + 1
+        return counts
+
+    @staticmethod
+    def _apply_change(
+        action: StateAction, atomic: bool, cache: FingerprintCache | None
+    ) -> None:
+        from wexample_file.common.local_directory import LocalDirectory
+        from wexample_file.common.local_file import LocalFile
+        from wexample_file.enum.state_action_type import StateActionType
+        from wexample_file.helper.storage import storage_get_backend
+
+        item = action.item
+        if action.type is StateActionType.CREATE_DIRECTORY:
+            LocalDirectory.from_resolved(item.path).create()
+        elif action.type in (
+            StateActionType.CREATE_FILE,
+            StateActionType.UPDATE_FILE,
+        ):
+            local_file = LocalFile.from_resolved(item.path)
+            if item.content is None:
+                local_file.touch()
+            else:
+                local_file.write(item.content, atomic=atomic, cache=cache)
+
+        if item.mode is not None:
+            storage_get_backend().chmod(item.path, item.mode)
+
+    @staticmethod
+    def _apply_removal(action: StateAction) -> None:
+        import stat
+
+        from wexample_file.common.local_directory import LocalDirectory
+        from wexample_file.common.local_file import LocalFile
+        from wexample_file.helper.storage import storage_get_backend
+
+        path = action.item.path
+        stat_result = storage_get_backend().stat(path, follow_symlinks=False)
+        if stat_result is not None and stat.S_ISDIR(stat_result.st_mode):
+            LocalDirectory.from_resolved(path).remove()
+        else:
+            LocalFile.from_resolved(path).remove()
+
+    @staticmethod
+    def _levels(actions: list[StateAction], reverse: bool) -> list[list[StateAction]]:
+        levels: dict[int, list[StateAction]] = {}
+        for action in actions:
+            levels.setdefault(len(action.item.path.parts), []).append(action)
+        return [levels[depth] for depth in sorted(levels, reverse=reverse)]
+
+    @staticmethod
+    def _run(
+        actions: list[StateAction],
+        operation: Callable[[StateAction], None],
+        workers: int | None,
+    ) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        def run_one(action: StateAction) -> None:
+            try:
+                operation(action)
+            except Exception as e:
+                action.error = e
+            else:
+                action.applied = True
+
+        if workers == 1 or len(actions) < 2:
+            for action in actions:
+                run_one(action)
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(run_one, actions))
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from enum import Enum
+
+
+class FileChangeType(Enum):
+    """Kinds of change reported by a directory watcher."""
+
+    CREATED = "created"
+    DELETED = "deleted"
+    MODIFIED = "modified"
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+from enum import Enum
+
+
+class StateActionType(Enum):
+    """Changes a state plan can make to a path."""
+
+    CHANGE_MODE = "change_mode"
+    CONFLICT = "conflict"
+    CREATE_DIRECTORY = "create_directory"
+    CREATE_FILE = "create_file"
+    REMOVE = "remove"
+    UPDATE_FILE = "update_file"
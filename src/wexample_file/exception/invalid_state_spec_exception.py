@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from typing import Any
+
+from wexample_helpers.exception.undefined_exception import UndefinedException
+
+
+class InvalidStateSpecException(UndefinedException):
+    error_code: str = "INVALID_STATE_SPEC"
+
+    def __init__(self, reason: str, entry: Any = None) -> None:
+        super().__init__(f"Invalid state spec: {reason}", data={"entry": repr(entry)})
@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+from wexample_helpers.exception.undefined_exception import UndefinedException
+
+
+class UnsupportedBackendException(UndefinedException):
+    error_code: str = "UNSUPPORTED_BACKEND"
+
+    def __init__(self, path, method: str, backend: str) -> None:
+        super().__init__(
+            f"{method}() is not supported by the {backend} storage backend: {path}",
+            data={"path": str(path), "method": method, "backend": backend},
+        )
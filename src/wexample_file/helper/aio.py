@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterator
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+T = TypeVar("T")
+
+# Default number of threads blocking file operations are offloaded to.
+AIO_MAX_WORKERS: int = 8
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def aio_close(iterator: Iterator[Any], pending: Future | None = None) -> None:
+    """Close a generator, once the call ``pending`` still runs on it, if any.
+
+    A generator can't be closed while a worker thread runs it ("generator already
+    executing"), which happens when the awaiting task is cancelled mid-call: it
+    is then closed by the worker thread as soon as that call returns.
+    """
+    close = getattr(iterator, "close", None)
+    if close is None:
+        return
+    if pending is None or pending.done():
+        close()
+    else:
+        pending.add_done_callback(lambda _: close())
+
+
+def aio_get_executor() -> ThreadPoolExecutor:
+    """Return the shared executor async file operations run on, creating it once."""
+    global _executor
+
+    if _executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        _executor = ThreadPoolExecutor(
+            max_workers=AIO_MAX_WORKERS, thread_name_prefix="wexample_file_aio"
+        )
+    return _executor
+
+
+async def aio_iterate(iterator: Iterator[T], batch_size: int = 1) -> AsyncIterator[T]:
+    """
+    Consume a blocking iterator from the executor and yield its items asynchronously.
+
+    Items are pulled ``batch_size`` at a time to limit thread hops for small items
+    such as lines. The iterator is closed when iteration stops early.
+    """
+    import asyncio
+    from itertools import islice
+
+    pending = None
+    try:
+        while True:
+            pending = aio_submit(lambda: list(islice(iterator, batch_size)))
+            batch = await asyncio.wrap_future(pending)
+            if not batch:
+                break
+            for item in batch:
+                yield item
+    finally:
+        aio_close(iterator, pending)
+
+
+async def aio_run(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking function on the shared executor without blocking the event loop.
+
+    Exceptions raised by the function propagate unchanged to the awaiting caller.
+    """
+    import asyncio
+
+    return await asyncio.wrap_future(aio_submit(func, *args, **kwargs))
+
+
+def aio_set_max_workers(max_workers: int) -> None:
+    """Bound the number of concurrent blocking operations; replaces the executor."""
+    global AIO_MAX_WORKERS, _executor
+
+    AIO_MAX_WORKERS = max_workers
+    previous, _executor = _executor, None
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+def aio_submit(func: Callable[..., T], *args: Any, **kwargs: Any) -> Future[T]:
+    """Start a blocking function on the shared executor, return its future."""
+    return aio_get_executor().submit(func, *args, **kwargs)
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import PurePath
+    from types import ModuleType
+    from typing import IO
+
+# Codec of each compressed file extension, compared lowercased.
+CODEC_EXTENSIONS: dict[str, str] = {
+    "bz2": "bz2",
+    "gz": "gzip",
+    "xz": "xz",
+    "zst": "zstd",
+}
+# Level used when none is given; gzip's is zlib's default rather than gzip.open's 9.
+CODEC_DEFAULT_LEVELS: dict[str, int] = {
+    "bz2": 9,
+    "gzip": 6,
+    "xz": 6,
+    "zstd": 3,
+}
+# Buffer in front of compressors and after decompressors, to batch small calls.
+CODEC_BUFFER_SIZE: int = 1024 * 1024
+
+
+def codec_compress(
+    data: bytes,
+    codec: str,
+    level: int | None = None,
+    buffer_size: int = CODEC_BUFFER_SIZE,
+) -> bytes:
+    """Compress ``data`` at once, giving the same bytes as a ``codec_writer``."""
+    buffer = io.BytesIO()
+    with codec_writer(buffer, codec, level, buffer_size) as stream:
+        stream.write(data)
+    return buffer.getvalue()
+
+
+def codec_from_path(path: PurePath) -> str | None:
+    """Return the codec of a path from its extension, None if it isn't compressed."""
+    from wexample_file.helper.path import path_get_extension
+
+    return CODEC_EXTENSIONS.get(path_get_extension(path).lower())
+
+
+def codec_reader(
+    raw: IO[bytes], codec: str, buffer_size: int = CODEC_BUFFER_SIZE
+) -> IO[bytes]:
+    """Wrap a binary file open for reading into a stream of its decompressed content.
+
+    Closing the stream leaves ``raw`` open.
+
+    Raises:
+        ValueError: If the codec is unknown.
+        ImportError: If zstd is not available, see ``codec_zstd_module``.
+    """
+    if codec == "gzip":
+        import gzip
+
+        stream = gzip.GzipFile(fileobj=raw, mode="rb")
+    elif codec == "bz2":
+        import bz2
+
+        stream = bz2.BZ2File(raw, "rb")
+    elif codec == "xz":
+        import lzma
+
+        stream = lzma.LZMAFile(raw, "rb")
+    elif codec == "zstd":
+        zstd = codec_zstd_module()
+        if zstd.__name__ == "zstandard":
+            stream = zstd.ZstdDecompressor().stream_reader(raw, closefd=False)
+        else:
+            stream = zstd.ZstdFile(raw, "rb")
+    else:
+        raise ValueError(f"unknown codec: {codec!r}")
+
+    return io.BufferedReader(stream, buffer_size)
+
+
+def codec_writer(
+    raw: IO[bytes],
+    codec: str,
+    level: int | None = None,
+    buffer_size: int = CODEC_BUFFER_SIZE,
+) -> IO[bytes]:
+    """Wrap a binary file open for writing into a stream compressing what it gets.
+
+    Closing the stream ends the compressed data but leaves ``raw`` open. The
+    output only depends on the content and the level, so unchanged content can
+    be detected by comparing the compressed bytes.
+
+    Raises:
+        ValueError: If the codec is unknown.
+        ImportError: If zstd is not available, see ``codec_zstd_module``.
+    """
+    if codec not in CODEC_DEFAULT_LEVELS:
+        raise ValueError(f"unknown codec: {codec!r}")
+    if level is None:
+        level = CODEC_DEFAULT_LEVELS[codec]
+
+    if codec == "gzip":
+        import gzip
+
+        # No file name nor time in the header
+        stream = gzip.GzipFile(
+            filename="", fileobj=raw, mode="wb", compresslevel=level, mtime=0
+        )
+    elif codec == "bz2":
+        import bz2
+
+        stream = bz2.BZ2File(raw, "wb", compresslevel=level)
+    elif codec == "xz":
+        import lzma
+
+        stream = lzma.LZMAFile(raw, "wb", preset=level)
+    else:
+        zstd = codec_zstd_module()
+        if zstd.__name__ == "zstandard":
+            stream = zstd.ZstdCompressor(level=level).stream_writer(raw, closefd=False)
+        else:
+            stream = zstd.ZstdFile(raw, "wb", level=level)
+
+    return io.BufferedWriter(stream, buffer_size)
+
+
+def codec_zstd_module() -> ModuleType:
+    """Return the zstd implementation: the standard library one, else zstandard.
+
+    Raises:
+        ImportError: If neither is available (Python < 3.14 without zstandard).
+    """
+    try:
+        from compression import zstd
+
+        return zstd
+    except ImportError:
+        pass
+
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "Zstandard compression requires Python 3.14 or the zstandard package: "
+            "pip install wexample-file[zstd]"
+        ) from e
+    return zstandard
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import os
+    import re
+    from collections.abc import Callable, Iterable, Iterator
+
+    from wexample_helpers.const.types import PathOrString
+
+    from wexample_file.classes.disk_usage import DiskUsage
+    from wexample_file.common.disk_usage_cache import DiskUsageCache
+
+
+def directory_compile_patterns(
+    patterns: Iterable[str] | None,
+) -> Callable[[str, str], bool] | None:
+    """
+    Compile glob patterns into a single matcher called with (name, relative_path).
+
+    Patterns containing a "/" are matched against the POSIX path relative to the
+    walked root, the others against the entry name only. Returns None when there is
+    no pattern, so callers can skip matching entirely.
+    """
+    import fnmatch
+    import re
+
+    name_patterns: list[str] = []
+    path_patterns: list[str] = []
+    for pattern in patterns or ():
+        target = path_patterns if "/" in pattern else name_patterns
+        target.append(fnmatch.translate(pattern))
+
+    if not name_patterns and not path_patterns:
+        return None
+
+    name_regex = _directory_join_patterns(name_patterns)
+    path_regex = _directory_join_patterns(path_patterns)
+
+    def matches(name: str, relative_path: str) -> bool:
+        return bool(
+            (name_regex and name_regex.match(name))
+            or (path_regex and path_regex.match(relative_path))
+        )
+
+    return matches
+
+
+def directory_copy(
+    source: PathOrString, destination: PathOrString, workers: int | None = None
+) -> None:
+    """
+    Copy the content of a directory tree into another one, copying files in parallel.
+
+    Directories are created first, top-down, then files are copied over a thread
+    pool with file_copy (kernel side copies when supported). Symlinks are
+    recreated as symlinks. Existing files in the destination are overwritten.
+    """
+    import os
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor
+
+    from wexample_file.helper.file import file_copy
+
+    source = os.fspath(source)
+    destination = os.fspath(destination)
+    os.makedirs(destination, exist_ok=True)
+
+    files: list[tuple[str, str]] = []
+    directories: list[tuple[str, str]] = [(source, destination)]
+    for entry in directory_walk(source):
+        target = os.path.join(destination, os.path.relpath(entry.path, source))
+        if entry.is_symlink():
+            if os.path.lexists(target):
+                os.unlink(target)
+            os.symlink(os.readlink(entry.path), target)
+        elif entry.is_dir():
+            os.makedirs(target, exist_ok=True)
+            directories.append((entry.path, target))
+        else:
+            files.append((entry.path, target))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # Consume results so that the first failure is raised
+        for _ in executor.map(lambda pair: file_copy(*pair), files):
+            pass
+
+    # Copied last, as creating entries updates the directory times
+    for source_directory, target_directory in reversed(directories):
+        shutil.copystat(source_directory, target_directory)
+
+
+def directory_disk_usage(
+    root: PathOrString,
+    workers: int | None = 1,
+    cache: DiskUsageCache | None = None,
+) -> DiskUsage:
+    """
+    Compute the total size, file and directory counts of a tree in a single pass.
+
+    Sizes come from the scandir entries (symlinks are counted, not followed).
+    Unreadable directories and entries vanishing during the scan are skipped.
+
+    Parameters:
+        workers: When not 1, the subtrees of root are scanned over a thread pool
+            of this size (None lets the executor choose).
+        cache: Reuses the results of directories whose mtime did not change
+            since the previous scan, see DiskUsageCache.
+    """
+    import os
+
+    from wexample_file.classes.disk_usage import DiskUsage
+
+    root = os.path.normpath(os.fspath(root))
+    if workers == 1:
+        return _directory_disk_usage_tree(root, cache)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    own, subdirectories = _directory_disk_usage_own(root, cache)
+    usage = DiskUsage()
+    usage.merge(own)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for subtree_usage in executor.map(
+            lambda directory: _directory_disk_usage_tree(directory, cache),
+            subdirectories,
+        ):
+            usage.merge(subtree_usage)
+    return usage
+
+
+def directory_remove(root: PathOrString, workers: int | None = None) -> None:
+    """
+    Remove a directory tree, unlinking its files in parallel.
+
+    Files and symlinks are unlinked over a thread pool, then directories are
+    removed bottom-up, one depth level at a time. Entries already gone are
+    ignored, so concurrent removals don't fail.
+    """
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+
+    root = os.path.normpath(os.fspath(root))
+    files: list[str] = []
+    directories_by_depth: dict[int, list[str]] = {0: [root]}
+    for entry in directory_walk(root):
+        if entry.is_dir(follow_symlinks=False):
+            depth = entry.path.count(os.sep) - root.count(os.sep)
+            directories_by_depth.setdefault(depth, []).append(entry.path)
+        else:
+            files.append(entry.path)
+
+    def ignore_missing(remove, path: str) -> None:
+        try:
+            remove(path)
+        except FileNotFoundError:
+            pass
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for _ in executor.map(lambda path: ignore_missing(os.unlink, path), files):
+            pass
+        for depth in sorted(directories_by_depth, reverse=True):
+            for _ in executor.map(
+                lambda path: ignore_missing(os.rmdir, path),
+                directories_by_depth[depth],
+            ):
+                pass
+
+
+def directory_walk(
+    root: PathOrString,
+    include: Iterable[str] | None = None,
+    exclude: Iterable[str] | None = None,
+    prune: Iterable[str] | None = None,
+    max_depth: int | None = None,
+    follow_symlinks: bool = False,
+    scandir: Callable[[str], Iterator[os.DirEntry]] | None = None,
+) -> Iterator[os.DirEntry]:
+    """
+    Walk a tree top-down with os.scandir and yield its entries lazily.
+
+    Entry types come from the directory listing itself, so no extra stat is made
+    except for symlinks. Unreadable directories are skipped.
+
+    Parameters:
+        include: Glob patterns an entry must match to be yielded.
+        exclude: Glob patterns of entries not to yield.
+        prune: Glob patterns of directories neither descended into nor yielded
+            (e.g. ".git", "node_modules").
+        max_depth: Deepest level yielded, 1 being the direct children of root.
+        follow_symlinks: Descend into symlinked directories.
+        scandir: Function listing a directory, ``os.scandir`` by default, e.g. the
+            ``scandir`` method of a storage backend.
+    """
+    import os
+
+    if scandir is None:
+        scandir = os.scandir
+    include_matches = directory_compile_patterns(include)
+    exclude_matches = directory_compile_patterns(exclude)
+    prune_matches = directory_compile_patterns(prune)
+
+    stack: list[tuple[str, str, int]] = [(os.fspath(root), "", 1)]
+    while stack:
+        directory, prefix, depth = stack.pop()
+        try:
+            scanner = scandir(directory)
+        except OSError:
+            continue
+
+        subdirectories: list[tuple[str, str, int]] = []
+        with scanner:
+            for entry in scanner:
+                relative_path = prefix + entry.name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if is_dir:
+                    if prune_matches and prune_matches(entry.name, relative_path):
+                        continue
+                    if (max_depth is None or depth < max_depth) and (
+                        follow_symlinks or not entry.is_symlink()
+                    ):
+                        subdirectories.append(
+                            (entry.path, relative_path + "/", depth + 1)
+                        )
+
+                if include_matches and not include_matches(entry.name, relative_path):
+                    continue
+                if exclude_matches and exclude_matches(entry.name, relative_path):
+                    continue
+                yield entry
+
+        # Reversed so that directories are visited in listing order
+        stack.extend(reversed(subdirectories))
+
+
+def _directory_disk_usage_own(
+    directory: str, cache: DiskUsageCache | None
+) -> tuple[DiskUsage, list[str]]:
+    """Usage of the files directly inside a directory, and its subdirectories."""
+    import os
+
+    from wexample_file.classes.disk_usage import DiskUsage
+    from wexample_file.helper.path import path_name_get_extension
+
+    mtime_ns = None
+    if cache is not None:
+        # Taken before listing, so a change during the scan invalidates it
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError:
+            return DiskUsage(), []
+        cached = cache.get(directory, mtime_ns)
+        if cached is not None:
+            return cached
+
+    own = DiskUsage()
+    subdirectories: list[str] = []
+    try:
+        scanner = os.scandir(directory)
+    except OSError:
+        return own, subdirectories
+
+    with scanner:
+        for entry in scanner:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    own.directory_count += 1
+                    subdirectories.append(entry.path)
+                else:
+                    own.add_file(
+                        path_name_get_extension(entry.name),
+                        entry.stat(follow_symlinks=False).st_size,
+                    )
+            except OSError:
+                continue
+
+    if cache is not None:
+        cache.set(directory, mtime_ns, own, subdirectories)
+    return own, subdirectories
+
+
+def _directory_disk_usage_tree(
+    directory: str, cache: DiskUsageCache | None
+) -> DiskUsage:
+    from wexample_file.classes.disk_usage import DiskUsage
+
+    usage = DiskUsage()
+    stack = [directory]
+    while stack:
+        own, subdirectories = _directory_disk_usage_own(stack.pop(), cache)
+        usage.merge(own)
+        stack.extend(subdirectories)
+    return usage
+
+
+def _directory_join_patterns(patterns: list[str]) -> re.Pattern | None:
+    import re
+
+    return re.compile("|".join(patterns)) if patterns else None
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wexample_helpers.const.types import PathOrString
+
+# Largest amount of bytes handed to the kernel per copy call.
+FILE_COPY_KERNEL_CHUNK_SIZE: int = 1024 * 1024 * 1024
+# Buffer size of the userspace fallback copy.
+FILE_COPY_BUFFER_SIZE: int = 1024 * 1024
+
+
+def file_copy(
+    source: PathOrString, destination: PathOrString, copy_stat: bool = True
+) -> None:
+    """
+    Copy a file's content, then its permission bits and times unless disabled.
+
+    The copy is done in the kernel when possible: copy_file_range (which can
+    share blocks on copy-on-write filesystems), then sendfile, falling back to a
+    buffered userspace copy when neither is supported.
+    """
+    import shutil
+
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        if not _file_copy_kernel(src.fileno(), dst.fileno()):
+            shutil.copyfileobj(src, dst, FILE_COPY_BUFFER_SIZE)
+
+    if copy_stat:
+        shutil.copystat(source, destination)
+
+
+def _file_copy_kernel(in_fd: int, out_fd: int) -> bool:
+    """Copy between two descriptors in the kernel, False if nothing supports it."""
+    import errno
+    import os
+
+    unsupported = {
+        errno.EXDEV,
+        errno.ENOSYS,
+        errno.EINVAL,
+        errno.EOPNOTSUPP,
+        errno.ENOTSUP,
+        errno.EBADF,
+        errno.ENOTSOCK,
+    }
+
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        copied = 0
+        try:
+            while n := copy_file_range(in_fd, out_fd, FILE_COPY_KERNEL_CHUNK_SIZE):
+                copied += n
+            return True
+        except OSError as e:
+            # Only fall back when nothing was written yet
+            if copied or e.errno not in unsupported:
+                raise
+
+    sendfile = getattr(os, "sendfile", None)
+    if sendfile is not None:
+        offset = 0
+        try:
+            while n := sendfile(out_fd, in_fd, offset, FILE_COPY_KERNEL_CHUNK_SIZE):
+                offset += n
+            return True
+        except OSError as e:
+            if offset or e.errno not in unsupported:
+                raise
+
+    return False
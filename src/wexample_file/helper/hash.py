@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wexample_helpers.const.types import PathOrString
+
+    from wexample_file.common.fingerprint_cache import FingerprintCache
+
+# Size of the reads fed to the hash function.
+HASH_CHUNK_SIZE: int = 1024 * 1024
+
+
+def hash_file(
+    path: PathOrString,
+    algorithm: str = "sha256",
+    chunk_size: int = HASH_CHUNK_SIZE,
+    cache: FingerprintCache | None = None,
+) -> str:
+    """
+    Return the hex digest of a file, streamed through a single reusable buffer.
+
+    With a cache, the file is stat'ed first and only read when its size, mtime
+    or inode changed since its digest was stored.
+    """
+    if cache is None:
+        return _hash_file_content(path, algorithm, chunk_size)
+
+    import os
+
+    # Taken before reading, so a change during the read invalidates the entry
+    stat_result = os.stat(path)
+    digest = cache.get(path, stat_result, algorithm)
+    if digest is None:
+        digest = _hash_file_content(path, algorithm, chunk_size)
+        cache.set(path, stat_result, algorithm, digest)
+    return digest
+
+
+def hash_tree(
+    root: PathOrString,
+    algorithm: str = "sha256",
+    workers: int | None = None,
+    cache: FingerprintCache | None = None,
+) -> str:
+    """
+    Return a Merkle-style digest of a directory tree.
+
+    Each directory digest covers the sorted names, kinds and digests of its
+    entries, so two trees have the same digest exactly when they hold the same
+    names and contents. Symlinks are hashed by target, not followed. Files are
+    hashed over a thread pool; hashlib releases the GIL while hashing, so large
+    files are processed concurrently.
+    """
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+
+    from wexample_file.helper.directory import directory_walk
+
+    root = os.path.normpath(os.fspath(root))
+    children: dict[str, list[tuple[bytes, str, str]]] = {root: []}
+    files: list[str] = []
+    for entry in directory_walk(root):
+        parent = os.path.dirname(entry.path)
+        if entry.is_symlink():
+            children[parent].append((b"l", entry.name, os.readlink(entry.path)))
+        elif entry.is_dir():
+            children[entry.path] = []
+            children[parent].append((b"d", entry.name, entry.path))
+        else:
+            files.append(entry.path)
+            children[parent].append((b"f", entry.name, entry.path))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        digests = dict(
+            zip(
+                files,
+                executor.map(
+                    lambda path: hash_file(path, algorithm, cache=cache), files
+                ),
+            )
+        )
+
+    return hash_tree_digest(root, children, digests, algorithm)
+
+
+def hash_tree_digest(
+    root: str,
+    children: dict[str, list[tuple[bytes, str, str]]],
+    digests: dict[str, str],
+    algorithm: str = "sha256",
+) -> str:
+    """
+    Combine the entries of a tree into the digest returned by ``hash_tree``.
+
+    ``children`` maps each directory path to its (kind, name, value) entries,
+    kind being b"f", b"d" or b"l" and value the path of the file or directory,
+    or the target of the link. ``digests`` holds the digest of every file and
+    receives the one of every directory.
+    """
+    import hashlib
+    import os
+
+    # Deepest directories first, so children digests are known before parents
+    for directory in sorted(
+        children, key=lambda path: path.count(os.sep), reverse=True
+    ):
+        hasher = hashlib.new(algorithm)
+        for kind, name, value in sorted(children[directory], key=lambda c: c[1]):
+            digest = os.fsencode(value) if kind == b"l" else digests[value].encode()
+            hasher.update(b"%s %s\0%s\n" % (kind, os.fsencode(name), digest))
+        digests[directory] = hasher.hexdigest()
+
+    return digests[root]
+
+
+def _hash_file_content(path: PathOrString, algorithm: str, chunk_size: int) -> str:
+    import hashlib
+
+    hasher = hashlib.new(algorithm)
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as fh:
+        while size := fh.readinto(buffer):
+            hasher.update(view[:size])
+    return hasher.hexdigest()
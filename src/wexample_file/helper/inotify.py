@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import struct
+from typing import Any
+
+# Event masks, from <sys/inotify.h>.
+INOTIFY_MODIFY: int = 0x00000002
+INOTIFY_ATTRIB: int = 0x00000004
+INOTIFY_CLOSE_WRITE: int = 0x00000008
+INOTIFY_MOVED_FROM: int = 0x00000040
+INOTIFY_MOVED_TO: int = 0x00000080
+INOTIFY_CREATE: int = 0x00000100
+INOTIFY_DELETE: int = 0x00000200
+INOTIFY_DELETE_SELF: int = 0x00000400
+INOTIFY_MOVE_SELF: int = 0x00000800
+INOTIFY_Q_OVERFLOW: int = 0x00004000
+INOTIFY_IGNORED: int = 0x00008000
+INOTIFY_ONLYDIR: int = 0x01000000
+INOTIFY_DONT_FOLLOW: int = 0x02000000
+INOTIFY_ISDIR: int = 0x40000000
+
+# inotify_init1() flags.
+INOTIFY_NONBLOCK: int = 0o4000
+INOTIFY_CLOEXEC: int = 0o2000000
+
+# Everything a tree watcher needs to mirror creations, changes and deletions.
+INOTIFY_WATCH_MASK: int = (
+    INOTIFY_MODIFY
+    | INOTIFY_ATTRIB
+    | INOTIFY_CLOSE_WRITE
+    | INOTIFY_MOVED_FROM
+    | INOTIFY_MOVED_TO
+    | INOTIFY_CREATE
+    | INOTIFY_DELETE
+    | INOTIFY_DELETE_SELF
+    | INOTIFY_MOVE_SELF
+    | INOTIFY_DONT_FOLLOW
+)
+
+# Size of the fixed part of an event: wd, mask, cookie, name length.
+INOTIFY_EVENT_HEADER = struct.Struct("iIII")
+
+_libc: Any = None
+
+
+def inotify_add_watch(fd: int, path: str, mask: int = INOTIFY_WATCH_MASK) -> int:
+    """Watch a directory and return its watch descriptor.
+
+    Raises:
+        OSError: If the path cannot be watched (missing, watch limit reached...).
+    """
+    import os
+
+    wd = _inotify_libc().inotify_add_watch(fd, os.fsencode(path), mask)
+    if wd < 0:
+        _inotify_raise(path)
+    return wd
+
+
+def inotify_available() -> bool:
+    """Whether the inotify API can be used on this system."""
+    import sys
+
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        libc = _inotify_libc()
+    except OSError:
+        return False
+    return hasattr(libc, "inotify_init1") and hasattr(libc, "inotify_add_watch")
+
+
+def inotify_init() -> int:
+    """Create a non blocking inotify instance and return its file descriptor."""
+    fd = _inotify_libc().inotify_init1(INOTIFY_NONBLOCK | INOTIFY_CLOEXEC)
+    if fd < 0:
+        _inotify_raise()
+    return fd
+
+
+def inotify_parse_events(data: bytes) -> list[tuple[int, int, int, str]]:
+    """Split a buffer read from an inotify descriptor into (wd, mask, cookie, name)."""
+    import os
+
+    events = []
+    header_size = INOTIFY_EVENT_HEADER.size
+    offset = 0
+    while offset + header_size <= len(data):
+        wd, mask, cookie, length = INOTIFY_EVENT_HEADER.unpack_from(data, offset)
+        offset += header_size
+        name = data[offset : offset + length].rstrip(b"\0")
+        offset += length
+        events.append((wd, mask, cookie, os.fsdecode(name)))
+    return events
+
+
+def inotify_rm_watch(fd: int, wd: int) -> None:
+    """Stop a watch; ignored if the kernel already dropped it."""
+    _inotify_libc().inotify_rm_watch(fd, wd)
+
+
+def _inotify_libc() -> Any:
+    global _libc
+
+    if _libc is None:
+        import ctypes
+        import ctypes.util
+
+        _libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+    return _libc
+
+
+def _inotify_raise(path: str | None = None) -> None:
+    import ctypes
+    import os
+
+    errno = ctypes.get_errno()
+    raise OSError(errno, os.strerror(errno), path)
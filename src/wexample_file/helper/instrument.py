@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from wexample_file.common.instrumentation import Instrumentation
+
+# Storage backend methods counted while instrumentation is active, with the
+# call name they are reported under. Files they open count the bytes moved.
+INSTRUMENT_BACKEND_CALLS: dict[str, str] = {
+    "chmod": "chmod",
+    "fsync": "fsync",
+    "fsync_directory": "fsync",
+    "mkdir": "mkdir",
+    "open": "open",
+    "replace": "rename",
+    "rmtree": "rmtree",
+    "scandir": "scandir",
+    "stat": "stat",
+    "touch": "touch",
+    "unlink": "unlink",
+}
+INSTRUMENT_BACKENDS: tuple[str, ...] = (
+    "wexample_file.common.memory_storage_backend.MemoryStorageBackend",
+    "wexample_file.common.os_storage_backend.OsStorageBackend",
+    "wexample_file.common.overlay_storage_backend.OverlayStorageBackend",
+)
+# Helpers working on the OS directly, bypassing the backend, each counted as a
+# single call named after the function.
+INSTRUMENT_HELPERS: tuple[str, ...] = (
+    "wexample_file.helper.directory.directory_copy",
+    "wexample_file.helper.directory.directory_disk_usage",
+    "wexample_file.helper.directory.directory_remove",
+    "wexample_file.helper.directory.directory_walk",
+    "wexample_file.helper.hash.hash_file",
+    "wexample_file.helper.hash.hash_tree",
+)
+# Classes whose public methods are timed.
+INSTRUMENT_CLASSES: tuple[str, ...] = (
+    "wexample_file.common.local_directory.LocalDirectory",
+    "wexample_file.common.local_file.LocalFile",
+)
+
+_active: list[Instrumentation] = []
+_lock = threading.Lock()
+_local = threading.local()
+# (owner, attribute, original value or None if the attribute was inherited)
+_patches: list[tuple[Any, str, Any]] = []
+
+
+def instrument_current_method() -> tuple[str, str] | None:
+    """Return the (item type, method) being run by the current thread, if any."""
+    stack = getattr(_local, "stack", None)
+    return stack[-1] if stack else None
+
+
+def instrument_start(instrumentation: Instrumentation) -> None:
+    """Activate an instrumentation, patching the measured functions if needed."""
+    with _lock:
+        if instrumentation in _active:
+            return
+        _active.append(instrumentation)
+        if len(_active) == 1:
+            _instrument_install()
+
+
+def instrument_stop(instrumentation: Instrumentation) -> None:
+    """Deactivate an instrumentation; the last one restores the originals."""
+    with _lock:
+        if instrumentation not in _active:
+            return
+        _active.remove(instrumentation)
+        if not _active:
+            _instrument_uninstall()
+
+
+class _InstrumentedFile:
+    """Proxy of an open file counting the bytes going through it."""
+
+    def __init__(self, file: Any) -> None:
+        self._file = file
+
+    def __enter__(self) -> _InstrumentedFile:
+        self._file.__enter__()
+        return self
+
+    def __exit__(self, *args: Any) -> Any:
+        return self._file.__exit__(*args)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._file, name)
+
+    def __iter__(self) -> _InstrumentedFile:
+        return self
+
+    def __next__(self) -> Any:
+        line = next(self._file)
+        _instrument_record(None, bytes_read=len(line))
+        return line
+
+    def read(self, *args: Any) -> Any:
+        data = self._file.read(*args)
+        _instrument_record(None, bytes_read=len(data))
+        return data
+
+    def read1(self, *args: Any) -> Any:
+        data = self._file.read1(*args)
+        _instrument_record(None, bytes_read=len(data))
+        return data
+
+    def readinto(self, buffer: Any) -> Any:
+        size = self._file.readinto(buffer)
+        _instrument_record(None, bytes_read=size or 0)
+        return size
+
+    def readline(self, *args: Any) -> Any:
+        line = self._file.readline(*args)
+        _instrument_record(None, bytes_read=len(line))
+        return line
+
+    def readlines(self, *args: Any) -> Any:
+        lines = self._file.readlines(*args)
+        _instrument_record(None, bytes_read=sum(len(line) for line in lines))
+        return lines
+
+    def write(self, data: Any) -> Any:
+        size = self._file.write(data)
+        _instrument_record(None, bytes_written=len(data) if size is None else size)
+        return size
+
+    def writelines(self, lines: Any) -> None:
+        for line in lines:
+            self.write(line)
+
+
+def _instrument_class_methods(cls: type) -> Iterator[tuple[str, Callable]]:
+    """Yield the public methods of ``cls`` worth timing, plus ``__init__``."""
+    import inspect
+
+    for name in dir(cls):
+        if name.startswith("_") and name != "__init__":
+            continue
+        function = inspect.getattr_static(cls, name)
+        if not inspect.isfunction(function):
+            # Skip properties, class and static methods.
+            continue
+        if not function.__module__.startswith("wexample_file."):
+            continue
+        if inspect.iscoroutinefunction(function) or inspect.isasyncgenfunction(
+            function
+        ):
+            # Async methods run their sync counterparts, timed on their own.
+            continue
+        yield name, function
+
+
+def _instrument_install() -> None:
+    from importlib import import_module
+
+    for qualified_name in INSTRUMENT_BACKENDS:
+        module_name, class_name = qualified_name.rsplit(".", 1)
+        cls = getattr(import_module(module_name), class_name)
+        for name, call in INSTRUMENT_BACKEND_CALLS.items():
+            _instrument_patch(
+                cls,
+                name,
+                _instrument_wrap_call(cls.__dict__[name], call, name == "open"),
+            )
+
+    for qualified_name in INSTRUMENT_HELPERS:
+        module_name, name = qualified_name.rsplit(".", 1)
+        module = import_module(module_name)
+        _instrument_patch(
+            module, name, _instrument_wrap_call(getattr(module, name), name)
+        )
+
+    for qualified_name in INSTRUMENT_CLASSES:
+        module_name, class_name = qualified_name.rsplit(".", 1)
+        cls = getattr(import_module(module_name), class_name)
+        for name, function in list(_instrument_class_methods(cls)):
+            _instrument_patch(
+                cls, name, _instrument_wrap_method(function, (class_name, name))
+            )
+
+
+def _instrument_patch(owner: Any, name: str, value: Any) -> None:
+    original = (
+        owner.__dict__.get(name) if isinstance(owner, type) else getattr(owner, name)
+    )
+    _patches.append((owner, name, original))
+    setattr(owner, name, value)
+
+
+def _instrument_record(
+    call: str | None, bytes_read: int = 0, bytes_written: int = 0
+) -> None:
+    method = instrument_current_method()
+    for instrumentation in list(_active):
+        instrumentation.record_call(method, call, bytes_read, bytes_written)
+
+
+def _instrument_uninstall() -> None:
+    while _patches:
+        owner, name, original = _patches.pop()
+        if original is None:
+            delattr(owner, name)
+        else:
+            setattr(owner, name, original)
+
+
+def _instrument_wrap_call(
+    function: Callable, call: str, opens: bool = False
+) -> Callable:
+    import functools
+
+    @functools.wraps(function)
+    def counted(*args: Any, **kwargs: Any) -> Any:
+        # Only the outermost call of a thread counts, e.g. not the layers
+        # of an overlay nor the walk of hash_tree.
+        if getattr(_local, "in_call", False):
+            return function(*args, **kwargs)
+
+        _local.in_call = True
+        try:
+            _instrument_record(call)
+            result = function(*args, **kwargs)
+        finally:
+            _local.in_call = False
+        return _InstrumentedFile(result) if opens else result
+
+    return counted
+
+
+def _instrument_wrap_method(function: Callable, method: tuple[str, str]) -> Callable:
+    import functools
+    import inspect
+    import time
+
+    def enter() -> list:
+        stack = getattr(_local, "stack", None)
+        if stack is None:
+            stack = _local.stack = []
+        stack.append(method)
+        return stack
+
+    def record(elapsed: float) -> None:
+        for instrumentation in list(_active):
+            instrumentation.record_method(method, elapsed)
+
+    if inspect.isgeneratorfunction(function):
+
+        @functools.wraps(function)
+        def timed_generator(*args: Any, **kwargs: Any) -> Iterator:
+            # Time is summed over the steps of the generator, which counts as a
+            # single call.
+            elapsed = 0.0
+            generator = function(*args, **kwargs)
+            try:
+                while True:
+                    stack = enter()
+                    start = time.perf_counter()
+                    try:
+                        item = next(generator)
+                    except StopIteration:
+                        return
+                    finally:
+                        stack.pop()
+                        elapsed += time.perf_counter() - start
+                    yield item
+            finally:
+                generator.close()
+                record(elapsed)
+
+        return timed_generator
+
+    @functools.wraps(function)
+    def timed(*args: Any, **kwargs: Any) -> Any:
+        stack = enter()
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            stack.pop()
+            record(time.perf_counter() - start)
+
+    return timed
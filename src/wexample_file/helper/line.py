@@ -1,23 +1,494 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
 
+from wexample_file.helper.codec import CODEC_BUFFER_SIZE
 
-def line_count_recursive(path: Path, pattern: str = "*") -> int:
+if TYPE_CHECKING:
+    import os
+    import re
+    from collections.abc import Callable, Iterable, Iterator
+
+    from wexample_file.classes.line_count_report import LineCountReport
+    from wexample_file.classes.line_stats import LineStats
+    from wexample_file.classes.line_stats_report import LineStatsReport
+    from wexample_file.common.line_count_cache import LineCountCache
+
+T = TypeVar("T")
+
+# Size of the binary reads used to count line breaks.
+LINE_COUNT_CHUNK_SIZE: int = 1024 * 1024
+# Number of files handed to a worker at once, to keep pool overhead low.
+LINE_COUNT_BATCH_SIZE: int = 256
+
+_C_LIKE = ((b"//",), ((b"/*", b"*/"),))
+_HASH = ((b"#",), ())
+_MARKUP = ((), ((b"<!--", b"-->"),))
+
+# Comment syntax per lowercase extension, used by line_stats:
+# (language, line comment prefixes, block comment delimiters).
+LINE_STATS_RULES: dict[
+    str, tuple[str, tuple[bytes, ...], tuple[tuple[bytes, bytes], ...]]
+] = {
+    "bash": ("Shell", *_HASH),
+    "c": ("C", *_C_LIKE),
+    "cc": ("C++", *_C_LIKE),
+    "cfg": ("INI", (b"#", b";"), ()),
+    "cpp": ("C++", *_C_LIKE),
+    "cs": ("C#", *_C_LIKE),
+    "css": ("CSS", (), ((b"/*", b"*/"),)),
+    "cxx": ("C++", *_C_LIKE),
+    "dart": ("Dart", *_C_LIKE),
+    "erl": ("Erlang", (b"%",), ()),
+    "ex": ("Elixir", *_HASH),
+    "exs": ("Elixir", *_HASH),
+    "go": ("Go", *_C_LIKE),
+    "h": ("C", *_C_LIKE),
+    "hpp": ("C++", *_C_LIKE),
+    "hs": ("Haskell", (b"--",), ((b"{-", b"-}"),)),
+    "htm": ("HTML", *_MARKUP),
+    "html": ("HTML", *_MARKUP),
+    "ini": ("INI", (b"#", b";"), ()),
+    "java": ("Java", *_C_LIKE),
+    "js": ("JavaScript", *_C_LIKE),
+    "json": ("JSON", (), ()),
+    "jsx": ("JavaScript", *_C_LIKE),
+    "kt": ("Kotlin", *_C_LIKE),
+    "kts": ("Kotlin", *_C_LIKE),
+    "less": ("LESS", *_C_LIKE),
+    "lua": ("Lua", (b"--",), ((b"--[[", b"]]"),)),
+    "md": ("Markdown", *_MARKUP),
+    "mjs": ("JavaScript", *_C_LIKE),
+    "php": ("PHP", (b"//", b"#"), ((b"/*", b"*/"),)),
+    "pl": ("Perl", *_HASH),
+    "py": ("Python", *_HASH),
+    "pyi": ("Python", *_HASH),
+    "r": ("R", *_HASH),
+    "rb": ("Ruby", *_HASH),
+    "rs": ("Rust", *_C_LIKE),
+    "scala": ("Scala", *_C_LIKE),
+    "scss": ("SCSS", *_C_LIKE),
+    "sh": ("Shell", *_HASH),
+    "sql": ("SQL", (b"--",), ((b"/*", b"*/"),)),
+    "svg": ("SVG", *_MARKUP),
+    "swift": ("Swift", *_C_LIKE),
+    "tex": ("TeX", (b"%",), ()),
+    "toml": ("TOML", *_HASH),
+    "ts": ("TypeScript", *_C_LIKE),
+    "tsx": ("TypeScript", *_C_LIKE),
+    "vue": ("Vue", (b"//",), ((b"<!--", b"-->"), (b"/*", b"*/"))),
+    "xml": ("XML", *_MARKUP),
+    "yaml": ("YAML", *_HASH),
+    "yml": ("YAML", *_HASH),
+    "zsh": ("Shell", *_HASH),
+}
+
+
+def line_count_chunks(chunks: Iterable[bytes]) -> int:
+    """
+    Count lines in a stream of raw byte chunks.
+
+    Gives the same count as iterating the content opened as UTF-8 text with
+    ``errors="ignore"`` (universal newlines): "\\n", "\\r\\n" and a lone "\\r"
+    each end a line, a trailing line without terminator still counts, and bytes
+    that aren't valid UTF-8 are dropped first. ASCII chunks are scanned as is;
+    the others go through an incremental decoder to drop those bytes.
+    """
+    import codecs
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    decoding = False
+    total = 0
+    last = b""
+    pending_cr = False
+    for chunk in chunks:
+        if decoding or not chunk.isascii():
+            # Invalid bytes could join a "\r" and a "\n", or make up a whole
+            # last line: drop them like text mode does.
+            chunk = decoder.decode(chunk).encode()
+            # Bytes of a sequence cut by the end of the chunk are kept
+            decoding = bool(decoder.getstate()[0])
+        if not chunk:
+            continue
+
+        total += chunk.count(b"\n")
+        if b"\r" in chunk:
+            total += chunk.count(b"\r") - chunk.count(b"\r\n")
+        # A "\r\n" split across two chunks was counted twice.
+        if pending_cr and chunk[:1] == b"\n":
+            total -= 1
+
+        last = chunk[-1:]
+        pending_cr = last == b"\r"
+
+    if last and last not in (b"\n", b"\r"):
+        total += 1
+    return total
+
+
+def line_count_file(
+    path: Path | str,
+    chunk_size: int = LINE_COUNT_CHUNK_SIZE,
+    compression: bool = True,
+    buffer_size: int = CODEC_BUFFER_SIZE,
+) -> int:
+    """Count lines of a single file by reading it in binary chunks.
+
+    With ``compression``, files with a compressed extension (see helper/codec.py)
+    are decompressed while read, so their content lines are counted, through a
+    buffer of ``buffer_size`` bytes.
+    """
+    codec = None
+    if compression:
+        from wexample_file.helper.codec import codec_from_path
+
+        codec = codec_from_path(Path(path))
+
+    with open(path, "rb", buffering=0 if codec is None else -1) as fh:
+        if codec is None:
+            return line_count_chunks(iter(lambda: fh.read(chunk_size), b""))
+
+        from wexample_file.helper.codec import codec_reader
+
+        with codec_reader(fh, codec, buffer_size) as stream:
+            return line_count_chunks(iter(lambda: stream.read(chunk_size), b""))
+
+
+def line_count_recursive(
+    path: Path,
+    pattern: str = "*",
+    workers: int | None = None,
+    use_processes: bool = False,
+    chunk_size: int = LINE_COUNT_CHUNK_SIZE,
+    cache: LineCountCache | None = None,
+    compression: bool = True,
+) -> int:
     """
     Recursively counts the total number of lines in all files matching a given pattern
     under the specified directory.
 
-    The function opens each file safely using UTF-8 encoding, ignoring unreadable characters.
+    Files are read in binary chunks and only line breaks are counted, bytes that
+    aren't valid UTF-8 being dropped first (see line_count_chunks), which gives the
+    same result as reading them as UTF-8 text while ignoring unreadable characters.
     If any file cannot be read for any reason, the function simply skips it and continues.
     Returns the total number of lines across all matching files.
+
+    Parameters:
+        workers: Size of the pool files are spread over. None lets the executor pick
+            a default, 1 counts everything in the calling thread.
+        use_processes: Use a process pool instead of a thread pool, useful when the
+            files are cached in memory and counting becomes CPU bound.
+        chunk_size: Size of each binary read.
+        cache: Index of previous counts. Only new and changed files are read, the
+            others reuse their cached count; entries of deleted files are dropped.
+        compression: Count the lines inside compressed files (".gz", ".bz2",
+            ".xz", ".zst"), decompressing them as a stream, rather than the
+            line breaks of their raw bytes.
     """
-    total = 0
-    for f in path.rglob(pattern):
+    return sum(
+        count
+        for _, count in _line_count_iter(
+            path, pattern, workers, use_processes, chunk_size, cache, compression
+        )
+    )
+
+
+def line_count_report(
+    path: Path,
+    pattern: str = "*",
+    workers: int | None = None,
+    use_processes: bool = False,
+    chunk_size: int = LINE_COUNT_CHUNK_SIZE,
+    cache: LineCountCache | None = None,
+    compression: bool = True,
+) -> LineCountReport:
+    """
+    Same as line_count_recursive, but also returns per-file and per-extension totals.
+    """
+    from wexample_file.classes.line_count_report import LineCountReport
+
+    report = LineCountReport()
+    for file_path, count in _line_count_iter(
+        path, pattern, workers, use_processes, chunk_size, cache, compression
+    ):
+        report.add(file_path, count)
+    return report
+
+
+def line_stats(
+    path: Path,
+    pattern: str = "*",
+    workers: int | None = None,
+    use_processes: bool = True,
+    rules: dict | None = None,
+) -> LineStatsReport:
+    """
+    Recursively classify the lines of source files as blank, comment or code.
+
+    The language and comment syntax of each file come from its extension (as
+    returned by LocalFile.get_extension, lowercased) looked up in ``rules``;
+    files with an unknown extension, binary files and unreadable files are
+    skipped. Counting is CPU bound, so files are spread over a process pool.
+
+    Parameters:
+        workers: Size of the pool. None lets the executor pick a default (one
+            process per core), 1 counts everything in the calling process.
+        use_processes: Use a process pool rather than a thread pool.
+        rules: Extension table replacing LINE_STATS_RULES, same format.
+    """
+    from wexample_file.classes.line_stats_report import LineStatsReport
+    from wexample_file.helper.path import path_get_extension
+
+    rules = LINE_STATS_RULES if rules is None else rules
+    paths = (
+        file_path
+        for file_path in path.rglob(pattern)
+        if path_get_extension(file_path).lower() in rules
+    )
+
+    report = LineStatsReport()
+    for file_path, stats in _line_count_paths(
+        paths, workers, use_processes, _line_stats_batch, rules
+    ):
+        report.add(file_path, rules[path_get_extension(file_path).lower()][0], stats)
+    return report
+
+
+def line_stats_bytes(
+    data: bytes,
+    line_comments: tuple[bytes, ...] = (),
+    block_comments: tuple[tuple[bytes, bytes], ...] = (),
+) -> LineStats:
+    """
+    Classify the lines of a buffer as blank, comment or code.
+
+    A line is blank when it holds only whitespace, comment when it holds only
+    comments (starting with one of ``line_comments`` or inside one of the
+    ``block_comments`` delimiter pairs), and code otherwise, including code
+    followed by a comment. Lines are split like line_count_chunks does.
+    Comment markers inside string literals are not told apart.
+
+    The whole buffer is handled with bytes methods and regular expressions, so
+    Python code never runs per line.
+    """
+    from wexample_file.classes.line_stats import LineStats
+
+    if not data:
+        return LineStats()
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+    blank_regex, comment_regex, strip_regex, marker_regex = _line_stats_patterns(
+        line_comments, block_comments
+    )
+    total = data.count(b"\n") + (not data.endswith(b"\n"))
+    # Every line sits between two line breaks, which patterns can anchor on:
+    # much faster than "^"/"$" in multiline mode.
+    data = b"\n" + data + (b"" if data.endswith(b"\n") else b"\n")
+
+    if strip_regex is not None and any(start in data for start, _ in block_comments):
+        # Replace every comment with a NUL marker, keeping its line breaks, then
+        # count the lines left with markers only.
+        data = strip_regex.sub(_line_stats_mark, data)
+        if data.endswith(b"\0"):
+            # A comment left open until the end marked a line after the last one.
+            data = data[:-1]
+        comment = len(marker_regex.findall(data))
+    elif comment_regex is not None:
+        comment = len(comment_regex.findall(data))
+    else:
+        comment = 0
+
+    blank = len(blank_regex.findall(data))
+
+    return LineStats(blank=blank, code=total - blank - comment, comment=comment)
+
+
+def line_stats_file(
+    path: Path | str,
+    line_comments: tuple[bytes, ...] = (),
+    block_comments: tuple[tuple[bytes, bytes], ...] = (),
+) -> LineStats | None:
+    """Classify the lines of a single file; returns None for binary files."""
+    with open(path, "rb") as fh:
+        data = fh.read()
+    if b"\0" in data:
+        return None
+    return line_stats_bytes(data, line_comments, block_comments)
+
+
+def _line_count_batch(
+    paths: list[Path], chunk_size: int, compression: bool
+) -> list[int | None]:
+    counts: list[int | None] = []
+    for path in paths:
         try:
-            with f.open(encoding="utf-8", errors="ignore") as fh:
-                total += sum(1 for _ in fh)
+            counts.append(line_count_file(path, chunk_size, compression))
         except Exception:
             # Skip files that cannot be opened or read
+            counts.append(None)
+    return counts
+
+
+def _line_count_cached(
+    path: Path,
+    pattern: str,
+    workers: int | None,
+    use_processes: bool,
+    chunk_size: int,
+    cache: LineCountCache,
+    compression: bool,
+) -> Iterator[tuple[Path, int]]:
+    import stat
+
+    from wexample_file.helper.codec import codec_from_path
+
+    seen: set[str] = set()
+    stale: dict[Path, tuple[os.stat_result, bool]] = {}
+    for file_path in path.rglob(pattern):
+        # Stat before reading, so a change made while counting is seen next time.
+        try:
+            stat_result = file_path.stat()
+        except OSError:
             continue
-    return total
+        if not stat.S_ISREG(stat_result.st_mode):
+            continue
+
+        key = str(file_path)
+        seen.add(key)
+        decompressed = compression and codec_from_path(file_path) is not None
+        count = cache.get(key, stat_result, decompressed)
+        if count is None:
+            stale[file_path] = (stat_result, decompressed)
+        else:
+            yield file_path, count
+
+    for file_path, count in _line_count_paths(
+        iter(stale),
+        workers,
+        use_processes,
+        _line_count_batch,
+        chunk_size,
+        compression,
+    ):
+        stat_result, decompressed = stale[file_path]
+        cache.set(file_path, stat_result, count, decompressed)
+        yield file_path, count
+
+    cache.prune(path, seen, pattern)
+
+
+def _line_count_iter(
+    path: Path,
+    pattern: str,
+    workers: int | None,
+    use_processes: bool,
+    chunk_size: int,
+    cache: LineCountCache | None = None,
+    compression: bool = True,
+) -> Iterator[tuple[Path, int]]:
+    if cache is not None:
+        yield from _line_count_cached(
+            path, pattern, workers, use_processes, chunk_size, cache, compression
+        )
+    else:
+        yield from _line_count_paths(
+            path.rglob(pattern),
+            workers,
+            use_processes,
+            _line_count_batch,
+            chunk_size,
+            compression,
+        )
+
+
+def _line_count_paths(
+    paths: Iterator[Path],
+    workers: int | None,
+    use_processes: bool,
+    batch_function: Callable[..., list[T | None]],
+    *args: Any,
+) -> Iterator[tuple[Path, T]]:
+    """Run ``batch_function(batch, *args)`` over batches of paths on a pool.
+
+    The function must be defined at module level to be usable by a process pool.
+    Files it returned None for are skipped.
+    """
+    from itertools import islice
+
+    batches = iter(lambda: list(islice(paths, LINE_COUNT_BATCH_SIZE)), [])
+
+    if workers == 1:
+        results = ((batch, batch_function(batch, *args)) for batch in batches)
+        yield from _line_count_flatten(results)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+    with executor_class(max_workers=workers) as executor:
+        futures = [
+            (batch, executor.submit(batch_function, batch, *args)) for batch in batches
+        ]
+        yield from _line_count_flatten(
+            (batch, future.result()) for batch, future in futures
+        )
+
+
+def _line_count_flatten(
+    results: Iterable[tuple[list[Path], list[T | None]]],
+) -> Iterator[tuple[Path, T]]:
+    for batch, counts in results:
+        for file_path, count in zip(batch, counts):
+            if count is not None:
+                yield file_path, count
+
+
+def _line_stats_batch(paths: list[Path], rules: dict) -> list[LineStats | None]:
+    from wexample_file.helper.path import path_get_extension
+
+    results: list[LineStats | None] = []
+    for path in paths:
+        _, line_comments, block_comments = rules[path_get_extension(path).lower()]
+        try:
+            results.append(line_stats_file(path, line_comments, block_comments))
+        except Exception:
+            # Skip files that cannot be opened or read
+            results.append(None)
+    return results
+
+
+def _line_stats_mark(match: re.Match[bytes]) -> bytes:
+    return b"\0" + b"\n\0" * match.group().count(b"\n")
+
+
+@lru_cache(maxsize=None)
+def _line_stats_patterns(
+    line_comments: tuple[bytes, ...],
+    block_comments: tuple[tuple[bytes, bytes], ...],
+) -> tuple[re.Pattern, re.Pattern | None, re.Pattern | None, re.Pattern]:
+    """Compile (blank, line comment, comment stripping, marker line) patterns."""
+    import re
+
+    space = rb"[ \t\f\v]*"
+    blank_regex = re.compile(rb"\n" + space + rb"(?=\n)")
+    marker_regex = re.compile(rb"\n" + space + rb"\0[ \t\f\v\0]*(?=\n)")
+
+    comment_regex = None
+    if line_comments:
+        prefixes = b"|".join(re.escape(prefix) for prefix in line_comments)
+        comment_regex = re.compile(rb"\n" + space + rb"(?:" + prefixes + rb")")
+
+    strip_regex = None
+    if block_comments:
+        # Blocks first, so "--[[" is not taken for a "--" line comment.
+        alternatives = [
+            re.escape(start) + rb".*?(?:" + re.escape(end) + rb"|\Z)"
+            for start, end in block_comments
+        ]
+        alternatives += [re.escape(prefix) + rb"[^\n]*" for prefix in line_comments]
+        strip_regex = re.compile(b"|".join(alternatives), re.S)
+
+    return blank_regex, comment_regex, strip_regex, marker_regex
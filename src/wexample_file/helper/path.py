@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import PurePath
+
+
+def path_get_extension(path: PurePath) -> str:
+    """Return the last suffix of a path without the leading dot.
+
+    Examples:
+        "archive.tar.gz" -> "gz"
+        "report.pdf" -> "pdf"
+        "README" -> ""
+        Dotfiles without other dots (e.g. ".env") -> "env"
+    """
+    return path_name_get_extension(path.name)
+
+
+def path_name_get_extension(name: str) -> str:
+    """Same as path_get_extension, for a bare file name.
+
+    Avoids building a Path when only the name is known, e.g. from os.scandir.
+    """
+    # Primary: same suffix rule as pathlib
+    i = name.rfind(".")
+    if 0 < i < len(name) - 1:
+        return name[i + 1 :]
+
+    # Special-case: dotfiles like ".env" (no formal suffix)
+    if name.startswith(".") and len(name) > 1 and "." not in name[1:]:
+        return name[1:]
+
+    return ""
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from wexample_file.common.os_storage_backend import OsStorageBackend
+
+if TYPE_CHECKING:
+    from wexample_file.common.abstract_storage_backend import AbstractStorageBackend
+
+# Backend of the real filesystem, shared by every item not using another one.
+STORAGE_OS_BACKEND: OsStorageBackend = OsStorageBackend()
+
+_current: AbstractStorageBackend = STORAGE_OS_BACKEND
+
+
+def storage_get_backend() -> AbstractStorageBackend:
+    """Return the backend of the items created without an explicit one."""
+    return _current
+
+
+def storage_set_backend(
+    backend: AbstractStorageBackend | None,
+) -> AbstractStorageBackend:
+    """Make ``backend`` (the OS when None) the default one, return the previous one.
+
+    The default is process wide, so items created by worker threads use it too.
+    Prefer using a backend as a context manager, which restores the previous one.
+    """
+    global _current
+
+    previous = _current
+    _current = STORAGE_OS_BACKEND if backend is None else backend
+    return previous
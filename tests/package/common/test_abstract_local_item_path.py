@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+
+def test_abstract_local_item_path_stat_accessors(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "stat.txt"
+    p.write_text("12345")
+    lf = LocalFile(path=p)
+    assert lf.exists() and lf.is_file() and not lf.is_dir()
+    assert lf.get_size() == 5
+    assert lf.get_mtime() == p.stat().st_mtime
+
+    missing = LocalFile(path=tmp_path / "missing.txt")
+    assert not missing.exists() and not missing.is_file()
+    assert missing.get_size() is None and missing.get_stat() is None
+
+
+def test_abstract_local_item_path_without_cache_sees_external_changes(
+    tmp_path,
+) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "live.txt"
+    lf = LocalFile(path=p)
+    assert not lf.exists()
+    p.write_text("x")
+    assert lf.exists()
+
+
+def test_abstract_local_item_path_stat_cache_and_refresh(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "cached.txt"
+    p.write_text("abc")
+    lf = LocalFile(path=p, use_stat_cache=True)
+    assert lf.get_size() == 3
+
+    # External change is not seen until refresh
+    p.write_text("abcdef")
+    assert lf.get_size() == 3
+    lf.refresh()
+    assert lf.get_size() == 6
+
+
+def test_abstract_local_item_path_stat_cache_ttl(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "ttl.txt"
+    lf = LocalFile(path=p, use_stat_cache=True, stat_cache_ttl=0)
+    assert not lf.exists()
+    p.write_text("x")
+    assert lf.exists()
+
+
+def test_abstract_local_item_path_stat_cache_invalidated_by_mutations(
+    tmp_path,
+) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.local_file import LocalFile
+
+    lf = LocalFile(path=tmp_path / "mutated.txt", use_stat_cache=True)
+    assert not lf.exists()
+    lf.write("hello")
+    assert lf.get_size() == 5
+    lf.write("hi", atomic=True)
+    assert lf.get_size() == 2
+    lf.change_extension("md")
+    assert not lf.exists()
+
+    moved = LocalFile(path=tmp_path / "mutated.md", use_stat_cache=True)
+    assert moved.is_file()
+    moved.remove()
+    assert not moved.exists()
+
+    ld = LocalDirectory(path=tmp_path / "dir", use_stat_cache=True)
+    assert not ld.exists()
+    ld.create()
+    assert ld.is_dir()
+    ld.remove()
+    assert not ld.exists()
+
+
+def test_abstract_local_item_path_from_resolved_skips_normalization(
+    tmp_path,
+) -> None:
+    from pathlib import Path
+
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path.resolve() / "trusted.txt"
+    lf = LocalFile.from_resolved(str(p))
+    assert isinstance(lf.path, Path)
+    assert lf.path == p
+    assert lf == LocalFile(path=p)
+
+    # The path is kept as given, without expanding or resolving it
+    assert LocalFile.from_resolved("~/x").path == Path("~/x")
+
+
+def test_abstract_local_item_path_from_resolved_honors_check_exists(
+    tmp_path,
+) -> None:
+    import pytest
+
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.exception.file_not_found_exception import FileNotFoundException
+
+    with pytest.raises(FileNotFoundException):
+        LocalFile.from_resolved(tmp_path / "missing.txt", check_exists=True)
+
+
+def test_abstract_local_item_path_eq_with_str_and_path(tmp_path) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+
+    d = tmp_path / "eq_dir"
+    d.mkdir()
+    ld = LocalDirectory(path=d)
+    assert ld == d.resolve()
+    assert ld == str(d / "sub" / "..")
+    assert ld != tmp_path
+    assert ld != 42
+
+
+def test_abstract_local_item_path_rejects_invalid_type() -> None:
+    import pytest
+
+    from wexample_file.common.local_file import LocalFile
+
+    with pytest.raises(TypeError):
+        LocalFile(path=42)
+
+
+def test_abstract_local_item_path_hash_dedups_in_sets(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "dedup.txt"
+    items = [LocalFile(path=p), LocalFile(path=str(p)), LocalFile.from_resolved(p)]
+    assert len(set(items)) == 1
+    assert {items[0]: "value"}[items[2]] == "value"
+
+
+def test_abstract_local_item_path_interned_shares_instances(tmp_path) -> None:
+    import pytest
+
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.exception.not_a_file_exception import NotAFileException
+
+    p = tmp_path / "shared.txt"
+    first = LocalFile.interned(p)
+    assert LocalFile.interned(str(p)) is first
+    assert LocalFile.interned(tmp_path / "other.txt") is not first
+    # Each class has its own registry
+    assert LocalDirectory.interned(tmp_path) is not LocalFile.interned(p)
+
+    with pytest.raises(NotAFileException):
+        LocalFile.interned(tmp_path)
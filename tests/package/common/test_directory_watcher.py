@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import pytest
+
+
+def _backends() -> list[bool]:
+    from wexample_file.helper.inotify import inotify_available
+
+    return [True, False] if inotify_available() else [False]
+
+
+def _changes(watcher) -> set[tuple[str, str, str]]:
+    return {
+        (change.type.value, change.item.path.name, type(change.item).__name__)
+        for change in watcher.read(timeout=2)
+    }
+
+
+@pytest.mark.parametrize("use_inotify", _backends())
+def test_directory_watcher_reports_changes(tmp_path, use_inotify) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+
+    (tmp_path / "old.txt").write_text("old")
+    (tmp_path / "kept.txt").write_text("kept")
+
+    with LocalDirectory(path=tmp_path).watch(
+        use_inotify=use_inotify, poll_interval=0.05
+    ) as watcher:
+        assert watcher.backend == ("inotify" if use_inotify else "polling")
+
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "new.txt").write_text("new")
+        (tmp_path / "old.txt").unlink()
+        (tmp_path / "kept.txt").write_text("changed content")
+
+        assert _changes(watcher) == {
+            ("created", "sub", "LocalDirectory"),
+            ("created", "new.txt", "LocalFile"),
+            ("deleted", "old.txt", "LocalFile"),
+            ("modified", "kept.txt", "LocalFile"),
+        }
+        assert watcher.read(timeout=0.2) == []
+
+
+@pytest.mark.parametrize("use_inotify", _backends())
+def test_directory_watcher_coalesces_bursts(tmp_path, use_inotify) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+
+    target = tmp_path / "burst.txt"
+    target.write_text("")
+
+    with LocalDirectory(path=tmp_path).watch(
+        use_inotify=use_inotify, poll_interval=0.05, debounce=0.3
+    ) as watcher:
+        for i in range(20):
+            with target.open("a") as f:
+                f.write(f"line {i}\n")
+        (tmp_path / "temp.txt").write_text("x")
+        (tmp_path / "temp.txt").unlink()
+
+        assert _changes(watcher) == {("modified", "burst.txt", "LocalFile")}
+
+
+@pytest.mark.parametrize("use_inotify", _backends())
+def test_directory_watcher_prune(tmp_path, use_inotify) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+
+    (tmp_path / ".git").mkdir()
+
+    with LocalDirectory(path=tmp_path).watch(
+        use_inotify=use_inotify, poll_interval=0.05, prune=[".git"]
+    ) as watcher:
+        (tmp_path / ".git" / "HEAD").write_text("ref")
+        (tmp_path / "a.txt").write_text("a")
+
+        assert _changes(watcher) == {("created", "a.txt", "LocalFile")}
+
+
+def test_directory_watcher_requires_directory(tmp_path) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.exception.directory_not_found_exception import (
+        DirectoryNotFoundException,
+    )
+
+    with pytest.raises(DirectoryNotFoundException):
+        LocalDirectory(path=tmp_path / "missing").watch()
+
+
+def test_directory_watcher_watch_limit_switches_to_polling(
+    tmp_path, monkeypatch
+) -> None:
+    import errno
+
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.helper import inotify
+
+    if not inotify.inotify_available():
+        pytest.skip("inotify is not available")
+
+    add_watch = inotify.inotify_add_watch
+
+    def limited_add_watch(fd, path):
+        if path.endswith("full"):
+            raise OSError(errno.ENOSPC, "No space left on device", path)
+        return add_watch(fd, path)
+
+    monkeypatch.setattr(inotify, "inotify_add_watch", limited_add_watch)
+
+    (tmp_path / "full").mkdir()
+    with LocalDirectory(tmp_path).watch(poll_interval=0.05) as watcher:
+        assert watcher.backend == "polling"
+        (tmp_path / "full" / "new.txt").write_text("new")
+        assert ("created", "new.txt", "LocalFile") in _changes(watcher)
+
+    (tmp_path / "sub").mkdir()
+    with LocalDirectory(tmp_path / "sub").watch(poll_interval=0.05) as watcher:
+        assert watcher.backend == "inotify"
+        (tmp_path / "sub" / "full").mkdir()
+        # The root is reported so that it gets rescanned
+        assert ("modified", "sub", "LocalDirectory") in _changes(watcher)
+        assert watcher.backend == "polling"
+
+        (tmp_path / "sub" / "full" / "late.txt").write_text("late")
+        assert ("created", "late.txt", "LocalFile") in _changes(watcher)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+
+def test_instrumentation_counts_calls_bytes_and_methods(tmp_path) -> None:
+    from wexample_file.common.instrumentation import Instrumentation
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.local_file import LocalFile
+
+    directory = LocalDirectory(path=tmp_path / "dir")
+    local_file = LocalFile(path=tmp_path / "dir" / "a.txt")
+
+    with Instrumentation() as instrumentation:
+        directory.create()
+        local_file.write("hello")
+        local_file.write("hello")
+        assert local_file.read() == "hello"
+        directory.remove()
+
+    write = instrumentation.methods[("LocalFile", "write")]
+    assert write.count == 2
+    assert write.bytes_written == 10
+    assert write.calls["open"] == 2
+    assert write.seconds > 0
+
+    read = instrumentation.methods[("LocalFile", "read")]
+    assert read.count == 1
+    assert read.bytes_read == 5
+
+    assert instrumentation.methods[("LocalDirectory", "create")].calls["mkdir"] == 1
+    assert instrumentation.methods[("LocalDirectory", "remove")].calls["rmtree"] == 1
+    assert instrumentation.bytes_written == 10
+    assert instrumentation.calls["stat"] > 0
+    assert "LocalFile.write" in instrumentation.report()
+
+
+def test_instrumentation_restores_originals(tmp_path) -> None:
+    from wexample_file.common.instrumentation import Instrumentation
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.common.os_storage_backend import OsStorageBackend
+    from wexample_file.helper import hash
+
+    originals = (
+        OsStorageBackend.stat,
+        hash.hash_file,
+        LocalFile.__init__,
+        LocalFile.read,
+    )
+
+    with Instrumentation():
+        with Instrumentation():
+            assert LocalFile.read is not originals[3]
+        assert OsStorageBackend.stat is not originals[0]
+        assert hash.hash_file is not originals[1]
+
+    assert (
+        OsStorageBackend.stat,
+        hash.hash_file,
+        LocalFile.__init__,
+        LocalFile.read,
+    ) == originals
+    assert "exists" not in LocalFile.__dict__
+
+    instrumentation = Instrumentation()
+    LocalFile(path=tmp_path / "a.txt").write("ignored")
+    assert instrumentation.methods == {}
+    assert instrumentation.calls == {}
+
+
+def test_instrumentation_only_patches_the_package(tmp_path) -> None:
+    import builtins
+    import io
+    import os
+
+    from wexample_file.common.instrumentation import Instrumentation
+    from wexample_file.common.local_file import LocalFile
+
+    originals = (builtins.open, io.open, os.stat, os.scandir)
+    local_file = LocalFile(path=tmp_path / "a.txt")
+    local_file.write("hello")
+
+    with Instrumentation() as instrumentation:
+        assert (builtins.open, io.open, os.stat, os.scandir) == originals
+        (tmp_path / "other.txt").write_text("not counted")
+        os.stat(tmp_path / "other.txt")
+        assert instrumentation.calls == {}
+
+        local_file.hash()
+
+    assert instrumentation.calls == {"hash_file": 1}
+    assert instrumentation.methods[("LocalFile", "hash")].calls == {"hash_file": 1}
+
+
+def test_instrumentation_times_generators(tmp_path) -> None:
+    from wexample_file.common.instrumentation import Instrumentation
+    from wexample_file.common.local_file import LocalFile
+
+    local_file = LocalFile(path=tmp_path / "a.txt")
+    local_file.write("a\nb\nc\n")
+
+    with Instrumentation() as instrumentation:
+        assert list(local_file.iter_lines()) == ["a", "b", "c"]
+
+    stats = instrumentation.methods[("LocalFile", "iter_lines")]
+    assert stats.count == 1
+    assert stats.calls["open"] == 1
+    assert stats.bytes_read == 6
@@ -93,3 +93,351 @@ def test_local_directory_remove_idempotent(tmp_path) -> None:
     assert not d.exists()
     # Idempotent second call
     ld2.remove()
+
+
+def _create_walk_tree(root) -> None:
+    for relative in (
+        "a.py",
+        "b.txt",
+        "src/c.py",
+        "src/deep/d.py",
+        "node_modules/pkg/index.js",
+        ".git/HEAD",
+    ):
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+
+
+def test_local_directory_walk_yields_files_and_directories(tmp_path) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.local_file import LocalFile
+
+    _create_walk_tree(tmp_path)
+    items = list(LocalDirectory(path=tmp_path).walk(prune=[".git", "node_modules"]))
+
+    files = {
+        i.path.relative_to(tmp_path).as_posix()
+        for i in items
+        if isinstance(i, LocalFile)
+    }
+    dirs = {
+        i.path.relative_to(tmp_path).as_posix()
+        for i in items
+        if isinstance(i, LocalDirectory)
+    }
+    assert files == {"a.py", "b.txt", "src/c.py", "src/deep/d.py"}
+    assert dirs == {"src", "src/deep"}
+
+
+def test_local_directory_walk_filters_and_depth(tmp_path) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+
+    _create_walk_tree(tmp_path)
+    ld = LocalDirectory(path=tmp_path)
+
+    def names(items) -> set[str]:
+        return {i.path.relative_to(tmp_path).as_posix() for i in items}
+
+    assert names(ld.iter_files(include=["*.py"])) == {
+        "a.py",
+        "src/c.py",
+        "src/deep/d.py",
+    }
+    assert names(ld.iter_files(include=["*.py"], exclude=["src/deep/*"])) == {
+        "a.py",
+        "src/c.py",
+    }
+    assert names(ld.iter_files(include=["*.py"], max_depth=2)) == {"a.py", "src/c.py"}
+    assert names(ld.walk(max_depth=1, prune=[".*"])) == {
+        "a.py",
+        "b.txt",
+        "src",
+        "node_modules",
+    }
+
+
+def test_local_directory_walk_does_not_follow_symlinks_by_default(tmp_path) -> None:
+    import os
+
+    import pytest
+
+    from wexample_file.common.local_directory import LocalDirectory
+
+    if not hasattr(os, "symlink"):
+        pytest.skip("symlinks not supported")
+
+    _create_walk_tree(tmp_path / "tree")
+    (tmp_path / "tree/link").symlink_to(tmp_path / "tree/src", target_is_directory=True)
+    ld = LocalDirectory(path=tmp_path / "tree")
+
+    paths = {i.path.relative_to(ld.path).as_posix() for i in ld.walk()}
+    assert "link" in paths and "link/c.py" not in paths
+
+    paths = {
+        i.path.relative_to(ld.path).as_posix() for i in ld.walk(follow_symlinks=True)
+    }
+    assert "link/c.py" in paths
+
+
+def test_local_directory_walk_missing_directory_yields_nothing(tmp_path) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+
+    assert list(LocalDirectory(path=tmp_path / "missing").walk()) == []
+
+
+def test_local_directory_remove_parallel(tmp_path) -> None:
+    import os
+
+    from wexample_file.common.local_directory import LocalDirectory
+
+    d = tmp_path / "parallel_remove"
+    _create_walk_tree(d)
+    if hasattr(os, "symlink"):
+        # Symlinked directories are unlinked, not followed
+        (d / "src/link").symlink_to(tmp_path / "outside", target_is_directory=True)
+        (tmp_path / "outside").mkdir()
+        (tmp_path / "outside/keep.txt").write_text("keep")
+
+    ld = LocalDirectory(path=d)
+    ld.remove(parallel=True, workers=4)
+    assert not d.exists()
+    if hasattr(os, "symlink"):
+        assert (tmp_path / "outside/keep.txt").exists()
+    # Still idempotent
+    ld.remove(parallel=True)
+
+
+def test_local_directory_copy_to(tmp_path) -> None:
+    import os
+
+    from wexample_file.common.local_directory import LocalDirectory
+
+    source = tmp_path / "source"
+    _create_walk_tree(source)
+    (source / "empty_dir").mkdir()
+    os.chmod(source / "a.py", 0o640)
+
+    target = LocalDirectory(path=source).copy_to(tmp_path / "target", workers=2)
+
+    assert isinstance(target, LocalDirectory)
+    copied = {p.relative_to(target.path).as_posix() for p in target.path.rglob("*")}
+    expected = {p.relative_to(source).as_posix() for p in source.rglob("*")}
+    assert copied == expected
+    assert (target.path / "src/deep/d.py").read_text() == "x"
+    assert os.stat(target.path / "a.py").st_mode & 0o777 == 0o640
+
+
+def test_local_directory_copy_to_other_backend_keeps_compressed_files(
+    tmp_path,
+) -> None:
+    import gzip
+
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.memory_storage_backend import MemoryStorageBackend
+
+    source = tmp_path / "source"
+    source.mkdir()
+    compressed = gzip.compress(b"one\ntwo\n")
+    (source / "app.log.gz").write_bytes(compressed)
+
+    memory = LocalDirectory(path=tmp_path / "memory", backend=MemoryStorageBackend())
+    LocalDirectory(path=source).copy_to(memory)
+    copied = next(memory.iter_files())
+    assert b"".join(copied.iter_chunks()) == compressed
+    assert copied.read() == "one\ntwo\n"
+
+    back = memory.copy_to(LocalDirectory(path=tmp_path / "back"))
+    assert (back.path / "app.log.gz").read_bytes() == compressed
+
+
+def test_local_directory_copy_to_missing_source_raises(tmp_path) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.exception.directory_not_found_exception import (
+        DirectoryNotFoundException,
+    )
+
+    with pytest.raises(DirectoryNotFoundException):
+        LocalDirectory(path=tmp_path / "missing").copy_to(tmp_path / "target")
+
+
+def test_local_directory_disk_usage(tmp_path) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+
+    (tmp_path / "sub/deeper").mkdir(parents=True)
+    (tmp_path / "a.py").write_bytes(b"12345")
+    (tmp_path / "sub/b.py").write_bytes(b"123")
+    (tmp_path / "sub/deeper/c.txt").write_bytes(b"1")
+    (tmp_path / "sub/deeper/README").write_bytes(b"")
+
+    for workers in (1, 4):
+        usage = LocalDirectory(path=tmp_path).disk_usage(workers=workers)
+        assert usage.size == 9
+        assert usage.file_count == 4
+        assert usage.directory_count == 2
+        assert usage.extension_sizes == {"py": 8, "txt": 1, "": 0}
+        assert usage.extension_counts == {"py": 2, "txt": 1, "": 1}
+
+
+def test_local_directory_disk_usage_cache_only_rescans_changes(
+    tmp_path, monkeypatch
+) -> None:
+    import os
+
+    from wexample_file.common.disk_usage_cache import DiskUsageCache
+    from wexample_file.common.local_directory import LocalDirectory
+
+    for name in ("one", "two", "three"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "file.txt").write_bytes(b"12")
+
+    ld = LocalDirectory(path=tmp_path)
+    cache = DiskUsageCache()
+    assert ld.disk_usage(cache=cache).size == 6
+
+    scanned = []
+    scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda p: scanned.append(p) or scandir(p))
+
+    (tmp_path / "two/new.txt").write_bytes(b"1234")
+    assert ld.disk_usage(cache=cache).size == 10
+    assert scanned == [str(tmp_path / "two")]
+
+    import shutil
+
+    shutil.rmtree(tmp_path / "three")
+    assert ld.disk_usage(cache=cache).file_count == 3
+    assert str(tmp_path / "three") not in cache._entries
+
+
+def test_local_directory_disk_usage_cache_save_and_load(tmp_path) -> None:
+    from wexample_file.common.disk_usage_cache import DiskUsageCache
+    from wexample_file.common.local_directory import LocalDirectory
+
+    tree = tmp_path / "tree"
+    (tree / "sub").mkdir(parents=True)
+    (tree / "sub/file.txt").write_bytes(b"123")
+    cache = DiskUsageCache()
+    LocalDirectory(path=tree).disk_usage(cache=cache)
+    cache.save(tmp_path / "cache.json")
+
+    loaded = DiskUsageCache.load(tmp_path / "cache.json")
+    assert len(loaded) == len(cache)
+    assert LocalDirectory(path=tree).disk_usage(cache=loaded).size == 3
+    assert len(DiskUsageCache.load(tmp_path / "missing.json")) == 0
+
+
+def test_local_directory_disk_usage_cache_saves_to_disk_as_plain_json(
+    tmp_path,
+) -> None:
+    import json
+
+    from wexample_file.common.disk_usage_cache import DiskUsageCache
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.memory_storage_backend import MemoryStorageBackend
+
+    (tmp_path / "tree").mkdir()
+    (tmp_path / "tree/file.txt").write_bytes(b"123")
+    cache = DiskUsageCache()
+    LocalDirectory(path=tmp_path / "tree").disk_usage(cache=cache)
+
+    with MemoryStorageBackend():
+        cache.save(tmp_path / "cache.json.gz")
+    assert json.loads((tmp_path / "cache.json.gz").read_text())
+    assert len(DiskUsageCache.load(tmp_path / "cache.json.gz")) == len(cache)
+
+
+def test_local_directory_hash_tree(tmp_path) -> None:
+    from wexample_file.common.fingerprint_cache import FingerprintCache
+    from wexample_file.common.local_directory import LocalDirectory
+
+    first = tmp_path / "first"
+    _create_walk_tree(first)
+    (first / "empty").mkdir()
+    second = LocalDirectory(path=first).copy_to(tmp_path / "second")
+
+    cache = FingerprintCache()
+    digest = LocalDirectory(path=first).hash_tree(workers=2, cache=cache)
+    assert second.hash_tree() == digest
+    assert len(cache) == 6
+
+    (second.path / "src/deep/d.py").write_text("changed")
+    assert second.hash_tree() != digest
+
+    # Renaming changes the digest even with the same contents
+    (second.path / "src/deep/d.py").write_text("x")
+    (second.path / "empty").rename(second.path / "renamed")
+    assert second.hash_tree() != digest
+
+
+def test_local_directory_async_create_walk_remove(tmp_path) -> None:
+    import asyncio
+
+    from wexample_file.common.local_directory import LocalDirectory
+
+    ld = LocalDirectory(path=tmp_path / "async_dir")
+
+    async def scenario() -> set[str]:
+        await ld.acreate()
+        _create_walk_tree(ld.path)
+        names = {item.path.name async for item in ld.awalk(include=["*.py"])}
+        await ld.aremove(parallel=True)
+        return names
+
+    assert asyncio.run(scenario()) == {"a.py", "c.py", "d.py"}
+    assert not ld.path.exists()
+
+
+def test_local_directory_item_type(tmp_path) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.enum.local_path_type import LocalPathType
+
+    assert LocalDirectory(path=tmp_path).item_type() is LocalPathType.DIRECTORY
+
+
+def test_local_directory_change_extensions(tmp_path) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.jpeg").write_text("a")
+    (tmp_path / "B.JPEG").write_text("b")
+    (tmp_path / "sub" / "c.jpeg").write_text("c")
+    (tmp_path / "taken.jpeg").write_text("new")
+    (tmp_path / "taken.jpg").write_text("old")
+
+    plan = LocalDirectory(tmp_path).change_extensions({".jpeg": "jpg"}, workers=2)
+
+    assert sorted(p.name for p in tmp_path.rglob("*.jpg")) == [
+        "B.jpg",
+        "a.jpg",
+        "c.jpg",
+        "taken.jpg",
+    ]
+    assert (tmp_path / "taken.jpg").read_text() == "old"
+    assert [action.source.name for action in plan.conflicts] == ["taken.jpeg"]
+    assert plan.errors == []
+
+
+def test_local_directory_plan_renames_with_function(tmp_path) -> None:
+    import pytest
+
+    from wexample_file.common.local_directory import LocalDirectory
+
+    (tmp_path / "a.txt").write_text("a")
+    (tmp_path / "b.txt").write_text("b")
+    directory = LocalDirectory(tmp_path)
+
+    plan = directory.plan_renames(
+        rename=lambda local_file: f"archive/{local_file.path.name}"
+    )
+    assert len(plan) == 2
+    assert not (tmp_path / "archive").exists()
+
+    plan.apply()
+    assert sorted(p.name for p in (tmp_path / "archive").iterdir()) == [
+        "a.txt",
+        "b.txt",
+    ]
+
+    with pytest.raises(ValueError):
+        directory.plan_renames()
@@ -166,3 +166,554 @@ def test_local_file_write_writes_content_and_creates_parents(tmp_path) -> None:
     text = "some content"
     lf.write(text)
     assert nested.exists() and nested.read_text() == text
+
+
+def test_local_file_iter_chunks_yields_bounded_chunks(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "data.bin"
+    p.write_bytes(b"0123456789")
+    chunks = list(LocalFile(path=p).iter_chunks(size=4))
+    assert chunks == [b"0123", b"4567", b"89"]
+
+
+def test_local_file_iter_lines(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "lines.txt"
+    p.write_bytes(b"first\r\nsecond\nthird")
+    lf = LocalFile(path=p)
+    assert list(lf.iter_lines()) == ["first", "second", "third"]
+    assert list(lf.iter_lines(keep_ends=True)) == ["first\n", "second\n", "third"]
+
+
+def test_local_file_iter_text_chunks_keeps_multibyte_characters(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "utf8.txt"
+    content = "héllo wörld €\r\nnext"
+    p.write_bytes(content.encode("utf-8"))
+    lf = LocalFile(path=p)
+    chunks = list(lf.iter_text_chunks(size=1))
+    assert "".join(chunks) == lf.read()
+    assert all(len(chunk.encode("utf-8")) <= 3 for chunk in chunks)
+
+
+def test_local_file_iter_methods_yield_nothing_when_missing(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    lf = LocalFile(path=tmp_path / "missing_stream.txt")
+    assert list(lf.iter_chunks()) == []
+    assert list(lf.iter_lines()) == []
+    assert list(lf.iter_text_chunks()) == []
+
+
+def test_local_file_mmap_provides_read_only_view(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "mapped.bin"
+    p.write_bytes(b"HEADER:payload")
+    with LocalFile(path=p).mmap() as view:
+        assert view[:6] == b"HEADER"
+        with pytest.raises(TypeError):
+            view[0] = 0
+
+
+def test_local_file_mmap_empty_and_missing(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.exception.file_not_found_exception import FileNotFoundException
+
+    p = tmp_path / "empty.bin"
+    p.write_bytes(b"")
+    with LocalFile(path=p).mmap() as view:
+        assert view == b""
+
+    with pytest.raises(FileNotFoundException):
+        with LocalFile(path=tmp_path / "missing.bin").mmap():
+            pass
+
+
+def test_local_file_mmap_helpers(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "scan.txt"
+    p.write_bytes(b"alpha\nbeta\r\ngamma")
+    lf = LocalFile(path=p)
+    assert lf.read_range(6, 4) == b"beta"
+    assert lf.read_range(15, 100) == b"ma"
+    assert lf.find(b"gamma") == 12
+    assert lf.find(b"delta") == -1
+    assert lf.count_lines() == 3
+
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert LocalFile(path=empty).count_lines() == 0
+    assert LocalFile(path=empty).find(b"x") == -1
+    assert LocalFile(path=empty).read_range(0, 10) == b""
+
+
+def test_local_file_mmap_helpers_return_none_when_missing(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    lf = LocalFile(path=tmp_path / "missing_scan.txt")
+    assert lf.read_range(0, 10) is None
+    assert lf.find(b"x") is None
+    assert lf.count_lines() is None
+
+
+def test_local_file_write_atomic_replaces_content(tmp_path) -> None:
+    import os
+
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "atomic/out.txt"
+    lf = LocalFile(path=p)
+    lf.write("first", atomic=True)
+    os.chmod(p, 0o640)
+    lf.write("second", atomic=True, fsync=True)
+
+    assert p.read_text() == "second"
+    assert os.stat(p).st_mode & 0o777 == 0o640
+    assert [f.name for f in p.parent.iterdir()] == ["out.txt"]
+
+
+def test_local_file_write_atomic_keeps_target_on_failure(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "keep.txt"
+    p.write_text("original")
+
+    def chunks():
+        yield "partial"
+        raise RuntimeError("generator failed")
+
+    with pytest.raises(RuntimeError):
+        LocalFile(path=p).write_stream(chunks(), atomic=True)
+
+    assert p.read_text() == "original"
+    assert [f.name for f in tmp_path.iterdir()] == ["keep.txt"]
+
+
+def test_local_file_write_bytes(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "bytes/out.bin"
+    LocalFile(path=p).write_bytes(b"\x00\x01", fsync=True)
+    assert p.read_bytes() == b"\x00\x01"
+
+
+def test_local_file_write_raises_if_directory(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.exception.not_a_file_exception import NotAFileException
+
+    p = tmp_path / "target"
+    lf = LocalFile(path=p)
+    p.mkdir()
+    with pytest.raises(NotAFileException):
+        lf.write("x", atomic=True)
+
+
+def test_local_file_write_stream_text_and_bytes(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    lf = LocalFile(path=tmp_path / "stream.txt")
+    lf.write_stream(f"line {i}\n" for i in range(3))
+    assert lf.read() == "line 0\nline 1\nline 2\n"
+
+    lf.write_stream([b"raw", b"bytes"], atomic=True)
+    assert lf.path.read_bytes() == b"rawbytes"
+
+    lf.write_stream([])
+    assert lf.read() == ""
+
+
+def test_local_file_hash(tmp_path) -> None:
+    import hashlib
+
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "hashed.bin"
+    content = b"abc" * 100_000
+    p.write_bytes(content)
+    lf = LocalFile(path=p)
+    assert lf.hash(chunk_size=4096) == hashlib.sha256(content).hexdigest()
+    assert lf.hash("md5") == hashlib.md5(content).hexdigest()
+    assert LocalFile(path=tmp_path / "missing.bin").hash() is None
+
+
+def test_local_file_hash_with_fingerprint_cache(tmp_path, monkeypatch) -> None:
+    import hashlib
+    import os
+
+    from wexample_file.common.fingerprint_cache import FingerprintCache
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.helper import hash as hash_helper
+
+    p = tmp_path / "cached.txt"
+    p.write_bytes(b"first")
+    lf = LocalFile(path=p)
+    cache = FingerprintCache()
+    assert lf.hash(cache=cache) == hashlib.sha256(b"first").hexdigest()
+
+    reads = []
+    original = hash_helper._hash_file_content
+    monkeypatch.setattr(
+        hash_helper,
+        "_hash_file_content",
+        lambda *args: reads.append(args) or original(*args),
+    )
+    lf.hash(cache=cache)
+    assert reads == []
+
+    p.write_bytes(b"second content")
+    os.utime(p, ns=(0, 1))
+    assert lf.hash(cache=cache) == hashlib.sha256(b"second content").hexdigest()
+    assert len(reads) == 1
+
+    cache.save(tmp_path / "fingerprints.json")
+    loaded = FingerprintCache.load(tmp_path / "fingerprints.json")
+    assert loaded.get(p, os.stat(p), "sha256") == lf.hash()
+
+
+def test_local_file_fingerprint_cache_saves_to_disk_as_plain_json(tmp_path) -> None:
+    import json
+    import os
+
+    from wexample_file.common.fingerprint_cache import FingerprintCache
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.common.memory_storage_backend import MemoryStorageBackend
+
+    p = tmp_path / "cached.txt"
+    p.write_bytes(b"content")
+    cache = FingerprintCache()
+    digest = LocalFile(path=p).hash(cache=cache)
+
+    with MemoryStorageBackend():
+        cache.save(tmp_path / "fingerprints.json.gz")
+    assert json.loads((tmp_path / "fingerprints.json.gz").read_text())
+    loaded = FingerprintCache.load(tmp_path / "fingerprints.json.gz")
+    assert loaded.get(p, os.stat(p), "sha256") == digest
+
+
+def test_local_file_write_only_if_changed(tmp_path) -> None:
+    import os
+
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "state.txt"
+    lf = LocalFile(path=p)
+    assert lf.write("same", only_if_changed=True) is True
+    os.utime(p, ns=(0, 0))
+
+    assert lf.write("same", only_if_changed=True) is False
+    assert os.stat(p).st_mtime_ns == 0
+
+    # Same size, different content
+    assert lf.write("sane", only_if_changed=True, atomic=True) is True
+    assert lf.read() == "sane"
+    assert lf.write_bytes(b"sane", only_if_changed=True) is False
+    assert lf.write("plain") is True
+
+
+def test_local_file_write_only_if_changed_uses_cached_digest(
+    tmp_path, monkeypatch
+) -> None:
+    from pathlib import Path
+
+    from wexample_file.common.fingerprint_cache import FingerprintCache
+    from wexample_file.common.local_file import LocalFile
+
+    cache = FingerprintCache()
+    lf = LocalFile(path=tmp_path / "cached_state.txt")
+    assert lf.write("content", only_if_changed=True, cache=cache) is True
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("file should not be read")
+
+    monkeypatch.setattr(Path, "open", fail_open)
+    assert lf.write("content", only_if_changed=True, cache=cache) is False
+
+    monkeypatch.undo()
+    assert lf.write("changed", only_if_changed=True, cache=cache) is True
+    assert lf.read() == "changed"
+
+
+def test_local_file_async_read_write_remove(tmp_path) -> None:
+    import asyncio
+
+    from wexample_file.common.local_file import LocalFile
+
+    async def scenario(lf: LocalFile) -> list:
+        assert await lf.awrite("one\ntwo\n", atomic=True) is True
+        assert await lf.awrite("one\ntwo\n", only_if_changed=True) is False
+        content = await lf.aread()
+        lines = [line async for line in lf.aiter_lines()]
+        await lf.awrite_bytes(b"0123456789")
+        chunks = [chunk async for chunk in lf.aiter_chunks(size=4)]
+        await lf.aremove()
+        return [content, lines, chunks, await lf.aread()]
+
+    lf = LocalFile(path=tmp_path / "async/file.txt")
+    assert asyncio.run(scenario(lf)) == [
+        "one\ntwo\n",
+        ["one", "two"],
+        [b"0123", b"4567", b"89"],
+        None,
+    ]
+
+
+def test_local_file_async_keeps_exceptions(tmp_path) -> None:
+    import asyncio
+
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.exception.not_a_file_exception import NotAFileException
+
+    p = tmp_path / "becomes_dir"
+    lf = LocalFile(path=p)
+    p.mkdir()
+    with pytest.raises(NotAFileException):
+        asyncio.run(lf.awrite("x"))
+
+
+def test_local_file_has_content(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    local_file = LocalFile(path=tmp_path / "a.txt")
+    assert local_file.has_content("hello") is False
+
+    local_file.write("hello")
+    assert local_file.has_content("hello") is True
+    assert local_file.has_content(b"hello") is True
+    assert local_file.has_content("hellO") is False
+    assert local_file.has_content("hello!") is False
+
+    compressed = LocalFile(path=tmp_path / "a.txt.gz")
+    compressed.write("hello")
+    assert compressed.has_content("hello") is True
+    assert compressed.has_content("hellO") is False
+    assert compressed.has_content("hello", compression=False) is False
+
+
+def test_local_file_item_type(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.enum.local_path_type import LocalPathType
+
+    assert LocalFile(path=tmp_path / "a.txt").item_type() is LocalPathType.FILE
+
+
+def test_local_file_iter_lines_reverse(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "lines.txt"
+    p.write_bytes(b"first\r\nsecond\n\nfourth\n")
+    lf = LocalFile(path=p)
+    assert list(lf.iter_lines_reverse(block_size=3)) == [
+        "fourth",
+        "",
+        "second",
+        "first",
+    ]
+    p.write_bytes(b"first\nlast")
+    assert list(lf.iter_lines_reverse(keep_ends=True, block_size=2)) == [
+        "last",
+        "first\n",
+    ]
+    assert list(LocalFile(path=tmp_path / "missing").iter_lines_reverse()) == []
+
+
+def test_local_file_tail(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "big.log"
+    p.write_text("".join(f"line {i}\n" for i in range(10_000)))
+    lf = LocalFile(path=p)
+    assert lf.tail(3) == ["line 9997", "line 9998", "line 9999"]
+    assert lf.tail(0) == []
+    assert LocalFile(path=tmp_path / "missing.log").tail() is None
+
+
+def test_local_file_follow_appended_lines(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "app.log"
+    p.write_text("before\n")
+    lines = LocalFile(path=p).follow(poll_interval=0.01, timeout=0.2)
+
+    with p.open("a") as fh:
+        fh.write("one\ntw")
+    assert next(lines) == "one"
+    with p.open("a") as fh:
+        fh.write("o\n")
+    assert next(lines) == "two"
+    assert list(lines) == []
+
+
+def test_local_file_follow_truncation_and_rotation(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "app.log"
+    p.write_text("old content\n")
+    lines = LocalFile(path=p).follow(poll_interval=0.01, timeout=0.2)
+
+    p.write_text("truncated\n")
+    assert next(lines) == "truncated"
+
+    p.rename(tmp_path / "app.log.1")
+    with (tmp_path / "app.log.1").open("a") as fh:
+        fh.write("end of rotated\n")
+    p.write_text("new file\n")
+    assert list(lines) == ["end of rotated", "new file"]
+
+
+def test_local_file_afollow(tmp_path) -> None:
+    import asyncio
+
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "app.log"
+    p.write_text("one\ntwo\n")
+
+    async def scenario() -> list[str]:
+        return [
+            line
+            async for line in LocalFile(path=p).afollow(
+                from_start=True, poll_interval=0.01, timeout=0.1
+            )
+        ]
+
+    assert asyncio.run(scenario()) == ["one", "two"]
+
+
+def test_local_file_compressed_round_trip(tmp_path) -> None:
+    import gzip
+
+    from wexample_file.common.local_file import LocalFile
+
+    p = tmp_path / "app.log.gz"
+    lf = LocalFile(path=p)
+    assert lf.get_codec() == "gzip"
+    assert lf.write("one\ntwo\nthree\n", level=1)
+
+    assert gzip.decompress(p.read_bytes()) == b"one\ntwo\nthree\n"
+    assert lf.read() == "one\ntwo\nthree\n"
+    assert list(lf.iter_lines()) == ["one", "two", "three"]
+    assert lf.count_lines() == 3
+    assert lf.tail(2) == ["two", "three"]
+    assert list(lf.iter_lines_reverse()) == ["three", "two", "one"]
+    assert b"".join(lf.iter_chunks(compression=True)) == b"one\ntwo\nthree\n"
+    assert b"".join(lf.iter_chunks()) == p.read_bytes()
+    # Compressed output is deterministic, so unchanged content is detected
+    assert not lf.write("one\ntwo\nthree\n", level=1, only_if_changed=True)
+
+
+def test_local_file_compressed_streams(tmp_path) -> None:
+    import bz2
+    import lzma
+
+    from wexample_file.common.local_file import LocalFile
+
+    xz = LocalFile(path=tmp_path / "data.xz")
+    xz.write_stream((f"row {i}\n" for i in range(1000)), atomic=True, compression=True)
+    assert lzma.decompress(xz.path.read_bytes()).count(b"\n") == 1000
+    assert xz.count_lines() == 1000
+
+    bz = LocalFile(path=tmp_path / "out" / "blob.bz2")
+    with bz.open("wb", compression=True, level=1) as fh:
+        fh.write(b"\x00\x01" * 100)
+    assert bz2.decompress(bz.path.read_bytes()) == b"\x00\x01" * 100
+    with bz.open("rb", compression=True) as fh:
+        assert fh.read(4) == b"\x00\x01\x00\x01"
+    with bz.open("rb") as fh:
+        assert fh.read() == bz.path.read_bytes()
+
+    raw = LocalFile(path=tmp_path / "raw.gz")
+    raw.write("not compressed", compression=False)
+    assert raw.path.read_bytes() == b"not compressed"
+    assert raw.read(compression=False) == "not compressed"
+
+
+def test_local_file_compression_defaults(tmp_path) -> None:
+    import gzip
+
+    from wexample_file.common.local_file import LocalFile
+
+    lf = LocalFile(path=tmp_path / "data.txt.gz")
+    compressed = gzip.compress(b"text\n")
+
+    # Byte methods work on the stored bytes
+    lf.write_stream([compressed])
+    assert lf.path.read_bytes() == compressed
+    assert b"".join(lf.iter_chunks()) == compressed
+    assert lf.has_content(compressed)
+    with lf.open("rb") as fh:
+        assert fh.read() == compressed
+    lf.write_bytes(compressed)
+    assert lf.path.read_bytes() == compressed
+
+    # Text methods see the content
+    assert lf.read() == "text\n"
+    lf.write("text\n")
+    assert lf.has_content("text\n")
+    with lf.open() as fh:
+        assert fh.read() == "text\n"
+
+
+def test_local_file_compressed_buffer_size(tmp_path) -> None:
+    import gzip
+
+    from wexample_file.common.local_file import LocalFile
+
+    lf = LocalFile(path=tmp_path / "app.log.gz")
+    lf.write_stream(
+        (f"row {i}\n" for i in range(100)), compression=True, buffer_size=16
+    )
+    assert gzip.decompress(lf.path.read_bytes()).count(b"\n") == 100
+    with lf.open(buffer_size=16) as fh:
+        assert fh.readline() == "row 0\n"
+
+    # The buffer only batches the calls, the compressed bytes are the same
+    other = LocalFile(path=tmp_path / "other.log.gz")
+    assert other.write("row 0\n" * 10, buffer_size=8)
+    with LocalFile(path=tmp_path / "stream.log.gz").open("w", buffer_size=8) as fh:
+        fh.write("row 0\n" * 10)
+    assert (tmp_path / "stream.log.gz").read_bytes() == other.path.read_bytes()
+
+
+def test_local_file_afollow_cancelled_during_a_poll(tmp_path, monkeypatch) -> None:
+    import asyncio
+    import threading
+
+    import pytest
+
+    from wexample_file.common.local_file import LocalFile
+
+    entered = threading.Event()
+    release = threading.Event()
+    closed = threading.Event()
+
+    def slow_reader(self, encoding, keep_ends, from_start):
+        try:
+            entered.set()
+            release.wait(5)
+            yield []
+        finally:
+            closed.set()
+
+    monkeypatch.setattr(LocalFile, "_follow_reader", slow_reader)
+    p = tmp_path / "app.log"
+    p.write_text("")
+
+    async def consume() -> None:
+        async for _ in LocalFile(path=p).afollow(poll_interval=0.01):
+            pass
+
+    async def scenario() -> None:
+        task = asyncio.create_task(consume())
+        await asyncio.get_running_loop().run_in_executor(None, entered.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+    release.set()
+    assert closed.wait(5)
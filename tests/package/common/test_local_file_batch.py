@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+
+def test_local_file_batch_write_and_read_many(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.common.local_file_batch import LocalFileBatch
+
+    batch = LocalFileBatch(workers=4)
+    contents = {
+        tmp_path / f"dir_{i % 3}/sub/file_{i}.txt": f"content {i}" for i in range(20)
+    }
+    contents[LocalFile(path=tmp_path / "bytes.bin")] = b"\x00\x01"
+
+    results = batch.write_many(contents)
+    assert [r.item for r in results] == list(contents)
+    assert all(r.ok and r.value is True for r in results)
+
+    results = batch.write_many(contents, only_if_changed=True)
+    assert all(r.ok and r.value is False for r in results)
+
+    results = batch.read_many([tmp_path / "dir_0/sub/file_0.txt", tmp_path / "nope"])
+    assert [r.value for r in results] == ["content 0", None]
+
+
+def test_local_file_batch_collects_errors_without_stopping(tmp_path) -> None:
+    from wexample_file.common.local_file_batch import LocalFileBatch
+    from wexample_file.exception.not_a_file_exception import NotAFileException
+
+    (tmp_path / "a_directory").mkdir()
+    (tmp_path / "a_file").write_text("x")
+
+    results = LocalFileBatch().write_many(
+        {
+            tmp_path / "ok.txt": "ok",
+            tmp_path / "a_directory": "fails, directory",
+            tmp_path / "a_file/child.txt": "fails, parent is a file",
+        }
+    )
+
+    assert results[0].ok and (tmp_path / "ok.txt").read_text() == "ok"
+    assert isinstance(results[1].error, NotAFileException)
+    assert isinstance(results[2].error, OSError)
+
+
+def test_local_file_batch_touch_and_remove_many(tmp_path) -> None:
+    from wexample_file.common.local_file_batch import LocalFileBatch
+
+    batch = LocalFileBatch(workers=2)
+    paths = [tmp_path / "a/b/one.txt", tmp_path / "a/b/two.txt", tmp_path / "c.txt"]
+    (tmp_path / "c.txt").write_text("existing")
+
+    assert [r.value for r in batch.touch_many(paths)] == [True, True, False]
+    assert all(p.exists() for p in paths)
+
+    assert all(r.ok for r in batch.remove_many(paths + [tmp_path / "missing"]))
+    assert not any(p.exists() for p in paths)
+
+
+def test_local_file_batch_creates_parents_on_item_backends(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.common.local_file_batch import LocalFileBatch
+    from wexample_file.common.memory_storage_backend import MemoryStorageBackend
+
+    backend = MemoryStorageBackend()
+    in_memory = LocalFile(path=tmp_path / "memory/sub/a.txt", backend=backend)
+    on_disk = tmp_path / "disk/sub/b.txt"
+
+    results = LocalFileBatch(workers=2).write_many({in_memory: "a", on_disk: "b"})
+
+    assert all(result.ok for result in results)
+    assert in_memory.read() == "a"
+    assert not (tmp_path / "memory").exists()
+    assert on_disk.read_text() == "b"
+
+    results = LocalFileBatch().touch_many(
+        [LocalFile(path=tmp_path / "memory/other/c.txt", backend=backend)]
+    )
+    assert results[0].ok and results[0].value is True
+    assert not (tmp_path / "memory").exists()
+
+
+def test_local_file_batch_stats_path_items_once(tmp_path, monkeypatch) -> None:
+    from wexample_file.common.local_file_batch import LocalFileBatch
+    from wexample_file.common.os_storage_backend import OsStorageBackend
+
+    paths = [tmp_path / f"file_{i}.txt" for i in range(3)]
+    for path in paths:
+        path.write_text("x")
+
+    stats = []
+    original = OsStorageBackend.stat
+    monkeypatch.setattr(
+        OsStorageBackend,
+        "stat",
+        lambda self, *args, **kwargs: stats.append(args)
+        or original(self, *args, **kwargs),
+    )
+    results = LocalFileBatch(workers=1).read_many(paths)
+
+    assert [result.value for result in results] == ["x", "x", "x"]
+    assert len(stats) == len(paths)
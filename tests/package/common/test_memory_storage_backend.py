@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+
+def test_memory_storage_backend_file_operations(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.common.memory_storage_backend import MemoryStorageBackend
+
+    backend = MemoryStorageBackend()
+    local_file = LocalFile(path=tmp_path / "a" / "b" / "file.txt", backend=backend)
+
+    assert local_file.write("one\ntwo\n")
+    assert local_file.read() == "one\ntwo\n"
+    assert local_file.count_lines() == 2
+    assert local_file.find(b"two") == 4
+    assert local_file.write("atomic", atomic=True, fsync=True)
+    assert local_file.read() == "atomic"
+    assert local_file.get_size() == 6
+    assert local_file.has_content("atomic")
+    # Nothing reached the disk
+    assert not (tmp_path / "a").exists()
+
+    local_file.remove()
+    assert not local_file.exists()
+    assert local_file.read() is None
+
+
+def test_memory_storage_backend_same_exceptions(tmp_path) -> None:
+    import pytest
+
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.common.memory_storage_backend import MemoryStorageBackend
+    from wexample_file.exception.file_not_found_exception import (
+        FileNotFoundException,
+    )
+    from wexample_file.exception.not_a_directory_exception import (
+        NotADirectoryException,
+    )
+    from wexample_file.exception.not_a_file_exception import NotAFileException
+
+    with MemoryStorageBackend():
+        LocalFile(path=tmp_path / "file.txt").touch()
+
+        with pytest.raises(FileNotFoundException):
+            LocalFile(path=tmp_path / "missing.txt", check_exists=True)
+        with pytest.raises(NotADirectoryException):
+            LocalDirectory(path=tmp_path / "file.txt")
+        with pytest.raises(NotAFileException):
+            LocalFile(path=tmp_path)
+        with pytest.raises(NotADirectoryError):
+            LocalFile(path=tmp_path / "file.txt" / "child").write(
+                "x", make_parents=False
+            )
+        with pytest.raises(FileNotFoundError):
+            LocalFile(path=tmp_path / "missing.txt").is_empty()
+
+
+def test_memory_storage_backend_directories(tmp_path) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.common.memory_storage_backend import MemoryStorageBackend
+
+    with MemoryStorageBackend():
+        root = LocalDirectory(path=tmp_path / "root")
+        root.create()
+        LocalFile(path=root.path / "a.txt").write("a")
+        LocalFile(path=root.path / "sub" / "b.py").write("b")
+        LocalFile(path=root.path / ".git" / "HEAD").write("ref")
+
+        walked = {
+            str(item.path.relative_to(root.path)) for item in root.walk(prune=[".git"])
+        }
+        copy = root.copy_to(tmp_path / "copy")
+
+        assert walked == {"a.txt", "sub", "sub/b.py"}
+        assert LocalFile(path=copy.path / "sub" / "b.py").read() == "b"
+
+        root.remove()
+        assert not root.exists()
+        assert copy.exists()
+
+    assert not (tmp_path / "root").exists()
+    assert not (tmp_path / "copy").exists()
+
+
+def test_memory_storage_backend_context_restores_os(tmp_path) -> None:
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.common.memory_storage_backend import MemoryStorageBackend
+    from wexample_file.helper.storage import STORAGE_OS_BACKEND
+
+    backend = MemoryStorageBackend()
+    with backend:
+        inside = LocalFile(path=tmp_path / "file.txt")
+    outside = LocalFile(path=tmp_path / "file.txt")
+
+    assert inside.backend is backend
+    assert outside.backend is STORAGE_OS_BACKEND
+    # Items keep their backend once the context is left
+    inside.write("memory")
+    assert not outside.exists()
+
+
+def test_memory_storage_backend_umask(tmp_path, monkeypatch) -> None:
+    import os
+    import stat
+
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.common.memory_storage_backend import MemoryStorageBackend
+
+    def umask(mask: int) -> int:
+        raise AssertionError("the process umask must not be changed")
+
+    monkeypatch.setattr(os, "umask", umask)
+
+    local_file = LocalFile(path=tmp_path / "a.txt", backend=MemoryStorageBackend())
+    local_file.write("a")
+    assert stat.S_IMODE(local_file.get_stat().st_mode) == 0o644
+
+    directory = LocalDirectory(
+        path=tmp_path / "private", backend=MemoryStorageBackend(umask=0o077)
+    )
+    directory.create()
+    assert stat.S_IMODE(directory.get_stat().st_mode) == 0o700
+
+
+def test_memory_storage_backend_disk_usage(tmp_path) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.common.memory_storage_backend import MemoryStorageBackend
+
+    def build(directory: LocalDirectory) -> None:
+        for name, content in (
+            ("a.txt", "hello"),
+            ("sub/b.txt", "hi"),
+            ("sub/deep/c.py", "pass\n"),
+        ):
+            LocalFile(path=directory.path / name, backend=directory.backend).write(
+                content
+            )
+
+    on_disk = LocalDirectory(path=tmp_path)
+    build(on_disk)
+    in_memory = LocalDirectory(path=tmp_path, backend=MemoryStorageBackend())
+    build(in_memory)
+
+    usage = in_memory.disk_usage()
+    assert usage == on_disk.disk_usage()
+    assert usage.file_count == 3
+    assert usage.directory_count == 2
+
+
+def test_memory_storage_backend_hash_tree(tmp_path) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.common.memory_storage_backend import MemoryStorageBackend
+
+    def build(directory: LocalDirectory) -> None:
+        for name, content in (("a.txt", "hello"), ("sub/b.txt", "hi")):
+            LocalFile(path=directory.path / name, backend=directory.backend).write(
+                content
+            )
+        LocalDirectory(
+            path=directory.path / "empty", backend=directory.backend
+        ).create()
+
+    on_disk = LocalDirectory(path=tmp_path / "disk")
+    build(on_disk)
+    in_memory = LocalDirectory(path=tmp_path / "memory", backend=MemoryStorageBackend())
+    build(in_memory)
+
+    assert in_memory.hash_tree() == on_disk.hash_tree()
+    LocalFile(path=in_memory.path / "sub/b.txt", backend=in_memory.backend).write(
+        "changed"
+    )
+    assert in_memory.hash_tree() != on_disk.hash_tree()
+
+
+def test_memory_storage_backend_watch_unsupported(tmp_path) -> None:
+    import pytest
+
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.memory_storage_backend import MemoryStorageBackend
+    from wexample_file.exception.unsupported_backend_exception import (
+        UnsupportedBackendException,
+    )
+
+    directory = LocalDirectory(path=tmp_path, backend=MemoryStorageBackend())
+    directory.create()
+
+    with pytest.raises(UnsupportedBackendException):
+        directory.watch()
+
+
+def test_memory_storage_backend_state_plan(tmp_path) -> None:
+    import stat
+
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.common.memory_storage_backend import MemoryStorageBackend
+    from wexample_file.common.state_manager import StateManager
+
+    spec = {
+        "items": [
+            {"path": "app/config.ini", "content": "debug = false\n", "mode": "0600"},
+            {"path": "app/tmp", "type": "directory"},
+        ]
+    }
+    with MemoryStorageBackend():
+        manager = StateManager.from_dict(spec, root=tmp_path)
+        plan = manager.apply()
+        config = LocalFile(path=tmp_path / "app" / "config.ini")
+
+        assert plan.errors == []
+        assert config.read() == "debug = false\n"
+        assert stat.S_IMODE(config.get_stat().st_mode) == 0o600
+        assert manager.plan().is_empty()
+
+    assert not (tmp_path / "app").exists()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+
+def _create_tree(root) -> None:
+    (root / "docs").mkdir()
+    (root / "docs" / "index.md").write_text("disk")
+    (root / "keep.txt").write_text("keep")
+
+
+def test_overlay_storage_backend_reads_disk_writes_memory(tmp_path) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.common.overlay_storage_backend import OverlayStorageBackend
+
+    _create_tree(tmp_path)
+    with OverlayStorageBackend(tmp_path):
+        index = LocalFile(path=tmp_path / "docs" / "index.md")
+        assert index.read() == "disk"
+
+        index.write("overlay")
+        LocalFile(path=tmp_path / "new" / "file.txt").write("new")
+        LocalFile(path=tmp_path / "keep.txt").remove()
+
+        assert index.read() == "overlay"
+        assert not LocalFile(path=tmp_path / "keep.txt").exists()
+        assert {
+            str(item.path.relative_to(tmp_path))
+            for item in LocalDirectory(path=tmp_path).walk()
+        } == {"docs", "docs/index.md", "new", "new/file.txt"}
+
+    assert (tmp_path / "docs" / "index.md").read_text() == "disk"
+    assert (tmp_path / "keep.txt").exists()
+    assert not (tmp_path / "new").exists()
+
+
+def test_overlay_storage_backend_changes(tmp_path) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.common.overlay_storage_backend import OverlayStorageBackend
+
+    _create_tree(tmp_path)
+    overlay = OverlayStorageBackend(tmp_path)
+    with overlay:
+        LocalFile(path=tmp_path / "docs" / "index.md").write("changed")
+        LocalFile(path=tmp_path / "added.txt").touch()
+        LocalFile(path=tmp_path / "keep.txt").remove()
+
+    changes = [
+        (change.type.value, str(change.item.path.relative_to(tmp_path)))
+        for change in overlay.changes()
+    ]
+    assert changes == [
+        ("created", "added.txt"),
+        ("modified", "docs/index.md"),
+        ("deleted", "keep.txt"),
+    ]
+
+    overlay.reset()
+    assert overlay.changes() == []
+    assert LocalDirectory(path=tmp_path, backend=overlay).exists()
+
+
+def test_overlay_storage_backend_recreated_directory_is_empty(tmp_path) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.overlay_storage_backend import OverlayStorageBackend
+
+    _create_tree(tmp_path)
+    with OverlayStorageBackend(tmp_path):
+        docs = LocalDirectory(path=tmp_path / "docs")
+        docs.remove()
+        assert not docs.exists()
+
+        docs.create()
+        assert docs.exists()
+        assert list(docs.walk()) == []
+
+    assert (tmp_path / "docs" / "index.md").exists()
+
+
+def test_overlay_storage_backend_outside_root_is_read_only(tmp_path) -> None:
+    import errno
+
+    import pytest
+
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.common.overlay_storage_backend import OverlayStorageBackend
+
+    (tmp_path / "root").mkdir()
+    (tmp_path / "outside.txt").write_text("outside")
+    with OverlayStorageBackend(tmp_path / "root"):
+        outside = LocalFile(path=tmp_path / "outside.txt")
+        assert outside.read() == "outside"
+
+        with pytest.raises(OSError) as info:
+            outside.write("changed")
+        assert info.value.errno == errno.EROFS
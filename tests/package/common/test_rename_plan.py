@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+
+def test_rename_plan_chains_and_cycles(tmp_path) -> None:
+    from wexample_file.common.rename_plan import RenamePlan
+
+    for name in ("1", "2", "3", "x.a", "x.b"):
+        (tmp_path / name).write_text(name)
+
+    plan = RenamePlan.from_renames(
+        [
+            # Chain: each file takes the name of the next one
+            (tmp_path / "1", tmp_path / "2"),
+            (tmp_path / "2", tmp_path / "3"),
+            (tmp_path / "3", tmp_path / "4"),
+            # Cycle: swap
+            (tmp_path / "x.a", tmp_path / "x.b"),
+            (tmp_path / "x.b", tmp_path / "x.a"),
+        ]
+    )
+    assert plan.conflicts == []
+
+    plan.apply(workers=2)
+
+    assert all(action.applied for action in plan)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["2", "3", "4", "x.a", "x.b"]
+    assert (tmp_path / "4").read_text() == "3"
+    assert (tmp_path / "2").read_text() == "1"
+    assert (tmp_path / "x.a").read_text() == "x.b"
+    assert (tmp_path / "x.b").read_text() == "x.a"
+
+
+def test_rename_plan_conflicts(tmp_path) -> None:
+    from wexample_file.common.rename_plan import RenamePlan
+
+    for name in ("a", "b", "c", "d", "kept"):
+        (tmp_path / name).write_text(name)
+
+    plan = RenamePlan.from_renames(
+        [
+            (tmp_path / "a", tmp_path / "same"),
+            (tmp_path / "b", tmp_path / "same"),
+            (tmp_path / "c", tmp_path / "kept"),
+            # Would replace "c", which stays in place
+            (tmp_path / "d", tmp_path / "c"),
+        ]
+    )
+    plan.apply()
+
+    assert len(plan.conflicts) == 4
+    assert {action.reason for action in plan.conflicts} == {
+        f"2 files renamed to {tmp_path / 'same'}",
+        "target already exists",
+        f"target is not renamed: {tmp_path / 'c'}",
+    }
+    assert sorted(p.read_text() for p in tmp_path.iterdir()) == [
+        "a",
+        "b",
+        "c",
+        "d",
+        "kept",
+    ]
+
+
+def test_rename_plan_resume_and_rollback(tmp_path, monkeypatch) -> None:
+    import pytest
+
+    from wexample_file.common.rename_plan import RenamePlan
+
+    root = tmp_path / "root"
+    root.mkdir()
+    for index in range(5):
+        (root / f"{index}.txt").write_text(str(index))
+    journal = tmp_path / "renames.journal"
+
+    plan = RenamePlan.from_renames(
+        (root / f"{index}.txt", root / f"{index}.md") for index in range(5)
+    )
+    backend = plan.backend
+    replace = backend.replace
+    calls = []
+
+    def interrupted_replace(source, target):
+        if len(calls) == 2:
+            raise KeyboardInterrupt
+        calls.append(source)
+        replace(source, target)
+
+    monkeypatch.setattr(backend, "replace", interrupted_replace)
+    with pytest.raises(KeyboardInterrupt):
+        plan.apply(workers=1, journal=journal)
+    monkeypatch.undo()
+
+    # A rename done but not journaled yet is found on disk
+    (root / "2.txt").rename(root / "2.md")
+    resumed = RenamePlan.load(journal)
+    assert [action.applied for action in resumed] == [True, True, True, False, False]
+
+    resumed.apply(journal=journal)
+    assert sorted(p.name for p in root.iterdir()) == [f"{i}.md" for i in range(5)]
+
+    rolled_back = RenamePlan.load(journal).rollback(journal=journal)
+    assert not any(action.applied for action in rolled_back)
+    assert sorted(p.name for p in root.iterdir()) == [f"{i}.txt" for i in range(5)]
+    assert (root / "3.txt").read_text() == "3"
+
+
+def test_rename_plan_memory_backend(tmp_path) -> None:
+    from wexample_file.common.local_directory import LocalDirectory
+    from wexample_file.common.local_file import LocalFile
+    from wexample_file.common.memory_storage_backend import MemoryStorageBackend
+    from wexample_file.common.rename_plan import RenamePlan
+
+    with MemoryStorageBackend():
+        LocalFile(tmp_path / "a.yml").write("a")
+        LocalFile(tmp_path / "b.yaml").write("b")
+        journal = tmp_path / "renames.journal"
+
+        plan = LocalDirectory(tmp_path).change_extensions(
+            {"yml": "yaml", "yaml": "yml"}, journal=journal
+        )
+
+        assert all(action.applied for action in plan)
+        assert LocalFile(tmp_path / "a.yaml").read() == "a"
+        assert LocalFile(tmp_path / "b.yml").read() == "b"
+        assert len(RenamePlan.load(journal)) == 2
+
+    assert not journal.exists()
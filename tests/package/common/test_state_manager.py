@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+
+def _spec() -> dict:
+    return {
+        "items": [
+            {"path": "app", "type": "directory"},
+            {"path": "app/config", "type": "directory", "mode": "0750"},
+            {"path": "app/config/settings.ini", "content": "debug = false\n"},
+            {"path": "app/README", "type": "file"},
+            {"path": "app/tmp", "type": "directory", "state": "absent"},
+        ]
+    }
+
+
+def test_state_manager_apply_creates_tree(tmp_path) -> None:
+    import stat
+
+    from wexample_file.common.state_manager import StateManager
+
+    plan = StateManager.from_dict(_spec(), root=tmp_path).apply()
+
+    assert plan.errors == []
+    assert plan.summary() == {"create_directory": 2, "create_file": 2}
+    assert (tmp_path / "app" / "config" / "settings.ini").read_text() == (
+        "debug = false\n"
+    )
+    assert (tmp_path / "app" / "README").is_file()
+    assert stat.S_IMODE((tmp_path / "app" / "config").stat().st_mode) == 0o750
+
+
+def test_state_manager_apply_is_idempotent(tmp_path) -> None:
+    from wexample_file.common.state_manager import StateManager
+
+    manager = StateManager.from_dict(_spec(), root=tmp_path)
+    manager.apply()
+
+    assert manager.plan().is_empty()
+
+
+def test_state_manager_apply_is_idempotent_on_compressed_files(tmp_path) -> None:
+    import gzip
+
+    from wexample_file.common.state_manager import StateManager
+
+    spec = {"items": [{"path": "logs/app.log.gz", "content": "started\n"}]}
+    manager = StateManager.from_dict(spec, root=tmp_path)
+
+    assert manager.apply().summary() == {"create_file": 1}
+    assert gzip.decompress((tmp_path / "logs/app.log.gz").read_bytes()) == (
+        b"started\n"
+    )
+    assert manager.plan().is_empty()
+
+    (tmp_path / "logs/app.log.gz").write_bytes(gzip.compress(b"changed\n"))
+    assert manager.apply().summary() == {"update_file": 1}
+    assert manager.plan().is_empty()
+
+
+def test_state_manager_dry_run(tmp_path) -> None:
+    from wexample_file.common.state_manager import StateManager
+
+    plan = StateManager.from_dict(_spec(), root=tmp_path).apply(dry_run=True)
+
+    assert len(plan) == 4
+    assert all(not action.applied for action in plan)
+    assert not (tmp_path / "app").exists()
+
+
+def test_state_manager_updates_and_removes(tmp_path) -> None:
+    from wexample_file.common.state_manager import StateManager
+
+    manager = StateManager.from_dict(_spec(), root=tmp_path, workers=1)
+    manager.apply()
+    (tmp_path / "app" / "config" / "settings.ini").write_text("debug = true\n")
+    (tmp_path / "app" / "tmp" / "cache").mkdir(parents=True)
+    (tmp_path / "app" / "tmp" / "cache" / "x").write_text("x")
+
+    plan = manager.apply()
+
+    assert plan.summary() == {"update_file": 1, "remove": 1}
+    assert (tmp_path / "app" / "config" / "settings.ini").read_text() == (
+        "debug = false\n"
+    )
+    assert not (tmp_path / "app" / "tmp").exists()
+
+
+def test_state_manager_reports_conflicts(tmp_path) -> None:
+    from wexample_file.common.state_manager import StateManager
+    from wexample_file.enum.state_action_type import StateActionType
+
+    (tmp_path / "app").write_text("not a directory")
+
+    plan = StateManager.from_dict(
+        {"items": [{"path": "app", "type": "directory"}]}, root=tmp_path
+    ).apply()
+
+    assert [action.type for action in plan] == [StateActionType.CONFLICT]
+    assert plan.conflicts[0].applied is False
+    assert (tmp_path / "app").is_file()
+
+
+def test_state_manager_rejects_invalid_spec(tmp_path) -> None:
+    import pytest
+
+    from wexample_file.common.state_manager import StateManager
+    from wexample_file.exception.invalid_state_spec_exception import (
+        InvalidStateSpecException,
+    )
+
+    invalid_items = [
+        {"type": "file"},
+        {"path": "a", "type": "link"},
+        {"path": "a", "state": "gone"},
+        {"path": "a", "type": "directory", "content": "x"},
+        {"path": "a", "mode": "rwx"},
+    ]
+    for entry in invalid_items:
+        with pytest.raises(InvalidStateSpecException):
+            StateManager.from_dict({"items": [entry]}, root=tmp_path)
+
+    with pytest.raises(InvalidStateSpecException):
+        StateManager.from_dict(
+            {"items": [{"path": "a"}, {"path": "./a"}]}, root=tmp_path
+        )
+
+
+def test_state_manager_rejects_paths_outside_root(tmp_path) -> None:
+    import pytest
+
+    from wexample_file.common.state_manager import StateManager
+    from wexample_file.exception.invalid_state_spec_exception import (
+        InvalidStateSpecException,
+    )
+
+    root = tmp_path / "root"
+    for path in ("/etc/passwd", "../outside", "a/../../outside", ".", str(tmp_path)):
+        with pytest.raises(InvalidStateSpecException):
+            StateManager.from_dict(
+                {"items": [{"path": path, "state": "absent"}]}, root=root
+            )
+
+    manager = StateManager.from_dict(
+        {"items": [{"path": str(root / "a")}, {"path": "b/../c"}]}, root=root
+    )
+    assert [item.path for item in manager.items] == [root / "a", root / "c"]
+
+
+def test_state_manager_rejects_present_item_in_absent_one(tmp_path) -> None:
+    import pytest
+
+    from wexample_file.common.state_manager import StateManager
+    from wexample_file.exception.invalid_state_spec_exception import (
+        InvalidStateSpecException,
+    )
+
+    with pytest.raises(InvalidStateSpecException):
+        StateManager.from_dict(
+            {
+                "items": [
+                    {"path": "app/tmp", "type": "directory", "state": "absent"},
+                    {"path": "app/tmp/cache/x", "content": "x"},
+                ]
+            },
+            root=tmp_path,
+        )
+
+    # Absent items inside absent ones are fine
+    StateManager.from_dict(
+        {
+            "items": [
+                {"path": "app", "type": "directory", "state": "absent"},
+                {"path": "app/tmp", "state": "absent"},
+            ]
+        },
+        root=tmp_path,
+    )
+
+
+def test_state_manager_from_yaml(tmp_path) -> None:
+    import pytest
+
+    pytest.importorskip("yaml")
+    from wexample_file.common.state_manager import StateManager
+
+    spec = tmp_path / "state.yml"
+    spec.write_text(
+        "root: out\n"
+        "items:\n"
+        "  - path: docs\n"
+        "    type: directory\n"
+        "  - path: docs/index.md\n"
+        "    content: |\n"
+        "      # Title\n"
+    )
+
+    plan = StateManager.from_yaml(spec).apply()
+
+    assert plan.errors == []
+    assert (tmp_path / "out" / "docs" / "index.md").read_text() == "# Title\n"
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+
+def test_aio_set_max_workers_bounds_executor() -> None:
+    import asyncio
+    import threading
+
+    from wexample_file.helper import aio
+
+    aio.aio_set_max_workers(2)
+    try:
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def work() -> None:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            threading.Event().wait(0.02)
+            with lock:
+                running -= 1
+
+        async def scenario() -> None:
+            await asyncio.gather(*(aio.aio_run(work) for _ in range(6)))
+
+        asyncio.run(scenario())
+        assert peak <= 2
+    finally:
+        aio.aio_set_max_workers(8)
+
+
+def test_aio_iterate_closes_iterator_when_stopped_early() -> None:
+    import asyncio
+
+    from wexample_file.helper.aio import aio_iterate
+
+    closed = []
+
+    def numbers():
+        try:
+            yield from range(100)
+        finally:
+            closed.append(True)
+
+    async def scenario() -> list[int]:
+        result = []
+        async for number in aio_iterate(numbers(), batch_size=10):
+            if number == 3:
+                break
+            result.append(number)
+        return result
+
+    assert asyncio.run(scenario()) == [0, 1, 2]
+    assert closed == [True]
+
+
+def test_aio_iterate_cancelled_during_a_batch() -> None:
+    import asyncio
+    import threading
+
+    import pytest
+
+    from wexample_file.helper.aio import aio_iterate
+
+    entered = threading.Event()
+    release = threading.Event()
+    closed = threading.Event()
+
+    def slow():
+        try:
+            yield 1
+            entered.set()
+            release.wait(5)
+            yield 2
+        finally:
+            closed.set()
+
+    async def consume() -> None:
+        async for _ in aio_iterate(slow()):
+            pass
+
+    async def scenario() -> None:
+        task = asyncio.create_task(consume())
+        await asyncio.get_running_loop().run_in_executor(None, entered.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+    assert not closed.is_set()
+    # Closed by the worker once the running batch returns
+    release.set()
+    assert closed.wait(5)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pytest
+
+
+def _codecs() -> list[str]:
+    from wexample_file.helper.codec import codec_zstd_module
+
+    codecs = ["bz2", "gzip", "xz"]
+    try:
+        codec_zstd_module()
+        codecs.append("zstd")
+    except ImportError:
+        pass
+    return codecs
+
+
+@pytest.mark.parametrize("codec", _codecs())
+def test_codec_round_trip_leaves_raw_open(codec) -> None:
+    import io
+
+    from wexample_file.helper.codec import codec_reader, codec_writer
+
+    data = b"line\n" * 10_000
+    raw = io.BytesIO()
+    with codec_writer(raw, codec, level=1) as stream:
+        for offset in range(0, len(data), 7):
+            stream.write(data[offset : offset + 7])
+
+    assert not raw.closed
+    assert len(raw.getvalue()) < len(data)
+
+    raw.seek(0)
+    with codec_reader(raw, codec) as stream:
+        assert stream.read() == data
+    assert not raw.closed
+
+
+@pytest.mark.parametrize("codec", _codecs())
+def test_codec_compress_is_deterministic(codec) -> None:
+    from wexample_file.helper.codec import codec_compress
+
+    assert codec_compress(b"same", codec) == codec_compress(b"same", codec)
+    assert codec_compress(b"same", codec, level=1) != b"same"
+
+
+def test_codec_from_path() -> None:
+    from pathlib import Path
+
+    from wexample_file.helper.codec import codec_from_path
+
+    assert codec_from_path(Path("logs/app.log.gz")) == "gzip"
+    assert codec_from_path(Path("dump.SQL.XZ")) == "xz"
+    assert codec_from_path(Path("data.zst")) == "zstd"
+    assert codec_from_path(Path("archive.tar.bz2")) == "bz2"
+    assert codec_from_path(Path("notes.txt")) is None
+
+
+def test_codec_unknown() -> None:
+    import io
+
+    from wexample_file.helper.codec import codec_reader, codec_writer
+
+    with pytest.raises(ValueError):
+        codec_reader(io.BytesIO(), "rar")
+    with pytest.raises(ValueError):
+        codec_writer(io.BytesIO(), "rar")
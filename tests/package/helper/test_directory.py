@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+
+def test_directory_compile_patterns_name_and_path() -> None:
+    from wexample_file.helper.directory import directory_compile_patterns
+
+    matches = directory_compile_patterns(["*.py", "docs/*"])
+    assert matches("a.py", "src/a.py")
+    assert matches("index.md", "docs/index.md")
+    assert not matches("index.md", "src/index.md")
+    assert directory_compile_patterns([]) is None
+
+
+def test_directory_walk_yields_dir_entries(tmp_path) -> None:
+    from wexample_file.helper.directory import directory_walk
+
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub/file.txt").write_text("x")
+    (tmp_path / "top.txt").write_text("x")
+
+    entries = sorted(e.name for e in directory_walk(tmp_path))
+    assert entries == ["file.txt", "sub", "top.txt"]
+    assert [e.name for e in directory_walk(str(tmp_path), max_depth=1)].count(
+        "file.txt"
+    ) == 0
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+
+def test_file_copy_copies_content_and_mode(tmp_path) -> None:
+    import os
+
+    from wexample_file.helper.file import file_copy
+
+    source = tmp_path / "source.bin"
+    source.write_bytes(os.urandom(3 * 1024 * 1024 + 17))
+    os.chmod(source, 0o600)
+    destination = tmp_path / "destination.bin"
+    destination.write_bytes(b"previous content, longer than nothing")
+
+    file_copy(source, destination)
+
+    assert destination.read_bytes() == source.read_bytes()
+    assert os.stat(destination).st_mode & 0o777 == 0o600
+
+
+def test_file_copy_empty_file(tmp_path) -> None:
+    from wexample_file.helper.file import file_copy
+
+    source = tmp_path / "empty"
+    source.write_bytes(b"")
+    file_copy(source, tmp_path / "copy", copy_stat=False)
+    assert (tmp_path / "copy").read_bytes() == b""
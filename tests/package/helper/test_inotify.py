@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+
+def test_inotify_parse_events() -> None:
+    from wexample_file.helper.inotify import (
+        INOTIFY_CREATE,
+        INOTIFY_EVENT_HEADER,
+        INOTIFY_ISDIR,
+        inotify_parse_events,
+    )
+
+    data = (
+        INOTIFY_EVENT_HEADER.pack(1, INOTIFY_CREATE, 0, 16)
+        + b"file.txt".ljust(16, b"\0")
+        + INOTIFY_EVENT_HEADER.pack(2, INOTIFY_CREATE | INOTIFY_ISDIR, 7, 0)
+    )
+
+    assert inotify_parse_events(data) == [
+        (1, INOTIFY_CREATE, 0, "file.txt"),
+        (2, INOTIFY_CREATE | INOTIFY_ISDIR, 7, ""),
+    ]
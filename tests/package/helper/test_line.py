@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import pytest
+
+
+def _create_tree(root) -> None:
+    (root / "sub/deeper").mkdir(parents=True)
+    (root / "a.py").write_bytes(b"one\ntwo\nthree\n")
+    (root / "b.txt").write_bytes(b"no trailing newline\nlast")
+    (root / "sub/c.py").write_bytes(b"dos\r\nline\r\nendings")
+    (root / "sub/d.txt").write_bytes(b"old\rmac\r")
+    (root / "sub/deeper/e.bin").write_bytes(b"\xff\xfe\n\x00\xe2\n")
+    (root / "sub/deeper/empty").write_bytes(b"")
+
+
+def _legacy_count(root, pattern: str = "*") -> int:
+    total = 0
+    for f in root.rglob(pattern):
+        try:
+            with f.open(encoding="utf-8", errors="ignore") as fh:
+                total += sum(1 for _ in fh)
+        except Exception:
+            continue
+    return total
+
+
+def test_line_count_chunks_handles_crlf_split_across_chunks() -> None:
+    from wexample_file.helper.line import line_count_chunks
+
+    assert line_count_chunks([b"a\r", b"\nb\r", b"\n"]) == 2
+    assert line_count_chunks([b"a\r", b"b"]) == 2
+    assert line_count_chunks([]) == 0
+
+
+def test_line_count_chunks_ignores_invalid_utf8_like_text_mode(tmp_path) -> None:
+    import os
+
+    from wexample_file.helper.line import line_count_chunks, line_count_file
+
+    samples = [
+        b"\xff",
+        b"a\r\xff\nb",
+        b"caf\xc3\xa9\r\n\xe2\x82",
+        b"\x00\x01\r\r\n\xc3",
+        os.urandom(4096),
+    ]
+    for index, data in enumerate(samples):
+        f = tmp_path / f"sample_{index}.bin"
+        f.write_bytes(data)
+        with f.open(encoding="utf-8", errors="ignore") as fh:
+            expected = sum(1 for _ in fh)
+        for size in (1, 2, 3, len(data)):
+            chunks = [data[i : i + size] for i in range(0, len(data), size)]
+            assert line_count_chunks(chunks) == expected
+        assert line_count_file(f, chunk_size=3) == expected
+
+    assert line_count_chunks([b"\xff"]) == 0
+    assert line_count_chunks([b"a\r\xff", b"\nb"]) == 2
+
+
+def test_line_count_file_small_chunks_match_text_mode(tmp_path) -> None:
+    from wexample_file.helper.line import line_count_file
+
+    _create_tree(tmp_path)
+    for f in tmp_path.rglob("*"):
+        if f.is_file():
+            with f.open(encoding="utf-8", errors="ignore") as fh:
+                expected = sum(1 for _ in fh)
+            assert line_count_file(f, chunk_size=1) == expected
+
+
+@pytest.mark.parametrize("workers", [1, 2, None])
+def test_line_count_recursive_matches_text_mode_count(tmp_path, workers) -> None:
+    from wexample_file.helper.line import line_count_recursive
+
+    _create_tree(tmp_path)
+    assert line_count_recursive(tmp_path, workers=workers) == _legacy_count(tmp_path)
+    assert line_count_recursive(
+        tmp_path, pattern="*.py", workers=workers
+    ) == _legacy_count(tmp_path, "*.py")
+
+
+def test_line_count_recursive_with_processes(tmp_path) -> None:
+    from wexample_file.helper.line import line_count_recursive
+
+    _create_tree(tmp_path)
+    assert line_count_recursive(
+        tmp_path, workers=2, use_processes=True
+    ) == _legacy_count(tmp_path)
+
+
+def test_line_count_report_breakdowns(tmp_path) -> None:
+    from wexample_file.helper.line import line_count_report
+
+    _create_tree(tmp_path)
+    report = line_count_report(tmp_path, workers=2)
+
+    assert report.total == _legacy_count(tmp_path)
+    assert report.files[tmp_path / "a.py"] == 3
+    assert report.files[tmp_path / "sub/deeper/empty"] == 0
+    # Directories cannot be read and are skipped
+    assert tmp_path / "sub" not in report.files
+    assert report.extensions == {"py": 6, "txt": 4, "bin": 2, "": 0}
+
+
+def test_line_count_recursive_incremental_cache(tmp_path, monkeypatch) -> None:
+    import os
+
+    from wexample_file.common.line_count_cache import LineCountCache
+    from wexample_file.helper import line
+    from wexample_file.helper.line import line_count_recursive
+
+    _create_tree(tmp_path)
+    expected = line_count_recursive(tmp_path, workers=1)
+    cache = LineCountCache()
+
+    assert line_count_recursive(tmp_path, workers=1, cache=cache) == expected
+    assert len(cache) == 6
+
+    index = tmp_path.parent / f"{tmp_path.name}_index.json"
+    cache.save(index)
+    cache = LineCountCache.load(index)
+
+    read = []
+    original = line.line_count_file
+    monkeypatch.setattr(
+        line,
+        "line_count_file",
+        lambda path, *args: read.append(path.name) or original(path, *args),
+    )
+
+    assert line_count_recursive(tmp_path, workers=1, cache=cache) == expected
+    assert read == []
+
+    (tmp_path / "a.py").write_bytes(b"one\ntwo\nthree\nfour\n")
+    os.utime(tmp_path / "a.py", ns=(1, 1))
+    (tmp_path / "new.py").write_bytes(b"x\n")
+    (tmp_path / "b.txt").unlink()
+
+    assert line_count_recursive(tmp_path, workers=1, cache=cache) == expected
+    assert sorted(read) == ["a.py", "new.py"]
+    assert len(cache) == 6
+    assert str(tmp_path / "b.txt") not in cache._entries
+
+
+def test_line_count_report_cache_keeps_other_patterns(tmp_path) -> None:
+    from wexample_file.common.line_count_cache import LineCountCache
+    from wexample_file.helper.line import line_count_report
+
+    _create_tree(tmp_path)
+    cache = LineCountCache()
+
+    line_count_report(tmp_path, pattern="*.py", workers=1, cache=cache)
+    report = line_count_report(tmp_path, pattern="*.txt", workers=1, cache=cache)
+
+    assert report.extensions == {"txt": 4}
+    assert len(cache) == 4
+
+
+def test_line_stats_bytes_classifies_lines() -> None:
+    from wexample_file.classes.line_stats import LineStats
+    from wexample_file.helper.line import line_stats_bytes
+
+    c_source = (
+        b"int a; // trailing comment\r\n"
+        b"\r\n"
+        b"  // comment only\r\n"
+        b"/* block\n"
+        b"\n"
+        b"   still comment */ int b;\n"
+        b"/* one */ /* two */\n"
+        b"  \t\n"
+        b"// not a /* block start\n"
+        b"end"
+    )
+    assert line_stats_bytes(c_source, (b"//",), ((b"/*", b"*/"),)) == LineStats(
+        blank=2, code=3, comment=5
+    )
+    assert line_stats_bytes(b"# a\nx = 1  # b\n\n", (b"#",)) == LineStats(
+        blank=1, code=1, comment=1
+    )
+    assert line_stats_bytes(b"x\n/* open\n\n", (), ((b"/*", b"*/"),)) == LineStats(
+        blank=0, code=1, comment=2
+    )
+    assert line_stats_bytes(b"") == LineStats()
+
+
+@pytest.mark.parametrize("workers, use_processes", [(1, False), (2, True)])
+def test_line_stats_aggregates_by_language(tmp_path, workers, use_processes) -> None:
+    from wexample_file.classes.line_stats import LineStats
+    from wexample_file.helper.line import line_stats
+
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg/a.py").write_bytes(b"# header\nimport os\n\nprint(os.sep)\n")
+    (tmp_path / "pkg/b.PY").write_bytes(b"x = 1\n")
+    (tmp_path / "main.c").write_bytes(b"/* c */\nint main() {}\n")
+    (tmp_path / "notes.unknown").write_bytes(b"skipped\n")
+    (tmp_path / "binary.py").write_bytes(b"\x00\x01\n")
+
+    report = line_stats(tmp_path, workers=workers, use_processes=use_processes)
+
+    assert report.languages == {
+        "Python": LineStats(blank=1, code=3, comment=1),
+        "C": LineStats(blank=0, code=1, comment=1),
+    }
+    assert report.total == LineStats(blank=1, code=4, comment=2)
+    assert report.total.total == 7
+    assert set(report.files) == {
+        tmp_path / "pkg/a.py",
+        tmp_path / "pkg/b.PY",
+        tmp_path / "main.c",
+    }
+
+
+def test_line_count_recursive_counts_inside_compressed_files(tmp_path) -> None:
+    import bz2
+    import gzip
+    import lzma
+
+    from wexample_file.helper.line import line_count_file, line_count_recursive
+
+    content = b"one\ntwo\r\nthree"
+    (tmp_path / "plain.log").write_bytes(content)
+    (tmp_path / "a.log.gz").write_bytes(gzip.compress(content))
+    (tmp_path / "b.log.bz2").write_bytes(bz2.compress(content))
+    (tmp_path / "c.log.xz").write_bytes(lzma.compress(content))
+    # Not actually compressed: unreadable, so skipped
+    (tmp_path / "broken.gz").write_bytes(content)
+
+    assert line_count_file(tmp_path / "a.log.gz", chunk_size=2) == 3
+    assert line_count_file(tmp_path / "c.log.xz", buffer_size=4) == 3
+    assert line_count_recursive(tmp_path, workers=1) == 12
+    assert line_count_recursive(tmp_path, pattern="*.gz", compression=False) > 0
+
+
+def test_line_count_cache_keeps_compression_modes_apart(tmp_path) -> None:
+    import gzip
+
+    from wexample_file.common.line_count_cache import LineCountCache
+    from wexample_file.helper.line import line_count_recursive
+
+    (tmp_path / "app.log.gz").write_bytes(gzip.compress(b"line\n" * 250))
+    (tmp_path / "plain.txt").write_bytes(b"one\ntwo\n")
+    cache = LineCountCache()
+
+    raw = line_count_recursive(tmp_path, workers=1, cache=cache, compression=False)
+    assert line_count_recursive(tmp_path, workers=1, cache=cache) == 252
+    assert (
+        line_count_recursive(tmp_path, workers=1, cache=cache, compression=False) == raw
+    )
+
+    # The mode of each count survives a save
+    index = tmp_path.parent / f"{tmp_path.name}_index.json"
+    cache.save(index)
+    cache = LineCountCache.load(index)
+    assert line_count_recursive(tmp_path, workers=1, cache=cache) == 252
+    assert (
+        line_count_recursive(tmp_path, workers=1, cache=cache, compression=False) == raw
+    )
+
+
+def test_line_count_cache_saves_to_disk_as_plain_json(tmp_path) -> None:
+    import json
+
+    from wexample_file.common.line_count_cache import LineCountCache
+    from wexample_file.common.memory_storage_backend import MemoryStorageBackend
+    from wexample_file.helper.line import line_count_recursive
+
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    (tree / "a.txt").write_bytes(b"one\ntwo\n")
+    cache = LineCountCache()
+    line_count_recursive(tree, workers=1, cache=cache)
+
+    with MemoryStorageBackend():
+        cache.save(tmp_path / "counts.json.gz")
+    assert json.loads((tmp_path / "counts.json.gz").read_text())
+    assert len(LineCountCache.load(tmp_path / "counts.json.gz")) == len(cache)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+
+def _run_python(code: str) -> str:
+    import subprocess
+    import sys
+
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def test_init_import_is_lazy() -> None:
+    output = _run_python(
+        "import sys, wexample_file; "
+        "print(sorted(m for m in sys.modules "
+        "if m.startswith(('wexample_helpers', 'attr', 'wexample_file.'))))"
+    )
+
+    assert output == "[]"
+
+
+def test_init_exports_public_api() -> None:
+    import wexample_file
+    from wexample_file import LocalFile, LocalPathType, NotAFileException
+    from wexample_file.common.local_file import LocalFile as ModuleLocalFile
+    from wexample_file.enum.local_path_type import LocalPathType as ModuleLocalPathType
+
+    assert LocalFile is ModuleLocalFile
+    assert LocalPathType is ModuleLocalPathType
+    assert NotAFileException.__name__ == "NotAFileException"
+    assert "LocalDirectory" in dir(wexample_file)
+    for name in wexample_file.__all__:
+        assert getattr(wexample_file, name).__name__ == name
+
+
+def test_init_unknown_attribute() -> None:
+    import pytest
+
+    import wexample_file
+
+    with pytest.raises(AttributeError):
+        wexample_file.Missing